@@ -83,6 +83,70 @@ API_SCHEMA = {
                 }
             }
         },
+        "/health/live": {
+            "get": {
+                "tags": ["utility"],
+                "summary": "Liveness Probe",
+                "description": "Returns 200 while the process is serving requests",
+                "responses": {
+                    "200": {
+                        "description": "Process is alive",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "status": {"type": "string", "example": "alive"}
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        },
+        "/health/ready": {
+            "get": {
+                "tags": ["utility"],
+                "summary": "Readiness Probe",
+                "description": "Returns 200 when the latest background probe found the torrent site reachable, 503 otherwise. A TMDB outage is listed under degraded and does not make the instance unready",
+                "responses": {
+                    "200": {
+                        "description": "Ready to serve traffic",
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": "#/components/schemas/ReadinessResponse"}
+                            }
+                        }
+                    },
+                    "503": {
+                        "description": "Torrent site not reachable or not probed yet",
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": "#/components/schemas/ReadinessResponse"}
+                            }
+                        }
+                    }
+                }
+            }
+        },
+        "/metrics": {
+            "get": {
+                "tags": ["utility"],
+                "summary": "Prometheus Metrics",
+                "description": "Request latency per route, upstream latency per TMDB endpoint template and torrent category, parse time, cache lookups and in-flight gauges in the Prometheus text format",
+                "responses": {
+                    "200": {
+                        "description": "Metrics in the Prometheus text exposition format",
+                        "content": {
+                            "text/plain": {
+                                "schema": {"type": "string"}
+                            }
+                        }
+                    }
+                }
+            }
+        },
         "/schema": {
             "get": {
                 "tags": ["utility"],
@@ -222,6 +286,75 @@ API_SCHEMA = {
                 }
             }
         },
+        "/batch/search": {
+            "post": {
+                "tags": ["search"],
+                "summary": "Batch Search",
+                "description": "Resolve many typed searches concurrently in one request. Identical searches are deduplicated and TMDB responses are cache-backed.",
+                "requestBody": {
+                    "required": True,
+                    "content": {
+                        "application/json": {
+                            "schema": {"$ref": "#/components/schemas/BatchSearchRequest"}
+                        }
+                    }
+                },
+                "responses": {
+                    "200": {
+                        "description": "One result entry per requested search, in request order",
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": "#/components/schemas/BatchSearchResponse"}
+                            }
+                        }
+                    },
+                    "400": {
+                        "description": "Missing, invalid or too many queries",
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": "#/components/schemas/ErrorResponse"}
+                            }
+                        }
+                    },
+                    "503": {
+                        "description": "TMDB service not available",
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": "#/components/schemas/ErrorResponse"}
+                            }
+                        }
+                    }
+                }
+            }
+        },
+        "/home": {
+            "get": {
+                "tags": ["search"],
+                "summary": "Home Feed",
+                "description": "Hero carousel and home screen rails, served from a snapshot rebuilt in the background. Only a request that finds no snapshot yet calls TMDB (to build it); supports If-None-Match.",
+                "responses": {
+                    "200": {
+                        "description": "Latest home feed snapshot",
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": "#/components/schemas/HomeFeedResponse"}
+                            }
+                        }
+                    },
+                    "304": {
+                        "description": "Snapshot unchanged since the ETag sent in If-None-Match"
+                    },
+                    "503": {
+                        "description": "TMDB service not available or the first snapshot could not be built",
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": "#/components/schemas/ErrorResponse"}
+                            }
+                        }
+                    }
+                }
+            }
+        },
         "/details/movie/{tmdb_id}": {
             "get": {
                 "tags": ["details"],
@@ -237,7 +370,10 @@ API_SCHEMA = {
                             "type": "integer",
                             "example": 550
                         }
-                    }
+                    },
+                    {"$ref": "#/components/parameters/TorrentCache"},
+                    {"$ref": "#/components/parameters/TorrentLimit"},
+                    {"$ref": "#/components/parameters/StreamFormat"}
                 ],
                 "responses": {
                     "200": {
@@ -282,7 +418,10 @@ API_SCHEMA = {
                             "type": "integer",
                             "example": 1396
                         }
-                    }
+                    },
+                    {"$ref": "#/components/parameters/TorrentCache"},
+                    {"$ref": "#/components/parameters/TorrentLimit"},
+                    {"$ref": "#/components/parameters/StreamFormat"}
                 ],
                 "responses": {
                     "200": {
@@ -329,7 +468,10 @@ API_SCHEMA = {
                             "type": "integer",
                             "example": 1
                         }
-                    }
+                    },
+                    {"$ref": "#/components/parameters/TorrentCache"},
+                    {"$ref": "#/components/parameters/TorrentLimit"},
+                    {"$ref": "#/components/parameters/StreamFormat"}
                 ],
                 "responses": {
                     "200": {
@@ -386,7 +528,10 @@ API_SCHEMA = {
                             "type": "integer",
                             "example": 1
                         }
-                    }
+                    },
+                    {"$ref": "#/components/parameters/TorrentCache"},
+                    {"$ref": "#/components/parameters/TorrentLimit"},
+                    {"$ref": "#/components/parameters/StreamFormat"}
                 ],
                 "responses": {
                     "200": {
@@ -410,6 +555,39 @@ API_SCHEMA = {
         }
     },
     "components": {
+        "parameters": {
+            "TorrentCache": {
+                "name": "cache",
+                "in": "query",
+                "required": False,
+                "description": "Set to false to bypass cached torrent results and re-scrape the torrent site",
+                "schema": {
+                    "type": "boolean",
+                    "default": True
+                }
+            },
+            "TorrentLimit": {
+                "name": "limit",
+                "in": "query",
+                "required": False,
+                "description": "Return only the top N torrents by score (all of them when omitted)",
+                "schema": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "example": 10
+                }
+            },
+            "StreamFormat": {
+                "name": "stream",
+                "in": "query",
+                "required": False,
+                "description": "Stream the response as application/x-ndjson lines or text/event-stream messages: a 'details' event as soon as TMDB answers, a 'torrents' event per finished category search, then a 'summary' event with the merged ranking (an 'error' event if it fails part-way)",
+                "schema": {
+                    "type": "string",
+                    "enum": ["ndjson", "sse"]
+                }
+            }
+        },
         "schemas": {
             "ErrorResponse": {
                 "type": "object",
@@ -425,6 +603,48 @@ API_SCHEMA = {
                 },
                 "required": ["status", "message"]
             },
+            "ProbeResult": {
+                "type": "object",
+                "properties": {
+                    "status": {
+                        "type": "string",
+                        "enum": ["up", "down", "disabled"],
+                        "example": "up"
+                    },
+                    "latency_ms": {
+                        "type": "number",
+                        "nullable": True,
+                        "example": 84.2
+                    },
+                    "checked_at": {
+                        "type": "number",
+                        "description": "Unix timestamp of the probe"
+                    },
+                    "age_seconds": {
+                        "type": "number",
+                        "example": 12.4
+                    }
+                }
+            },
+            "ReadinessResponse": {
+                "type": "object",
+                "properties": {
+                    "status": {
+                        "type": "string",
+                        "enum": ["ready", "not_ready"]
+                    },
+                    "degraded": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Upstreams that are down without making the instance unready",
+                        "example": ["tmdb"]
+                    },
+                    "probes": {
+                        "type": "object",
+                        "additionalProperties": {"$ref": "#/components/schemas/ProbeResult"}
+                    }
+                }
+            },
             "HealthResponse": {
                 "type": "object",
                 "properties": {
@@ -521,6 +741,120 @@ API_SCHEMA = {
                 },
                 "required": ["status", "query", "count", "results"]
             },
+            "BatchSearchRequest": {
+                "type": "object",
+                "properties": {
+                    "queries": {
+                        "type": "array",
+                        "maxItems": 50,
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "type": {
+                                    "type": "string",
+                                    "enum": ["movie", "tv", "multi"],
+                                    "default": "multi"
+                                },
+                                "query": {
+                                    "type": "string",
+                                    "example": "inception"
+                                }
+                            },
+                            "required": ["query"]
+                        }
+                    }
+                },
+                "required": ["queries"]
+            },
+            "BatchSearchResponse": {
+                "type": "object",
+                "properties": {
+                    "status": {
+                        "type": "string",
+                        "example": "success"
+                    },
+                    "count": {
+                        "type": "integer",
+                        "example": 2
+                    },
+                    "results": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "status": {
+                                    "type": "string",
+                                    "enum": ["success", "error"]
+                                },
+                                "type": {
+                                    "type": "string",
+                                    "example": "movie"
+                                },
+                                "query": {
+                                    "type": "string",
+                                    "example": "inception"
+                                },
+                                "count": {
+                                    "type": "integer",
+                                    "example": 5
+                                },
+                                "results": {
+                                    "type": "array",
+                                    "items": {"$ref": "#/components/schemas/SearchResult"}
+                                },
+                                "retry_after": {
+                                    "type": "integer",
+                                    "description": "Seconds to wait before retrying a rate-limited entry"
+                                }
+                            }
+                        }
+                    }
+                },
+                "required": ["status", "count", "results"]
+            },
+            "HomeFeedResponse": {
+                "type": "object",
+                "properties": {
+                    "status": {
+                        "type": "string",
+                        "example": "success"
+                    },
+                    "generated_at": {
+                        "type": "string",
+                        "format": "date-time",
+                        "description": "When the snapshot content last changed (unchanged rebuilds keep it, and the ETag)"
+                    },
+                    "featured": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/SearchResult"}
+                    },
+                    "sections": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "key": {
+                                    "type": "string",
+                                    "example": "top-picks"
+                                },
+                                "title": {
+                                    "type": "string",
+                                    "example": "Top picks for you"
+                                },
+                                "count": {
+                                    "type": "integer",
+                                    "example": 6
+                                },
+                                "results": {
+                                    "type": "array",
+                                    "items": {"$ref": "#/components/schemas/SearchResult"}
+                                }
+                            }
+                        }
+                    }
+                },
+                "required": ["status", "generated_at", "featured", "sections"]
+            },
             "SearchResult": {
                 "type": "object",
                 "properties": {
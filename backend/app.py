@@ -5,11 +5,17 @@ Clean, modular torrent search API with TMDB metadata integration
 """
 
 import logging
+import os
+import threading
+import time
 from flask import Flask
 from config import Config
 from routes.search_routes import search_bp
-from routes.health_routes import health_bp
+from routes.health_routes import health_bp, health_prober
+from routes.feed_routes import feed_bp, home_feed
 from services.tmdb_client import TMDBClient
+from utils.metrics import instrument_app
+from utils.tracing import trace_requests
 
 # Configure logging
 logging.basicConfig(
@@ -17,19 +23,81 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
-def create_app():
-    """Application factory"""
+def create_app(start_services=True):
+    """
+    Application factory.
+    
+    Pass start_services=False when the app is built in a process that will
+    fork (preloaded gunicorn master) and call start_background_services()
+    in each worker instead - threads do not survive a fork.
+    """
     app = Flask(__name__)
     
     # Register blueprints
     app.register_blueprint(search_bp)
     app.register_blueprint(health_bp)
+    app.register_blueprint(feed_bp)
+    
+    # Per-route latency and in-flight requests for /metrics
+    instrument_app(app)
+    
+    # Per-stage timings in Server-Timing and the slow-request log
+    trace_requests(app)
+    
+    if start_services:
+        start_background_services()
     
     return app
 
+def start_background_services():
+    """Start the background threads behind /health and /home"""
+    # Keep upstream health cached in memory for /health
+    health_prober.start()
+    
+    # Build the home feed snapshot in the background and keep it fresh
+    home_feed.start()
+
+def warm_up(deadline=None):
+    """
+    Prime connection pools and caches so the first requests are not slow.
+    
+    Probing opens keep-alive connections (DNS, TCP and TLS) to TMDB and the
+    torrent mirror on the clients the routes use and makes /health/ready answer
+    straight away; building the home feed fills the TMDB response cache and
+    the /home snapshot. Returns the seconds spent.
+    
+    With a deadline (seconds) this stops waiting once it passes and lets the
+    warm-up finish in the background, so a slow or down upstream cannot hold
+    a gunicorn worker past its timeout and into a restart loop.
+    """
+    started = time.perf_counter()
+    
+    worker = threading.Thread(target=_warm_up, name='warm-up', daemon=True)
+    worker.start()
+    worker.join(deadline)
+    if worker.is_alive():
+        logging.warning(f"Warm-up still running after {deadline:.0f}s - finishing it in the background")
+    
+    return time.perf_counter() - started
+
+def _warm_up():
+    try:
+        health_prober.probe_once()
+    except Exception as e:
+        logging.error(f"Warm-up probe failed: {e}")
+    
+    if home_feed.tmdb_client.enabled:
+        try:
+            home_feed.refresh()
+        except Exception as e:
+            logging.error(f"Warm-up home feed build failed: {e}")
+
 def main():
     """Main entry point"""
-    app = create_app()
+    # In debug mode the reloader runs this in a watcher process and again in the
+    # serving child (WERKZEUG_RUN_MAIN=true); only the child runs the background threads
+    reloader_parent = Config.DEBUG and os.environ.get('WERKZEUG_RUN_MAIN') != 'true'
+    app = create_app(start_services=not reloader_parent)
     
     print("🚀 Starting Torrent Search API v4.0...")
     print("📁 Modular architecture enabled")
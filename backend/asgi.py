@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+ASGI entry point - async serving mode.
+
+    uvicorn asgi:application --host 0.0.0.0 --port 8001
+
+The details endpoints run natively on the event loop (routes/async_routes.py)
+over one shared httpx connection pool, so a single process can hold thousands
+of slow mirror scrapes without a thread per request. Every other route,
+including ?stream= responses on the details endpoints, is the unchanged Flask
+app behind a WSGI adapter. `python app.py` keeps serving everything
+synchronously.
+"""
+
+import json
+import logging
+import time
+from urllib.parse import parse_qsl
+from asgiref.wsgi import WsgiToAsgi
+from app import create_app
+from config import Config
+from routes.async_routes import match_async_route
+from services.async_http import close_async_client
+from utils.metrics import REQUESTS_IN_FLIGHT, observe_request
+from utils.tracing import current_trace, finish_trace, start_trace
+
+def encode_json(payload):
+    """Serialize like Flask's jsonify (sorted keys, compact, trailing newline)"""
+    return (json.dumps(payload, sort_keys=True, separators=(',', ':')) + '\n').encode()
+
+class AsyncApplication:
+    """Route native async handlers first and hand everything else to the Flask app"""
+
+    def __init__(self, flask_app):
+        self.wsgi = WsgiToAsgi(flask_app)
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self.lifespan(receive, send)
+            return
+
+        if scope['type'] == 'http' and scope['method'] == 'GET':
+            args = dict(parse_qsl(scope.get('query_string', b'').decode('latin-1')))
+            route = match_async_route(scope['path'])
+            # Streaming responses stay on the Flask handlers
+            if route is not None and not args.get('stream'):
+                endpoint, handler, params = route
+                started = time.perf_counter()
+                REQUESTS_IN_FLIGHT.inc()
+                trace_token = start_trace('GET', scope['path'])
+                status = 500
+                try:
+                    try:
+                        status, payload, headers = await handler(args, *params)
+                    except Exception as e:
+                        # Answer like the Flask routes instead of dropping the connection
+                        logging.error(f'{endpoint} failed: {e}')
+                        status, payload, headers = 500, {
+                            'status': 'error',
+                            'message': f'Request failed: {str(e)}'
+                        }, {}
+                    if Config.SERVER_TIMING:
+                        headers = dict(headers, **{'Server-Timing': current_trace().server_timing()})
+                    await self.respond(send, status, payload, headers)
+                finally:
+                    finish_trace(trace_token, status)
+                    REQUESTS_IN_FLIGHT.dec()
+                    observe_request('GET', endpoint, status, time.perf_counter() - started)
+                return
+
+        await self.wsgi(scope, receive, send)
+
+    async def respond(self, send, status, payload, headers):
+        body = encode_json(payload)
+        raw_headers = [
+            (b'content-type', b'application/json'),
+            (b'content-length', str(len(body)).encode())
+        ]
+        raw_headers.extend((name.lower().encode(), value.encode()) for name, value in headers.items())
+        await send({'type': 'http.response.start', 'status': status, 'headers': raw_headers})
+        await send({'type': 'http.response.body', 'body': body})
+
+    async def lifespan(self, receive, send):
+        """Close the shared connection pool when the server shuts down"""
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                try:
+                    await close_async_client()
+                except Exception as e:
+                    logging.error(f'Closing async HTTP client failed: {e}')
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+application = AsyncApplication(create_app())
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the per-request hot path: parse, score and format
+
+Timings use pytest-benchmark (pip install pytest-benchmark). Run from the
+backend directory:
+
+    python -m pytest benchmarks/bench_hot_path.py --benchmark-autosave
+    python -m pytest benchmarks/bench_hot_path.py --benchmark-compare --benchmark-compare-fail=median:10%
+
+Every benchmark also records what one call allocates (tracemalloc peak, and
+what its result retains) in extra_info, so it lands in the saved JSON. Run
+this file directly for just the allocation table, or compare against one:
+
+    python benchmarks/bench_hot_path.py --output allocations.json
+    python benchmarks/bench_hot_path.py --baseline allocations.json    # exit 1 on regression
+"""
+
+import argparse
+import copy
+import importlib.util
+import json
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.torrent_finder import TorrentFinder
+from services.torrent_result import TorrentResult
+from utils.formatters import (
+    calculate_torrent_score,
+    extract_quality,
+    format_tmdb_details,
+    format_torrent_results,
+    parse_size_to_bytes
+)
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fixtures')
+
+PAGES = ['movies_inception.html', 'tv_breaking_bad_s01.html']
+ROW_COUNTS = [50, 500, 5_000]
+SEASON_EPISODES = 24
+
+def load_page(name):
+    with open(os.path.join(FIXTURES_DIR, 'torrent_search', name), encoding='utf-8') as f:
+        return f.read()
+
+def load_tmdb(name):
+    with open(os.path.join(FIXTURES_DIR, 'tmdb', name), encoding='utf-8') as f:
+        return json.load(f)
+
+finder = TorrentFinder()
+page_html = {name: load_page(name) for name in PAGES}
+scraped = [row for html in page_html.values() for row in finder._parse_results(html)]
+
+def make_rows(count, seed=0):
+    """count scraped rows, cycled from the fixture pages with varied seeders"""
+    rng = random.Random(seed)
+    return [
+        TorrentResult(row.title, row.magnet, row.size, int(rng.paretovariate(0.8)) - 1, row.leechers, row.infohash)
+        for row in (scraped[i % len(scraped)] for i in range(count))
+    ]
+
+def make_season(episodes):
+    """The season fixture stretched to `episodes` episodes (each with its crew and guest stars)"""
+    season = load_tmdb('tv_1396_season_1.json')
+    recorded = season['episodes']
+    season['episodes'] = []
+    for number in range(1, episodes + 1):
+        episode = copy.deepcopy(recorded[(number - 1) % len(recorded)])
+        episode['episode_number'] = number
+        episode['id'] += number * 1000
+        season['episodes'].append(episode)
+    return season
+
+sizes = [row.size for row in scraped] + ['Unknown', '']
+titles = [row.title for row in scraped]
+score_inputs = [(parse_size_to_bytes(row.size), row.seeders) for row in make_rows(500)]
+row_sets = {count: make_rows(count) for count in ROW_COUNTS}
+season = make_season(SEASON_EPISODES)
+movie = load_tmdb('movie_27205.json')
+
+# (name, callable, args) - the pytest benchmarks and the allocation table share these
+CASES = (
+    [(f'parse_results[{name}]', finder._parse_results, (html,)) for name, html in page_html.items()]
+    + [
+        (f'parse_size_to_bytes[{len(sizes)} sizes]', lambda: [parse_size_to_bytes(size) for size in sizes], ()),
+        (f'extract_quality[{len(titles)} titles]', lambda: [extract_quality(title) for title in titles], ()),
+        (f'calculate_torrent_score[{len(score_inputs)} rows]',
+         lambda: [calculate_torrent_score(size, seeders) for size, seeders in score_inputs], ()),
+    ]
+    + [(f'format_torrent_results[{count} rows]', format_torrent_results, (row_sets[count],)) for count in ROW_COUNTS]
+    + [
+        (f'format_tmdb_details[season, {SEASON_EPISODES} episodes]', format_tmdb_details, (season,)),
+        ('format_tmdb_details[movie with credits]', format_tmdb_details, (movie,)),
+    ]
+)
+
+def measure_allocations(func, args=()):
+    """Peak memory traced during one call and what its result still holds afterwards (KiB)"""
+    func(*args)  # warm lazily built state (compiled patterns, lookup caches) so only per-call cost counts
+    tracemalloc.start()
+    try:
+        result = func(*args)
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return {'peak_kib': round(peak / 1024, 1), 'retained_kib': round(retained / 1024, 1)}
+
+try:
+    import pytest
+except ImportError:
+    pytest = None
+
+if pytest is not None:
+    @pytest.mark.skipif(importlib.util.find_spec('pytest_benchmark') is None, reason='pytest-benchmark not installed')
+    @pytest.mark.parametrize('name, func, args', CASES, ids=[case[0] for case in CASES])
+    def test_hot_path(benchmark, name, func, args):
+        benchmark.extra_info.update(measure_allocations(func, args))
+        benchmark(func, *args)
+
+def main():
+    parser = argparse.ArgumentParser(description='Allocations per call on the parse/score/format hot path')
+    parser.add_argument('--output', help='write the allocation table here as JSON')
+    parser.add_argument('--baseline', help='allocation table to compare against')
+    parser.add_argument('--max-regression', type=float, default=0.10, help='allowed relative growth (0.10 = 10%%)')
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    results, regressions = {}, []
+    print(f"{'case':<48} {'peak KiB':>10} {'retained KiB':>13}")
+    for name, func, call_args in CASES:
+        stats = results[name] = measure_allocations(func, call_args)
+        print(f"{name:<48} {stats['peak_kib']:>10.1f} {stats['retained_kib']:>13.1f}")
+        for metric, before in baseline.get(name, {}).items():
+            if before and (stats[metric] - before) / before > args.max_regression:
+                regressions.append(f'{name} {metric}: {before} -> {stats[metric]}')
+
+    for regression in regressions:
+        print(f'REGRESSION {regression}')
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+            f.write('\n')
+    return 1 if regressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Benchmark scalar vs vectorized torrent scoring
+
+Run from the backend directory: python benchmarks/bench_scoring.py
+"""
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.formatters import calculate_torrent_score
+from utils.scoring import calculate_torrent_scores
+
+ROW_COUNTS = [100, 256, 1_000, 10_000]
+
+def make_rows(count, seed=0):
+    """Sizes and seeders shaped like scraped search results"""
+    rng = random.Random(seed)
+    sizes = [int(rng.lognormvariate(21, 1.2)) for _ in range(count)]
+    seeders = [int(rng.paretovariate(0.8)) - 1 for _ in range(count)]
+    return sizes, seeders
+
+def best_of(func, repeat=5):
+    """Best wall time in seconds of a single call"""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+def main():
+    print(f"{'rows':>8} {'scalar ms':>12} {'batch ms':>12} {'speedup':>9}")
+    for count in ROW_COUNTS:
+        sizes, seeders = make_rows(count)
+        assert calculate_torrent_scores(sizes, seeders).tolist() == [
+            calculate_torrent_score(size, seeder) for size, seeder in zip(sizes, seeders)
+        ]
+
+        scalar = best_of(lambda: [calculate_torrent_score(size, seeder) for size, seeder in zip(sizes, seeders)])
+        batch = best_of(lambda: calculate_torrent_scores(sizes, seeders))
+        print(f"{count:>8} {scalar * 1000:>12.3f} {batch * 1000:>12.3f} {scalar / batch:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Local stand-ins for TMDB and the torrent mirror, serving the recorded fixtures.
+
+Both answer every request after a configurable latency (plus uniform jitter),
+so benchmarks measure this service rather than the internet. Start them with
+start_fake_tmdb() / start_fake_mirror(), or run this file to serve both:
+
+    python benchmarks/fake_upstreams.py --tmdb-port 9001 --mirror-port 9002
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fixtures')
+
+def load_fixture(*parts):
+    with open(os.path.join(FIXTURES_DIR, *parts), 'rb') as f:
+        return f.read()
+
+# TMDB path (under /3) -> recorded payload
+TMDB_ROUTES = [
+    (re.compile(r'/search/movie'), 'search_movie.json'),
+    (re.compile(r'/search/tv'), 'search_tv.json'),
+    (re.compile(r'/search/multi'), 'search_multi.json'),
+    (re.compile(r'/movie/\d+'), 'movie_27205.json'),
+    (re.compile(r'/tv/\d+/season/\d+/episode/\d+'), 'tv_1396_season_1_episode_1.json'),
+    (re.compile(r'/tv/\d+/season/\d+'), 'tv_1396_season_1.json'),
+    (re.compile(r'/tv/\d+'), 'tv_1396.json'),
+]
+
+# Mirror category code -> recorded results page
+MOVIE_CATEGORIES = {'201', '207'}
+MIRROR_SEARCH = re.compile(r'/search/.+/1/99/(\d+)')
+
+class FakeUpstream(ThreadingHTTPServer):
+    """Threaded HTTP server that delays each answer by latency_ms +/- jitter_ms"""
+
+    daemon_threads = True
+
+    def __init__(self, handler, port=0, latency_ms=0, jitter_ms=0, seed=None):
+        super().__init__(('127.0.0.1', port), handler)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+
+    @property
+    def base_url(self):
+        return f'http://127.0.0.1:{self.server_address[1]}'
+
+    def delay(self):
+        with self._rng_lock:
+            jitter = self._rng.uniform(-self.jitter_ms, self.jitter_ms)
+        time.sleep(max(self.latency_ms + jitter, 0) / 1000)
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, name=self.RequestHandlerClass.__name__, daemon=True).start()
+        return self
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    # Keep-alive, like the real upstreams, so client connection pooling is exercised
+    protocol_version = 'HTTP/1.1'
+
+    def route(self, path):
+        """(status, content type, body) for a request path"""
+        raise NotImplementedError
+
+    def do_GET(self):
+        self.server.delay()
+        status, content_type, body = self.route(self.path.split('?', 1)[0])
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    do_HEAD = do_GET
+
+    def log_message(self, format, *args):
+        pass
+
+class TMDBHandler(FixtureHandler):
+    payloads = {name: load_fixture('tmdb', name) for _, name in TMDB_ROUTES}
+
+    def route(self, path):
+        path = path[len('/3'):] if path.startswith('/3/') else path
+        if path == '/configuration':
+            return 200, 'application/json', b'{"images": {}}'
+        for pattern, name in TMDB_ROUTES:
+            if pattern.fullmatch(path):
+                return 200, 'application/json', self.payloads[name]
+        return 404, 'application/json', json.dumps({'status_code': 34, 'status_message': 'Not found'}).encode()
+
+class MirrorHandler(FixtureHandler):
+    movies_page = load_fixture('torrent_search', 'movies_inception.html')
+    tv_page = load_fixture('torrent_search', 'tv_breaking_bad_s01.html')
+
+    def route(self, path):
+        if path == '/':
+            return 200, 'text/html', b'<html></html>'
+        match = MIRROR_SEARCH.fullmatch(path)
+        if not match:
+            return 404, 'text/html', b''
+        page = self.movies_page if match.group(1) in MOVIE_CATEGORIES else self.tv_page
+        return 200, 'text/html; charset=utf-8', page
+
+def start_fake_tmdb(port=0, latency_ms=0, jitter_ms=0, seed=None):
+    """Serve the TMDB fixtures; point TMDB_BASE_URL at f'{server.base_url}/3'"""
+    return FakeUpstream(TMDBHandler, port, latency_ms, jitter_ms, seed).start()
+
+def start_fake_mirror(port=0, latency_ms=0, jitter_ms=0, seed=None):
+    """Serve the results page fixtures; use TORRENT_SITE_SCHEME=http and TORRENT_SITE_DOMAIN=127.0.0.1:<port>"""
+    return FakeUpstream(MirrorHandler, port, latency_ms, jitter_ms, seed).start()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tmdb-port', type=int, default=9001)
+    parser.add_argument('--mirror-port', type=int, default=9002)
+    parser.add_argument('--tmdb-latency', type=float, default=40, help='ms')
+    parser.add_argument('--mirror-latency', type=float, default=250, help='ms')
+    parser.add_argument('--jitter', type=float, default=20, help='+/- ms on every answer')
+    args = parser.parse_args()
+
+    tmdb = start_fake_tmdb(args.tmdb_port, args.tmdb_latency, args.jitter)
+    mirror = start_fake_mirror(args.mirror_port, args.mirror_latency, args.jitter)
+    print('Point a server at the stand-ins with:')
+    print(f'  TMDB_API_KEY=benchmark TMDB_BASE_URL={tmdb.base_url}/3 \\')
+    print(f'  TORRENT_SITE_SCHEME=http TORRENT_SITE_DOMAIN=127.0.0.1:{mirror.server_address[1]}')
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
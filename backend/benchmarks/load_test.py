@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Offline load test: drive the API at fixed concurrency against local stand-ins
+for TMDB and the torrent mirror, and report per-endpoint latency as JSON.
+
+Run from the backend directory:
+
+    python benchmarks/load_test.py --output results.json
+    python benchmarks/load_test.py --baseline results.json    # compare, exit 1 on regression
+
+By default the fake upstreams and the Flask app are started in this process.
+To measure another serving mode, start `benchmarks/fake_upstreams.py` and
+the server (gunicorn / uvicorn) pointed at them, then pass --target.
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+from benchmarks.fake_upstreams import start_fake_mirror, start_fake_tmdb
+
+ENDPOINTS = [
+    '/search/inception',
+    '/details/movie/27205',
+    '/details/tv/1396',
+    '/details/tv/1396/season/1',
+    '/details/tv/1396/season/1/episode/1',
+]
+
+# Compared against the baseline; a regression is a relative change beyond --max-regression
+COMPARED = {'p50_ms': 1, 'p95_ms': 1, 'p99_ms': 1, 'throughput_rps': -1}  # 1 = lower is better
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = max(math.ceil(pct / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+def start_local_app(args):
+    """Start the fake upstreams and the Flask app in this process; returns the app's base URL"""
+    tmdb = start_fake_tmdb(latency_ms=args.tmdb_latency, jitter_ms=args.jitter, seed=1)
+    mirror = start_fake_mirror(latency_ms=args.mirror_latency, jitter_ms=args.jitter, seed=2)
+
+    # Config reads the environment on import, so it must be set before the app is imported
+    os.environ.update({
+        'TMDB_API_KEY': 'benchmark',
+        'TMDB_BASE_URL': f'{tmdb.base_url}/3',
+        'TMDB_RATE_LIMIT': '1000000',
+        'TMDB_RATE_LIMIT_BURST': '1000000',
+        'TMDB_CACHE_PATH': os.path.join(tempfile.mkdtemp(), 'tmdb_cache.sqlite3') if args.warm else '',
+        'TORRENT_SITE_SCHEME': 'http',
+        'TORRENT_SITE_DOMAIN': f'127.0.0.1:{mirror.server_address[1]}',
+        'HEALTH_PROBE_INTERVAL': '0',
+        'HOME_FEED_REFRESH_MINUTES': '0',
+        'SLOW_REQUEST_LOG_SAMPLE_RATE': '0',
+    })
+
+    from werkzeug.serving import make_server
+    from app import create_app
+
+    app = create_app()
+    # Werkzeug logs every request at INFO, which would drown the summary
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, name='benchmark-app', daemon=True).start()
+    return f'http://127.0.0.1:{server.server_port}'
+
+def run_endpoint(base_url, path, args):
+    """Send args.requests requests to one endpoint from args.concurrency clients"""
+    # Without --warm every request re-scrapes, so the torrent path is always measured
+    params = {} if args.warm else {'cache': 'false'}
+    sessions = threading.local()
+    latencies, errors = [], 0
+    lock = threading.Lock()
+
+    def call(_):
+        nonlocal errors
+        # One keep-alive session per client thread
+        if not hasattr(sessions, 'session'):
+            sessions.session = requests.Session()
+        session = sessions.session
+        started = time.perf_counter()
+        try:
+            ok = session.get(base_url + path, params=params, timeout=args.timeout).status_code == 200
+        except requests.RequestException:
+            ok = False
+        elapsed = (time.perf_counter() - started) * 1000
+        with lock:
+            latencies.append(elapsed)
+            errors += not ok
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(call, range(args.warmup)))
+        latencies.clear()
+        errors = 0
+
+        started = time.perf_counter()
+        list(pool.map(call, range(args.requests)))
+        wall = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'throughput_rps': round(len(latencies) / wall, 2),
+        'mean_ms': round(sum(latencies) / len(latencies), 2),
+        'p50_ms': round(percentile(latencies, 50), 2),
+        'p95_ms': round(percentile(latencies, 95), 2),
+        'p99_ms': round(percentile(latencies, 99), 2),
+        'max_ms': round(latencies[-1], 2),
+    }
+
+def compare(results, baseline, max_regression):
+    """Relative change of each compared metric against the baseline, and the regressions among them"""
+    changes, regressions = {}, []
+    for path, current in results['endpoints'].items():
+        before = baseline.get('endpoints', {}).get(path)
+        if not before:
+            continue
+        changes[path] = {}
+        for metric, direction in COMPARED.items():
+            if not before.get(metric):
+                continue
+            change = (current[metric] - before[metric]) / before[metric]
+            changes[path][metric] = round(change, 4)
+            if change * direction > max_regression:
+                regressions.append(f'{path} {metric}: {before[metric]} -> {current[metric]} ({change:+.1%})')
+    return changes, regressions
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline load test against local TMDB and mirror stand-ins')
+    parser.add_argument('--concurrency', type=int, default=16, help='concurrent clients')
+    parser.add_argument('--requests', type=int, default=200, help='measured requests per endpoint')
+    parser.add_argument('--warmup', type=int, default=16, help='unmeasured requests per endpoint first')
+    parser.add_argument('--endpoints', nargs='+', default=ENDPOINTS)
+    parser.add_argument('--tmdb-latency', type=float, default=40, help='fake TMDB latency (ms)')
+    parser.add_argument('--mirror-latency', type=float, default=250, help='fake mirror latency (ms)')
+    parser.add_argument('--jitter', type=float, default=20, help='+/- ms on every fake upstream answer')
+    parser.add_argument('--warm', action='store_true', help='allow TMDB and torrent result caches')
+    parser.add_argument('--timeout', type=float, default=60)
+    parser.add_argument('--target', help='base URL of an already running server (skips the in-process app)')
+    parser.add_argument('--output', help='write the JSON report here as well as to stdout')
+    parser.add_argument('--baseline', help='JSON report to compare against')
+    parser.add_argument('--max-regression', type=float, default=0.10, help='allowed relative slowdown (0.10 = 10%%)')
+    args = parser.parse_args()
+
+    base_url = args.target or start_local_app(args)
+
+    results = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'target': args.target or 'in-process flask',
+            'concurrency': args.concurrency,
+            'requests': args.requests,
+            'tmdb_latency_ms': args.tmdb_latency,
+            'mirror_latency_ms': args.mirror_latency,
+            'jitter_ms': args.jitter,
+            'warm': args.warm,
+        },
+        'endpoints': {}
+    }
+    for path in args.endpoints:
+        stats = results['endpoints'][path] = run_endpoint(base_url, path, args)
+        print(
+            f"{path:<40} {stats['throughput_rps']:>8.1f} req/s  p50 {stats['p50_ms']:>8.1f}  "
+            f"p95 {stats['p95_ms']:>8.1f}  p99 {stats['p99_ms']:>8.1f} ms  errors {stats['errors']}",
+            file=sys.stderr
+        )
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            results['changes'], regressions = compare(results, json.load(f), args.max_regression)
+        results['regressions'] = regressions
+        for regression in regressions:
+            print(f'REGRESSION {regression}', file=sys.stderr)
+
+    report = json.dumps(results, indent=2)
+    print(report)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(report + '\n')
+
+    return 1 if regressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
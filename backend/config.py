@@ -4,6 +4,13 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
+# Relative data paths resolve against the backend directory, not the server's working directory
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def backend_path(path):
+    """Absolute path for a path relative to the backend directory (empty stays empty)"""
+    return os.path.join(BACKEND_DIR, path) if path else path
+
 class Config:
     """Application configuration"""
     
@@ -12,12 +19,77 @@ class Config:
     TMDB_BASE_URL = os.getenv('TMDB_BASE_URL', 'https://api.themoviedb.org/3')
     TMDB_IMAGE_BASE_URL = os.getenv('TMDB_IMAGE_BASE_URL', 'https://image.tmdb.org/t/p/w500')
     
+    # TMDB Rate Limiting (requests per second, burst size, max seconds a caller may wait)
+    TMDB_RATE_LIMIT = float(os.getenv('TMDB_RATE_LIMIT', '40'))
+    TMDB_RATE_LIMIT_BURST = int(os.getenv('TMDB_RATE_LIMIT_BURST', '20'))
+    TMDB_RATE_LIMIT_MAX_WAIT = float(os.getenv('TMDB_RATE_LIMIT_MAX_WAIT', '1.0'))
+    TMDB_MAX_RETRIES = int(os.getenv('TMDB_MAX_RETRIES', '2'))
+    
+    # TMDB Response Cache Configuration (relative to the backend directory, empty path disables, TTLs in seconds)
+    TMDB_CACHE_PATH = backend_path(os.getenv('TMDB_CACHE_PATH', 'tmdb_cache.sqlite3'))
+    TMDB_CACHE_DETAILS_TTL = int(os.getenv('TMDB_CACHE_DETAILS_TTL', '604800'))
+    TMDB_CACHE_SEARCH_TTL = int(os.getenv('TMDB_CACHE_SEARCH_TTL', '3600'))
+    TMDB_CACHE_DEFAULT_TTL = int(os.getenv('TMDB_CACHE_DEFAULT_TTL', '86400'))
+    TMDB_CACHE_STALE_TTL = int(os.getenv('TMDB_CACHE_STALE_TTL', '604800'))  # Served stale while refreshing
+    
     # Torrent Site Configuration
     TORRENT_SITE_DOMAIN = os.getenv('TORRENT_SITE_DOMAIN', 'tpirbay.site')
+    TORRENT_SITE_SCHEME = os.getenv('TORRENT_SITE_SCHEME', 'https')  # http for a local stand-in mirror
+    
+    # Torrent Site HTTP Configuration
+    TORRENT_POOL_SIZE = int(os.getenv('TORRENT_POOL_SIZE', '16'))
+    TORRENT_CONNECT_TIMEOUT = float(os.getenv('TORRENT_CONNECT_TIMEOUT', '5'))
+    TORRENT_READ_TIMEOUT = float(os.getenv('TORRENT_READ_TIMEOUT', '15'))
+    TORRENT_MAX_RETRIES = int(os.getenv('TORRENT_MAX_RETRIES', '2'))
+    
+    # Torrent Result Parser ('lxml' fast path or 'html.parser' fallback)
+    TORRENT_PARSER = os.getenv('TORRENT_PARSER', 'lxml')
+    
+    # Torrent Result Cache Configuration (entries / seconds, size 0 disables)
+    TORRENT_CACHE_SIZE = int(os.getenv('TORRENT_CACHE_SIZE', '512'))
+    TORRENT_CACHE_TTL = int(os.getenv('TORRENT_CACHE_TTL', '300'))
+    
+    # Scrape Concurrency Configuration
+    SCRAPE_MAX_WORKERS = int(os.getenv('SCRAPE_MAX_WORKERS', '16'))  # Shared across all requests
+    SCRAPE_REQUEST_CONCURRENCY = int(os.getenv('SCRAPE_REQUEST_CONCURRENCY', '4'))  # Per request
+    TASK_MAX_WORKERS = int(os.getenv('TASK_MAX_WORKERS', '32'))  # Concurrent TMDB/scrape tasks in route handlers
+    LOOKUP_MAX_WORKERS = int(os.getenv('LOOKUP_MAX_WORKERS', '16'))  # Batched TMDB lookups, shared across all requests
+    
+    # Async (ASGI) Serving Configuration - shared httpx connection pool per process
+    ASYNC_MAX_CONNECTIONS = int(os.getenv('ASYNC_MAX_CONNECTIONS', '1000'))
+    ASYNC_MAX_KEEPALIVE = int(os.getenv('ASYNC_MAX_KEEPALIVE', '100'))
     
     # API Configuration
     API_PORT = int(os.getenv('API_PORT', '8001'))
     
+    # Batch Search Configuration
+    BATCH_MAX_QUERIES = int(os.getenv('BATCH_MAX_QUERIES', '50'))
+    BATCH_CONCURRENCY = int(os.getenv('BATCH_CONCURRENCY', '8'))
+    
+    # Health Probe Configuration (seconds between upstream checks, 0 disables)
+    HEALTH_PROBE_INTERVAL = float(os.getenv('HEALTH_PROBE_INTERVAL', '30'))
+    
+    # Home Feed Configuration (minutes between snapshot rebuilds, 0 builds once on first request)
+    HOME_FEED_REFRESH_MINUTES = float(os.getenv('HOME_FEED_REFRESH_MINUTES', '30'))
+    
+    # Cache-Control max-age (seconds) for the static / and /schema responses
+    DOCS_CACHE_MAX_AGE = int(os.getenv('DOCS_CACHE_MAX_AGE', '3600'))
+    
+    # Tracing Configuration (Server-Timing header, sampled slow-request log, optional OTLP export)
+    SERVER_TIMING = os.getenv('SERVER_TIMING', 'False').lower() == 'true'  # Exposes upstream endpoints and queries
+    SLOW_REQUEST_MS = float(os.getenv('SLOW_REQUEST_MS', '2000'))
+    SLOW_REQUEST_LOG_SAMPLE_RATE = float(os.getenv('SLOW_REQUEST_LOG_SAMPLE_RATE', '0.1'))
+    OTEL_EXPORTER_OTLP_ENDPOINT = os.getenv('OTEL_EXPORTER_OTLP_ENDPOINT', '')  # e.g. http://localhost:4318
+    OTEL_SERVICE_NAME = os.getenv('OTEL_SERVICE_NAME', 'torrent-search-api')
+    
+    # Production Server Configuration (gunicorn.conf.py)
+    SERVER_WORKERS = int(os.getenv('SERVER_WORKERS', str((os.cpu_count() or 1) * 2 + 1)))
+    SERVER_THREADS = int(os.getenv('SERVER_THREADS', '8'))  # Per worker (gthread)
+    SERVER_WORKER_CLASS = os.getenv('SERVER_WORKER_CLASS', 'gthread')
+    SERVER_TIMEOUT = int(os.getenv('SERVER_TIMEOUT', '60'))  # Seconds before a silent worker is restarted
+    SERVER_WARMUP = os.getenv('SERVER_WARMUP', 'True').lower() == 'true'
+    SERVER_WARMUP_TIMEOUT = float(os.getenv('SERVER_WARMUP_TIMEOUT', '20'))  # Capped at half of SERVER_TIMEOUT
+    
     # Flask Configuration
     DEBUG = os.getenv('DEBUG', 'True').lower() == 'true'
     HOST = os.getenv('HOST', '0.0.0.0')
@@ -0,0 +1,42 @@
+"""
+Gunicorn settings for production serving - run with `gunicorn -c gunicorn.conf.py`.
+
+Worker count, threads and worker class come from Config (SERVER_* variables).
+The app is preloaded once in the master so workers share its imports and
+precomputed responses, then every worker warms its own connection pools and
+caches before it accepts traffic.
+"""
+
+import os
+from config import Config
+
+wsgi_app = 'wsgi:application'
+bind = f'{Config.HOST}:{Config.API_PORT}'
+
+workers = Config.SERVER_WORKERS
+threads = Config.SERVER_THREADS
+worker_class = Config.SERVER_WORKER_CLASS
+timeout = Config.SERVER_TIMEOUT
+# Let in-flight scrapes finish on restart
+graceful_timeout = Config.SERVER_TIMEOUT
+
+# gevent/eventlet must monkey-patch before the app is imported, so they load it per worker
+preload_app = worker_class not in ('gevent', 'eventlet')
+
+def post_worker_init(worker):
+    """Warm up, then start the background services - runs in each worker before it accepts requests"""
+    # Imported here: with preloading this is already loaded, otherwise the worker just loaded it
+    from app import start_background_services, warm_up
+
+    if Config.SERVER_WARMUP:
+        # The worker only heartbeats once this returns, so stay well inside the arbiter's timeout
+        seconds = warm_up(deadline=min(Config.SERVER_WARMUP_TIMEOUT, timeout / 2))
+        worker.log.info(f'Worker {worker.pid} warmed up in {seconds:.2f}s')
+
+    start_background_services()
+
+def child_exit(server, worker):
+    """Drop a dead worker's live gauges from the aggregated /metrics (multiprocess mode only)"""
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,223 @@
+"""
+Native async handlers for the details endpoints (ASGI serving mode).
+
+These are the endpoints that fan out to TMDB and several mirror scrapes per
+request, so under asgi.py they run on the event loop instead of holding a
+WSGI worker thread for the whole request. Responses match the Flask
+handlers in routes/search_routes.py; everything else (search, streaming,
+health, feed) is still served by the Flask app.
+"""
+
+import asyncio
+import logging
+import math
+import re
+from services.async_tmdb_client import AsyncTMDBClient
+from services.async_torrent_finder import AsyncTorrentFinder
+from utils.formatters import format_tmdb_details, search_torrents_for_title_async
+from utils.rate_limit import RateLimitExceeded
+
+# Initialize services (the async HTTP pool itself is created on first use)
+tmdb_client = AsyncTMDBClient()
+torrent_finder = AsyncTorrentFinder()
+
+TMDB_DISABLED = {
+    'status': 'error',
+    'message': 'TMDB service not available - API key not configured',
+    'hint': 'Set TMDB_API_KEY in your .env file to enable TMDB features'
+}
+
+def use_torrent_cache(args):
+    """Whether cached torrent results may be served (opt out with ?cache=false)"""
+    return args.get('cache', 'true').lower() not in ('false', '0', 'no')
+
+def torrent_limit(args):
+    """Maximum number of torrents to return (?limit=N), or None for all of them"""
+    try:
+        limit = int(args.get('limit', ''))
+    except ValueError:
+        return None
+    return limit if limit > 0 else None
+
+def rate_limited_response(error):
+    """503 telling the client when to retry after TMDB throttling"""
+    retry_after = max(1, math.ceil(error.retry_after))
+    return 503, {
+        'status': 'error',
+        'message': 'TMDB rate limit reached - try again later',
+        'retry_after': retry_after
+    }, {'Retry-After': str(retry_after)}
+
+async def search_show_torrents(tv_details, season=None, episode=None, use_cache=True, limit=None):
+    """Search season/episode torrents once the show name is known"""
+    show_name = tv_details.get('name') if tv_details else None
+    if not show_name:
+        return []
+    return await search_torrents_for_title_async(
+        torrent_finder,
+        show_name,
+        'tv',
+        season=season,
+        episode=episode,
+        use_cache=use_cache,
+        limit=limit
+    )
+
+async def show_with_torrents(tv_id, season, episode, args):
+    """Show details, then its torrents - run alongside the season/episode lookup"""
+    tv_details = await tmdb_client.get_tv_details(tv_id)
+    torrent_results = await search_show_torrents(
+        tv_details, season, episode, use_torrent_cache(args), torrent_limit(args)
+    )
+    return tv_details, torrent_results
+
+async def get_details_with_torrents(args, content_type, tmdb_id):
+    """Get detailed TMDB info with available torrent links"""
+    try:
+        if not tmdb_client.enabled:
+            return 503, TMDB_DISABLED, {}
+
+        if content_type not in ['movie', 'tv']:
+            return 400, {
+                'status': 'error',
+                'message': 'Content type must be "movie" or "tv"'
+            }, {}
+
+        if content_type == 'movie':
+            # Details and credits (cast and crew) in a single TMDB round trip
+            details = await tmdb_client.get_movie_details(tmdb_id, append_to_response=['credits'])
+            title = details.get('title') if details else None
+        else:  # tv
+            details = await tmdb_client.get_tv_details(tmdb_id)
+            title = details.get('name') if details else None
+
+        if not details:
+            return 404, {
+                'status': 'error',
+                'message': 'Content not found'
+            }, {}
+
+        torrent_results = []
+        if title:
+            torrent_results = await search_torrents_for_title_async(
+                torrent_finder,
+                title,
+                content_type,
+                use_cache=use_torrent_cache(args),
+                limit=torrent_limit(args)
+            )
+
+        return 200, {
+            'status': 'success',
+            'tmdb_details': format_tmdb_details(details),
+            'torrent_count': len(torrent_results),
+            'torrent_results': torrent_results
+        }, {}
+
+    except RateLimitExceeded as e:
+        return rate_limited_response(e)
+    except Exception as e:
+        logging.error(f'Details with torrents failed: {e}')
+        return 500, {
+            'status': 'error',
+            'message': f'Failed to get details: {str(e)}'
+        }, {}
+
+async def get_season_details_with_torrents(args, tv_id, season_number):
+    """Get TV season details with available torrent links"""
+    try:
+        if not tmdb_client.enabled:
+            return 503, TMDB_DISABLED, {}
+
+        (tv_details, torrent_results), season_details = await asyncio.gather(
+            show_with_torrents(tv_id, season_number, None, args),
+            tmdb_client.get_tv_season_details(tv_id, season_number)
+        )
+
+        if not tv_details:
+            return 404, {
+                'status': 'error',
+                'message': 'TV show not found'
+            }, {}
+
+        if not season_details:
+            return 404, {
+                'status': 'error',
+                'message': 'Season not found'
+            }, {}
+
+        return 200, {
+            'status': 'success',
+            'tv_show_name': tv_details.get('name'),
+            'season_details': format_tmdb_details(season_details),
+            'torrent_count': len(torrent_results),
+            'torrent_results': torrent_results
+        }, {}
+
+    except RateLimitExceeded as e:
+        return rate_limited_response(e)
+    except Exception as e:
+        logging.error(f'Season details with torrents failed: {e}')
+        return 500, {
+            'status': 'error',
+            'message': f'Failed to get season details: {str(e)}'
+        }, {}
+
+async def get_episode_details_with_torrents(args, tv_id, season_number, episode_number):
+    """Get TV episode details with available torrent links"""
+    try:
+        if not tmdb_client.enabled:
+            return 503, TMDB_DISABLED, {}
+
+        (tv_details, torrent_results), episode_details = await asyncio.gather(
+            show_with_torrents(tv_id, season_number, episode_number, args),
+            tmdb_client.get_tv_episode_details(tv_id, season_number, episode_number)
+        )
+
+        if not tv_details:
+            return 404, {
+                'status': 'error',
+                'message': 'TV show not found'
+            }, {}
+
+        if not episode_details:
+            return 404, {
+                'status': 'error',
+                'message': 'Episode not found'
+            }, {}
+
+        return 200, {
+            'status': 'success',
+            'tv_show_name': tv_details.get('name'),
+            'episode_details': format_tmdb_details(episode_details),
+            'torrent_count': len(torrent_results),
+            'torrent_results': torrent_results
+        }, {}
+
+    except RateLimitExceeded as e:
+        return rate_limited_response(e)
+    except Exception as e:
+        logging.error(f'Episode details with torrents failed: {e}')
+        return 500, {
+            'status': 'error',
+            'message': f'Failed to get episode details: {str(e)}'
+        }, {}
+
+# (path pattern, Flask endpoint name, handler) - handlers take (query args, *path params)
+# and return (status, body, headers); the endpoint names keep metrics labels identical
+ASYNC_ROUTES = [
+    (re.compile(r'/details/tv/(\d+)/season/(\d+)/episode/(\d+)'), 'search.get_episode_details_with_torrents',
+     lambda args, tv_id, season, episode: get_episode_details_with_torrents(args, int(tv_id), int(season), int(episode))),
+    (re.compile(r'/details/tv/(\d+)/season/(\d+)'), 'search.get_season_details_with_torrents',
+     lambda args, tv_id, season: get_season_details_with_torrents(args, int(tv_id), int(season))),
+    (re.compile(r'/details/([^/]+)/(\d+)'), 'search.get_details_with_torrents',
+     lambda args, content_type, tmdb_id: get_details_with_torrents(args, content_type, int(tmdb_id))),
+]
+
+def match_async_route(path):
+    """(endpoint name, handler, path params) for a path served natively, or None"""
+    for pattern, endpoint, handler in ASYNC_ROUTES:
+        match = pattern.fullmatch(path)
+        if match:
+            return endpoint, handler, match.groups()
+    return None
@@ -0,0 +1,34 @@
+import logging
+from flask import Blueprint, jsonify
+from services.home_feed import HomeFeed
+from routes.search_routes import tmdb_client
+
+# Create blueprint
+feed_bp = Blueprint('feed', __name__)
+
+# Snapshots are rebuilt in the background (started by create_app); only a request that finds
+# no snapshot yet builds one itself
+home_feed = HomeFeed(tmdb_client)
+
+@feed_bp.route('/home', methods=['GET'])
+def get_home_feed():
+    """Home screen carousel and rails from the latest pre-serialized snapshot (built on first use)"""
+    if not tmdb_client.enabled:
+        return jsonify({
+            'status': 'error',
+            'message': 'TMDB service not available - API key not configured',
+            'hint': 'Set TMDB_API_KEY in your .env file to enable TMDB features'
+        }), 503
+    
+    try:
+        snapshot = home_feed.current()
+    except Exception as e:
+        logging.error(f'Home feed build failed: {e}')
+        response = jsonify({
+            'status': 'error',
+            'message': 'Home feed is not available yet - try again shortly'
+        })
+        response.headers['Retry-After'] = '5'
+        return response, 503
+    
+    return snapshot.to_response()
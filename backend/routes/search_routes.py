@@ -1,12 +1,21 @@
 from flask import Blueprint, jsonify, request
 import logging
+import math
+from functools import partial
 from services.torrent_finder import TorrentFinder
 from services.tmdb_client import TMDBClient
 from utils.formatters import (
     format_tmdb_search_results, 
     format_tmdb_details, 
-    search_torrents_for_title
+    format_torrent_results,
+    iter_torrent_batches,
+    TorrentBatches,
+    search_torrents_for_title,
+    TorrentMerger
 )
+from utils.concurrency import TaskGraph, run_lookups_concurrently
+from utils.rate_limit import RateLimitExceeded
+from utils.streaming import STREAM_FORMATS, event_stream_response
 from config import Config
 
 # Create blueprint
@@ -16,6 +25,132 @@ search_bp = Blueprint('search', __name__)
 torrent_finder = TorrentFinder()
 tmdb_client = TMDBClient()
 
+def use_torrent_cache():
+    """Whether cached torrent results may be served (opt out with ?cache=false)"""
+    return request.args.get('cache', 'true').lower() not in ('false', '0', 'no')
+
+def torrent_limit():
+    """Maximum number of torrents to return (?limit=N), or None for all of them"""
+    limit = request.args.get('limit', type=int)
+    return limit if limit and limit > 0 else None
+
+def requested_stream_format():
+    """Streaming format asked for with ?stream=ndjson|sse, or None for one JSON response"""
+    return request.args.get('stream', '').lower() or None
+
+def unsupported_stream_response(stream_format):
+    return jsonify({
+        'status': 'error',
+        'message': f'Unsupported stream format "{stream_format}" - use ndjson or sse'
+    }), 400
+
+def start_torrent_batches(title, content_type, season=None, episode=None, use_cache=True):
+    """Start the category searches for a title; returns (merger, batches) for stream_details_with_torrents"""
+    merger = TorrentMerger()
+    if not title:
+        return merger, TorrentBatches()
+    return merger, iter_torrent_batches(torrent_finder, title, content_type, season, episode, use_cache, merger)
+
+def start_show_torrent_batches(tv_details, season=None, episode=None, use_cache=True):
+    """Start season/episode torrent searches once the show name is known (TaskGraph task)"""
+    show_name = tv_details.get('name') if tv_details else None
+    return start_torrent_batches(show_name, 'tv', season, episode, use_cache)
+
+def discard_torrent_batches(torrent_batches):
+    """Stop started torrent searches whose results will never be streamed (also a TaskGraph cleanup)"""
+    _, batches = torrent_batches
+    batches.close()
+
+def stream_details_with_torrents(stream_format, details_payload, torrent_batches):
+    """
+    Stream a details response: the formatted TMDB details first, then each
+    torrent category as its search finishes, then the merged ranking.
+    
+    torrent_batches comes from start_torrent_batches(), so the searches may
+    already have been running alongside the TMDB lookups; categories that
+    finished meanwhile are sent straight after the details.
+    """
+    limit = torrent_limit()
+    merger, batches = torrent_batches
+    
+    def events():
+        yield 'details', details_payload
+        
+        # A client that disconnects closes this generator; stop the searches it no longer waits for
+        try:
+            for category, query, results in batches:
+                batch = format_torrent_results(results, limit)
+                yield 'torrents', {
+                    'category': category,
+                    'query': query,
+                    'torrent_count': len(batch),
+                    'torrent_results': batch
+                }
+        finally:
+            batches.close()
+        
+        torrent_results = format_torrent_results(merger.results(), limit)
+        yield 'summary', {
+            'status': 'success',
+            'torrent_count': len(torrent_results),
+            'torrent_results': torrent_results
+        }
+    
+    return event_stream_response(events(), stream_format)
+
+def rate_limited_response(error):
+    """503 telling the client when to retry after TMDB throttling"""
+    retry_after = max(1, math.ceil(error.retry_after))
+    response = jsonify({
+        'status': 'error',
+        'message': 'TMDB rate limit reached - try again later',
+        'retry_after': retry_after
+    })
+    response.headers['Retry-After'] = str(retry_after)
+    return response, 503
+
+# Batch search type -> TMDBClient method name
+BATCH_SEARCHES = {
+    'movie': 'search_movie',
+    'tv': 'search_tv_show',
+    'multi': 'search_multi'
+}
+
+def resolve_batch_search(search_type, query):
+    """Run one batch entry; throttled entries fail individually instead of failing the batch"""
+    try:
+        results = getattr(tmdb_client, BATCH_SEARCHES[search_type])(query)
+    except RateLimitExceeded as e:
+        return {
+            'status': 'error',
+            'message': 'TMDB rate limit reached - try again later',
+            'retry_after': max(1, math.ceil(e.retry_after)),
+            'count': 0,
+            'results': []
+        }
+    
+    formatted_results = format_tmdb_search_results(results)
+    return {
+        'status': 'success',
+        'count': len(formatted_results),
+        'results': formatted_results
+    }
+
+def search_show_torrents(tv_details, season=None, episode=None, use_cache=True, limit=None):
+    """Search season/episode torrents once the show name is known"""
+    show_name = tv_details.get('name') if tv_details else None
+    if not show_name:
+        return []
+    return search_torrents_for_title(
+        torrent_finder, 
+        show_name, 
+        'tv',
+        season=season,
+        episode=episode,
+        use_cache=use_cache,
+        limit=limit
+    )
+
 @search_bp.route('/search/<query>', methods=['GET'])
 def search_multi(query):
     """General search returning top 5 TMDB results (movies and TV shows)"""
@@ -38,6 +173,8 @@ def search_multi(query):
             'results': formatted_results
         })
         
+    except RateLimitExceeded as e:
+        return rate_limited_response(e)
     except Exception as e:
         logging.error(f'Multi search failed: {e}')
         return jsonify({
@@ -67,6 +204,8 @@ def search_movies(query):
             'results': formatted_results
         })
         
+    except RateLimitExceeded as e:
+        return rate_limited_response(e)
     except Exception as e:
         logging.error(f'Movie search failed: {e}')
         return jsonify({
@@ -96,6 +235,8 @@ def search_tv_shows(query):
             'results': formatted_results
         })
         
+    except RateLimitExceeded as e:
+        return rate_limited_response(e)
     except Exception as e:
         logging.error(f'TV show search failed: {e}')
         return jsonify({
@@ -103,6 +244,67 @@ def search_tv_shows(query):
             'message': f'TV show search failed: {str(e)}'
         }), 500
 
+@search_bp.route('/batch/search', methods=['POST'])
+def batch_search():
+    """Resolve a list of typed searches concurrently in one round trip"""
+    try:
+        if not tmdb_client.enabled:
+            return jsonify({
+                'status': 'error',
+                'message': 'TMDB service not available - API key not configured',
+                'hint': 'Set TMDB_API_KEY in your .env file to enable TMDB features'
+            }), 503
+        
+        body = request.get_json(silent=True)
+        queries = body.get('queries') if isinstance(body, dict) else None
+        if not isinstance(queries, list) or not queries:
+            return jsonify({
+                'status': 'error',
+                'message': 'Request body must contain a non-empty "queries" list'
+            }), 400
+        
+        if len(queries) > Config.BATCH_MAX_QUERIES:
+            return jsonify({
+                'status': 'error',
+                'message': f'Too many queries (max {Config.BATCH_MAX_QUERIES})'
+            }), 400
+        
+        # Normalize and validate, keeping request order
+        requested = []
+        for item in queries:
+            search_type = item.get('type', 'multi') if isinstance(item, dict) else None
+            query = item.get('query') if isinstance(item, dict) else None
+            if search_type not in BATCH_SEARCHES or not isinstance(query, str) or not query.strip():
+                return jsonify({
+                    'status': 'error',
+                    'message': 'Each query needs a non-empty "query" and a "type" of movie, tv or multi'
+                }), 400
+            requested.append((search_type, query.strip()))
+        
+        # Identical searches are resolved once
+        unique = list(dict.fromkeys((search_type, query.lower()) for search_type, query in requested))
+        resolved = dict(zip(unique, run_lookups_concurrently(
+            [(resolve_batch_search, search_type, query) for search_type, query in unique]
+        )))
+        
+        results = []
+        for search_type, query in requested:
+            entry = resolved[(search_type, query.lower())]
+            results.append(dict(entry, type=search_type, query=query))
+        
+        return jsonify({
+            'status': 'success',
+            'count': len(results),
+            'results': results
+        })
+        
+    except Exception as e:
+        logging.error(f'Batch search failed: {e}')
+        return jsonify({
+            'status': 'error',
+            'message': f'Batch search failed: {str(e)}'
+        }), 500
+
 @search_bp.route('/details/<content_type>/<int:tmdb_id>', methods=['GET'])
 def get_details_with_torrents(content_type, tmdb_id):
     """Get detailed TMDB info with available torrent links"""
@@ -120,17 +322,18 @@ def get_details_with_torrents(content_type, tmdb_id):
                 'message': 'Content type must be "movie" or "tv"'
             }), 400
         
+        stream_format = requested_stream_format()
+        if stream_format and stream_format not in STREAM_FORMATS:
+            return unsupported_stream_response(stream_format)
+        
         # Get detailed TMDB information
         if content_type == 'movie':
-            details = tmdb_client.get_movie_details(tmdb_id)
+            # Details and credits (cast and crew) in a single TMDB round trip
+            details = tmdb_client.get_movie_details(tmdb_id, append_to_response=['credits'])
             title = details.get('title') if details else None
-            
-            # Get movie credits (cast and crew)
-            credits = tmdb_client.get_movie_credits(tmdb_id) if details else None
         else:  # tv
             details = tmdb_client.get_tv_details(tmdb_id)
             title = details.get('name') if details else None
-            credits = None  # TV credits not implemented yet
         
         if not details:
             return jsonify({
@@ -138,8 +341,15 @@ def get_details_with_torrents(content_type, tmdb_id):
                 'message': 'Content not found'
             }), 404
         
-        # Format TMDB details with credits integrated
-        formatted_details = format_tmdb_details(details, credits)
+        # Format TMDB details with appended credits integrated
+        formatted_details = format_tmdb_details(details)
+        
+        if stream_format:
+            return stream_details_with_torrents(
+                stream_format,
+                {'status': 'success', 'tmdb_details': formatted_details},
+                start_torrent_batches(title, content_type, use_cache=use_torrent_cache())
+            )
         
         # Search for torrents
         torrent_results = []
@@ -147,7 +357,9 @@ def get_details_with_torrents(content_type, tmdb_id):
             torrent_results = search_torrents_for_title(
                 torrent_finder, 
                 title, 
-                content_type
+                content_type,
+                use_cache=use_torrent_cache(),
+                limit=torrent_limit()
             )
         
         return jsonify({
@@ -157,6 +369,8 @@ def get_details_with_torrents(content_type, tmdb_id):
             'torrent_results': torrent_results
         })
         
+    except RateLimitExceeded as e:
+        return rate_limited_response(e)
     except Exception as e:
         logging.error(f'Details with torrents failed: {e}')
         return jsonify({
@@ -175,16 +389,49 @@ def get_season_details_with_torrents(tv_id, season_number):
                 'hint': 'Set TMDB_API_KEY in your .env file to enable TMDB features'
             }), 503
         
-        # Get TV show details first to get the show name
-        tv_details = tmdb_client.get_tv_details(tv_id)
+        stream_format = requested_stream_format()
+        if stream_format and stream_format not in STREAM_FORMATS:
+            return unsupported_stream_response(stream_format)
+        
+        # Show details and season details are independent; torrents only need the show name
+        graph = (
+            TaskGraph()
+            .add('tv_details', tmdb_client.get_tv_details, tv_id)
+            .add('season_details', tmdb_client.get_tv_season_details, tv_id, season_number)
+        )
+        if stream_format:
+            # Only starts the searches, so they overlap the season lookup and stream once it is back
+            graph.add(
+                'torrent_batches',
+                partial(start_show_torrent_batches, season=season_number, use_cache=use_torrent_cache()),
+                after=['tv_details'],
+                cleanup=discard_torrent_batches
+            )
+        else:
+            graph.add(
+                'torrent_results',
+                partial(
+                    search_show_torrents,
+                    season=season_number,
+                    use_cache=use_torrent_cache(),
+                    limit=torrent_limit()
+                ),
+                after=['tv_details']
+            )
+        results = graph.run()
+        
+        tv_details = results['tv_details']
+        season_details = results['season_details']
+        if stream_format and not (tv_details and season_details):
+            # Nothing will be streamed, so stop the torrent searches that have not started yet
+            discard_torrent_batches(results['torrent_batches'])
+        
         if not tv_details:
             return jsonify({
                 'status': 'error',
                 'message': 'TV show not found'
             }), 404
         
-        # Get season details
-        season_details = tmdb_client.get_tv_season_details(tv_id, season_number)
         if not season_details:
             return jsonify({
                 'status': 'error',
@@ -193,18 +440,17 @@ def get_season_details_with_torrents(tv_id, season_number):
         
         # Format season details
         formatted_season = format_tmdb_details(season_details)
-        
-        # Search for season torrents
         show_name = tv_details.get('name')
-        torrent_results = []
-        if show_name:
-            torrent_results = search_torrents_for_title(
-                torrent_finder, 
-                show_name, 
-                'tv',
-                season=season_number
+        
+        if stream_format:
+            return stream_details_with_torrents(
+                stream_format,
+                {'status': 'success', 'tv_show_name': show_name, 'season_details': formatted_season},
+                results['torrent_batches']
             )
         
+        torrent_results = results['torrent_results']
+        
         return jsonify({
             'status': 'success',
             'tv_show_name': show_name,
@@ -213,6 +459,8 @@ def get_season_details_with_torrents(tv_id, season_number):
             'torrent_results': torrent_results
         })
         
+    except RateLimitExceeded as e:
+        return rate_limited_response(e)
     except Exception as e:
         logging.error(f'Season details with torrents failed: {e}')
         return jsonify({
@@ -231,16 +479,55 @@ def get_episode_details_with_torrents(tv_id, season_number, episode_number):
                 'hint': 'Set TMDB_API_KEY in your .env file to enable TMDB features'
             }), 503
         
-        # Get TV show details first to get the show name
-        tv_details = tmdb_client.get_tv_details(tv_id)
+        stream_format = requested_stream_format()
+        if stream_format and stream_format not in STREAM_FORMATS:
+            return unsupported_stream_response(stream_format)
+        
+        # Show details and episode details are independent; torrents only need the show name
+        graph = (
+            TaskGraph()
+            .add('tv_details', tmdb_client.get_tv_details, tv_id)
+            .add('episode_details', tmdb_client.get_tv_episode_details, tv_id, season_number, episode_number)
+        )
+        if stream_format:
+            # Only starts the searches, so they overlap the episode lookup and stream once it is back
+            graph.add(
+                'torrent_batches',
+                partial(
+                    start_show_torrent_batches,
+                    season=season_number,
+                    episode=episode_number,
+                    use_cache=use_torrent_cache()
+                ),
+                after=['tv_details'],
+                cleanup=discard_torrent_batches
+            )
+        else:
+            graph.add(
+                'torrent_results',
+                partial(
+                    search_show_torrents,
+                    season=season_number,
+                    episode=episode_number,
+                    use_cache=use_torrent_cache(),
+                    limit=torrent_limit()
+                ),
+                after=['tv_details']
+            )
+        results = graph.run()
+        
+        tv_details = results['tv_details']
+        episode_details = results['episode_details']
+        if stream_format and not (tv_details and episode_details):
+            # Nothing will be streamed, so stop the torrent searches that have not started yet
+            discard_torrent_batches(results['torrent_batches'])
+        
         if not tv_details:
             return jsonify({
                 'status': 'error',
                 'message': 'TV show not found'
             }), 404
         
-        # Get episode details
-        episode_details = tmdb_client.get_tv_episode_details(tv_id, season_number, episode_number)
         if not episode_details:
             return jsonify({
                 'status': 'error',
@@ -249,19 +536,17 @@ def get_episode_details_with_torrents(tv_id, season_number, episode_number):
         
         # Format episode details
         formatted_episode = format_tmdb_details(episode_details)
-        
-        # Search for episode torrents
         show_name = tv_details.get('name')
-        torrent_results = []
-        if show_name:
-            torrent_results = search_torrents_for_title(
-                torrent_finder, 
-                show_name, 
-                'tv',
-                season=season_number,
-                episode=episode_number
+        
+        if stream_format:
+            return stream_details_with_torrents(
+                stream_format,
+                {'status': 'success', 'tv_show_name': show_name, 'episode_details': formatted_episode},
+                results['torrent_batches']
             )
         
+        torrent_results = results['torrent_results']
+        
         return jsonify({
             'status': 'success',
             'tv_show_name': show_name,
@@ -270,6 +555,8 @@ def get_episode_details_with_torrents(tv_id, season_number, episode_number):
             'torrent_results': torrent_results
         })
         
+    except RateLimitExceeded as e:
+        return rate_limited_response(e)
     except Exception as e:
         logging.error(f'Episode details with torrents failed: {e}')
         return jsonify({
@@ -0,0 +1,32 @@
+import httpx
+from config import Config
+
+_client = None
+
+def get_async_client():
+    """
+    Process-wide async HTTP client shared by the async TMDB client and torrent finder.
+
+    One connection pool (ASYNC_MAX_CONNECTIONS) serves every in-flight upstream
+    call, so thousands of slow scrapes wait on sockets rather than threads.
+    Must be used from a single event loop (the ASGI server's).
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=Config.ASYNC_MAX_CONNECTIONS,
+                max_keepalive_connections=Config.ASYNC_MAX_KEEPALIVE
+            ),
+            # Connection errors are retried by the transport; status codes by the callers
+            transport=httpx.AsyncHTTPTransport(retries=Config.TORRENT_MAX_RETRIES),
+            follow_redirects=True
+        )
+    return _client
+
+async def close_async_client():
+    """Close the shared client and its pooled connections (on ASGI shutdown)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,244 @@
+import asyncio
+import copy
+import logging
+import time
+import httpx
+from config import Config
+from services.async_http import get_async_client
+from services.response_cache import make_cache_key
+from services.tmdb_client import TMDBClientBase, rate_limiter, _refreshing_keys, _refreshing_lock
+from utils.concurrency import AsyncSingleFlight
+from utils.metrics import CACHE_LOOKUPS, UpstreamCall
+from utils.rate_limit import RateLimitExceeded
+from utils.tracing import Span
+
+# Coalesces identical in-flight TMDB calls on the event loop
+tmdb_flight = AsyncSingleFlight()
+
+# Strong references to background refreshes so they are not garbage collected mid-flight
+_refresh_tasks = set()
+
+class AsyncTMDBClient(TMDBClientBase):
+    """
+    Async TMDB client for the ASGI serving mode.
+
+    Shares configuration, the response cache, the rate limiter and the
+    response shaping helpers with TMDBClient (through TMDBClientBase, so no
+    requests session is built); only the network calls differ.
+    Requests go through the process-wide httpx pool, so a slow TMDB parks a
+    coroutine instead of a thread. The SQLite cache lookups stay inline - they
+    take microseconds.
+    """
+
+    def __init__(self, response_cache=None, client=None):
+        super().__init__(response_cache)
+        self._client = client
+
+    @property
+    def client(self):
+        return self._client or get_async_client()
+
+    async def _make_request(self, url, params=None, timeout=15, use_cache=True):
+        """Make a request, serving fresh (or stale while revalidating) cached responses"""
+        with Span('tmdb', self._endpoint(url)):
+            return await self._cached_request(url, params, timeout, use_cache)
+
+    async def _cached_request(self, url, params=None, timeout=15, use_cache=True):
+        if not self.enabled:
+            logging.warning("TMDB client is disabled - API key not configured")
+            return None
+
+        if not (use_cache and self.response_cache):
+            return await self._fetch_coalesced(url, params, timeout)
+
+        cache_key = make_cache_key(url, params)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            data, stored_at = cached
+            age = time.time() - stored_at
+            ttl = self._cache_ttl(url)
+            if age < ttl:
+                CACHE_LOOKUPS.labels('tmdb', 'hit').inc()
+                return data
+            if age < ttl + Config.TMDB_CACHE_STALE_TTL:
+                CACHE_LOOKUPS.labels('tmdb', 'stale').inc()
+                self._refresh_in_background(cache_key, url, params, timeout)
+                return data
+
+        CACHE_LOOKUPS.labels('tmdb', 'miss').inc()
+        try:
+            return await self._fetch_and_store(cache_key, url, params, timeout)
+        except RateLimitExceeded:
+            # An expired copy beats failing when TMDB is throttling us
+            if cached is not None:
+                return cached[0]
+            raise
+
+    async def _fetch_and_store(self, cache_key, url, params, timeout):
+        """Fetch from TMDB and store successful responses in the cache"""
+        data = await self._fetch_coalesced(url, params, timeout)
+        if data is not None:
+            self.response_cache.set(cache_key, data)
+        return data
+
+    def _refresh_in_background(self, cache_key, url, params, timeout):
+        """Refresh a stale cache entry in a task without blocking the caller"""
+        with _refreshing_lock:
+            if cache_key in _refreshing_keys:
+                return
+            _refreshing_keys.add(cache_key)
+
+        async def refresh():
+            try:
+                await self._fetch_and_store(cache_key, url, params, timeout)
+            except RateLimitExceeded as e:
+                logging.warning(f"TMDB cache refresh skipped: {e}")
+            finally:
+                with _refreshing_lock:
+                    _refreshing_keys.discard(cache_key)
+
+        task = asyncio.create_task(refresh())
+        _refresh_tasks.add(task)
+        task.add_done_callback(_refresh_tasks.discard)
+
+    async def _fetch_coalesced(self, url, params=None, timeout=15):
+        """Fetch via the async single-flight so concurrent identical requests hit TMDB once"""
+        data, shared = await tmdb_flight.do(make_cache_key(url, params), self._fetch, url, params, timeout)
+        # Callers may mutate the payload, so a shared result is copied per caller
+        return copy.deepcopy(data) if shared else data
+
+    async def _fetch(self, url, params=None, timeout=15):
+        """
+        Fetch a TMDB endpoint, paced by the shared token bucket.
+
+        Same contract as TMDBClient._fetch: RateLimitExceeded when throttled,
+        None on any other failure. 5xx answers are retried with backoff up to
+        TMDB_MAX_RETRIES times.
+        """
+        wait = rate_limiter.reserve(Config.TMDB_RATE_LIMIT_MAX_WAIT)
+        if wait is None:
+            raise RateLimitExceeded(rate_limiter.retry_after())
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        try:
+            with UpstreamCall('tmdb', self._endpoint(url)) as call:
+                for attempt in range(Config.TMDB_MAX_RETRIES + 1):
+                    response = await self.client.get(url, headers=self.headers, params=params, timeout=timeout)
+                    if response.status_code not in (500, 502, 503, 504) or attempt == Config.TMDB_MAX_RETRIES:
+                        break
+                    await asyncio.sleep(0.2 * 2 ** attempt)
+                call.status = response.status_code
+
+            # Handle rate limiting - pause every caller rather than sleeping in this one
+            if response.status_code == 429:
+                retry_after = self._parse_retry_after(response)
+                logging.warning(f"TMDB rate limit hit. Pausing TMDB calls for {retry_after} seconds")
+                rate_limiter.pause(retry_after)
+                raise RateLimitExceeded(retry_after)
+
+            response.raise_for_status()
+            return response.json()
+
+        except RateLimitExceeded:
+            raise
+        except httpx.TimeoutException as e:
+            logging.error(f"TMDB request timeout: {e}")
+            return None
+        except httpx.TransportError as e:
+            logging.error(f"TMDB connection error: {e}")
+            return None
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 401:
+                logging.error("TMDB authentication failed - check your API key")
+            elif e.response.status_code == 404:
+                logging.warning("TMDB resource not found")
+            else:
+                logging.error(f"TMDB HTTP error: {e}")
+            return None
+        except Exception as e:
+            logging.error(f"TMDB unexpected error: {e}")
+            return None
+
+    async def _search(self, path, title):
+        """Top 5 results of a TMDB search endpoint"""
+        if not self.enabled:
+            return []
+
+        params = {
+            'query': title,
+            'include_adult': 'false',
+            'language': 'en-US',
+            'page': 1
+        }
+
+        data = await self._make_request(f"{self.base_url}/search/{path}", params)
+        if data:
+            return data.get('results', [])[:5]
+        return []
+
+    async def search_movie(self, title):
+        """Search for movies on TMDB"""
+        return await self._search('movie', title)
+
+    async def search_tv_show(self, title):
+        """Search for TV shows on TMDB"""
+        return await self._search('tv', title)
+
+    async def search_multi(self, title):
+        """Search for both movies and TV shows on TMDB"""
+        return await self._search('multi', title)
+
+    async def get_movie_details(self, movie_id, append_to_response=None):
+        """Get detailed movie information, optionally with appended sub-resources"""
+        if not self.enabled:
+            return None
+
+        url = f"{self.base_url}/movie/{movie_id}"
+        return self._with_trimmed_credits(await self._make_request(url, self._details_params(append_to_response)))
+
+    async def get_movie_credits(self, movie_id):
+        """Get movie credits (cast and crew)"""
+        if not self.enabled:
+            return None
+
+        data = await self._make_request(f"{self.base_url}/movie/{movie_id}/credits", {'language': 'en-US'})
+        if data:
+            return self._trim_credits(data)
+        return None
+
+    async def get_tv_details(self, tv_id, append_to_response=None):
+        """Get detailed TV show information, optionally with appended sub-resources"""
+        if not self.enabled:
+            return None
+
+        url = f"{self.base_url}/tv/{tv_id}"
+        return self._with_trimmed_credits(await self._make_request(url, self._details_params(append_to_response)))
+
+    async def get_tv_season_details(self, tv_id, season_number):
+        """Get detailed TV season information"""
+        if not self.enabled:
+            return None
+
+        url = f"{self.base_url}/tv/{tv_id}/season/{season_number}"
+        return await self._make_request(url, {'language': 'en-US'})
+
+    async def get_tv_episode_details(self, tv_id, season_number, episode_number):
+        """Get detailed TV episode information"""
+        if not self.enabled:
+            return None
+
+        url = f"{self.base_url}/tv/{tv_id}/season/{season_number}/episode/{episode_number}"
+        return await self._make_request(url, {'language': 'en-US'})
+
+    async def test_connection(self):
+        """Test TMDB API connection"""
+        if not self.enabled:
+            return False
+
+        try:
+            data = await self._make_request(f"{self.base_url}/configuration", timeout=5, use_cache=False)
+        except RateLimitExceeded as e:
+            logging.warning(f"TMDB connection test skipped: {e}")
+            return False
+        return data is not None
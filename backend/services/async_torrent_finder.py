@@ -0,0 +1,105 @@
+import asyncio
+import logging
+import httpx
+from config import Config
+from services.async_http import get_async_client
+from services.torrent_finder import TorrentFinderBase, search_cache
+from utils.concurrency import AsyncSingleFlight
+from utils.formatters import clean_title_for_search
+from utils.metrics import CACHE_LOOKUPS, UpstreamCall
+from utils.tracing import Span
+
+# Coalesces identical in-flight mirror fetches on the event loop
+scrape_flight = AsyncSingleFlight()
+
+class AsyncTorrentFinder(TorrentFinderBase):
+    """
+    Async torrent finder for the ASGI serving mode.
+
+    Same categories, result cache and parser as TorrentFinder, but pages are
+    fetched over the process-wide httpx pool, so thousands of slow mirror
+    scrapes can be in flight without a thread each. Parsing is CPU work and
+    runs in a worker thread to keep the event loop responsive.
+    """
+
+    # Seconds before the first status retry, doubling per attempt (as the sync session's Retry backoff)
+    retry_backoff = 0.3
+
+    def __init__(self, client=None):
+        super().__init__()
+        self._client = client
+        self.async_timeout = httpx.Timeout(
+            Config.TORRENT_READ_TIMEOUT,
+            connect=Config.TORRENT_CONNECT_TIMEOUT,
+            # Waiting for a pooled connection is bounded by the caller, not a timeout
+            pool=None
+        )
+
+    @property
+    def client(self):
+        return self._client or get_async_client()
+
+    async def fetch_html(self, url, category=None):
+        """Fetch HTML content from URL, sharing the fetch with concurrent identical requests"""
+        html, _ = await scrape_flight.do(url, self._get_html, url, category)
+        return html
+
+    async def _get_html(self, url, category=None):
+        """
+        Fetch HTML content from URL over the shared async pool.
+
+        5xx answers are retried with backoff up to TORRENT_MAX_RETRIES times,
+        like TorrentFinder's session, so both serving modes ride out the same
+        flaky mirror (connection errors are retried by the transport).
+        """
+        with UpstreamCall('torrent_site', str(category)) as call:
+            for attempt in range(Config.TORRENT_MAX_RETRIES + 1):
+                response = await self.client.get(url, headers=self.headers, timeout=self.async_timeout)
+                if response.status_code not in (500, 502, 503, 504) or attempt == Config.TORRENT_MAX_RETRIES:
+                    break
+                await asyncio.sleep(self.retry_backoff * 2 ** attempt)
+            call.status = response.status_code
+        response.raise_for_status()
+        return response.text
+
+    async def search_all(self, query, use_cache=True):
+        """Search all categories"""
+        return await self._search_category(query, 0, 'Search', use_cache)
+
+    async def search_hd_movies(self, query, use_cache=True):
+        """Search HD movies category"""
+        return await self._search_category(query, 207, 'HD movie search', use_cache)
+
+    async def search_movies(self, query, use_cache=True):
+        """Search movies category"""
+        return await self._search_category(query, 201, 'Movie search', use_cache)
+
+    async def search_hd_tv_shows(self, query, use_cache=True):
+        """Search HD TV shows category"""
+        return await self._search_category(query, 208, 'HD TV search', use_cache)
+
+    async def search_tv_shows(self, query, use_cache=True):
+        """Search TV shows category"""
+        return await self._search_category(query, 205, 'TV search', use_cache)
+
+    async def _search_category(self, query, category, label, use_cache=True):
+        """Search a single category, serving repeat lookups from the shared result cache"""
+        cache_key = (category, clean_title_for_search(query).lower())
+        if use_cache:
+            cached = search_cache.get(cache_key)
+            CACHE_LOOKUPS.labels('torrent_search', 'miss' if cached is None else 'hit').inc()
+            if cached is not None:
+                return list(cached)
+
+        try:
+            url = f'{self.scheme}://{self.base_domain}/search/{query}/1/99/{category}'
+            with Span('scrape', f'{category} {query}'):
+                html = await self.fetch_html(url, category)
+            results = await asyncio.to_thread(self._parse_results, html)
+        except Exception as e:
+            logging.error(f'{label} failed: {e}')
+            return []
+
+        # Failed scrapes are not cached so the next request retries the mirror
+        search_cache.set(cache_key, results)
+        return list(results)
@@ -0,0 +1,121 @@
+import logging
+import threading
+import time
+from config import Config
+from services.tmdb_client import TMDBClient
+from services.torrent_finder import TorrentFinder
+
+# Upstreams the API cannot serve without; the rest only degrade responses when down
+CRITICAL_UPSTREAMS = ('torrent_site',)
+
+class HealthProber:
+    """Probes TMDB and the torrent mirror in the background and caches the results"""
+
+    def __init__(self, tmdb_client=None, torrent_finder=None, interval=None):
+        self.tmdb_client = tmdb_client or TMDBClient()
+        self.torrent_finder = torrent_finder or TorrentFinder()
+        self.interval = Config.HEALTH_PROBE_INTERVAL if interval is None else interval
+        self._results = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start the background probe loop (no-op if already running or disabled)"""
+        if self.interval <= 0 or (self._thread and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='health-prober', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background probe loop"""
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.probe_once()
+            except Exception as e:
+                logging.error(f"Health probe failed: {e}")
+            self._stop.wait(self.interval)
+
+    def probe_once(self):
+        """Probe every upstream once and store the results"""
+        results = {
+            'tmdb': self._probe_tmdb(),
+            'torrent_site': self._probe_torrent_site()
+        }
+        with self._lock:
+            self._results = results
+        return results
+
+    def _probe_tmdb(self):
+        if not self.tmdb_client.enabled:
+            return self._result('disabled', None)
+
+        started = time.perf_counter()
+        connected = self.tmdb_client.test_connection()
+        return self._result('up' if connected else 'down', started)
+
+    def _probe_torrent_site(self):
+        url = f"{self.torrent_finder.scheme}://{self.torrent_finder.base_domain}/"
+        started = time.perf_counter()
+        try:
+            response = self.torrent_finder.session.head(
+                url,
+                timeout=self.torrent_finder.timeout,
+                allow_redirects=True
+            )
+            status = 'up' if response.status_code < 500 else 'down'
+        except Exception as e:
+            logging.warning(f"Torrent site probe failed: {e}")
+            status = 'down'
+        return self._result(status, started)
+
+    def _result(self, status, started):
+        return {
+            'status': status,
+            'latency_ms': round((time.perf_counter() - started) * 1000, 1) if started is not None else None,
+            'checked_at': time.time()
+        }
+
+    def snapshot(self):
+        """Latest probe results with their age in seconds"""
+        with self._lock:
+            results = dict(self._results)
+
+        now = time.time()
+        return {
+            name: dict(result, age_seconds=round(now - result['checked_at'], 1))
+            for name, result in results.items()
+        }
+
+    def is_ready(self):
+        """
+        Ready once a recent probe found the torrent mirror up.
+
+        TMDB being down does not take the instance out of rotation (see
+        degraded()): searches fail but torrent lookups still work, and every
+        instance shares the same TMDB anyway. With background probing disabled
+        (interval <= 0) nothing refreshes the results, so readiness does not
+        depend on them and is always true.
+        """
+        if self.interval <= 0:
+            return True
+
+        snapshot = self.snapshot()
+        max_age = max(self.interval, 1) * 3
+        return all(
+            name in snapshot
+            and snapshot[name]['status'] in ('up', 'disabled')
+            and snapshot[name]['age_seconds'] <= max_age
+            for name in CRITICAL_UPSTREAMS
+        )
+
+    def degraded(self):
+        """Non-critical upstreams the latest probe found down"""
+        return sorted(
+            name for name, result in self.snapshot().items()
+            if name not in CRITICAL_UPSTREAMS and result['status'] == 'down'
+        )
@@ -0,0 +1,187 @@
+import logging
+import threading
+from datetime import datetime, timezone
+from config import Config
+from services.tmdb_client import TMDBClient
+from utils.concurrency import SingleFlight, run_lookups_concurrently
+from utils.formatters import format_tmdb_search_results
+from utils.rate_limit import RateLimitExceeded
+from utils.static_response import PrecomputedResponse
+
+# Searches behind the hero carousel; the first TMDB result of each is shown
+FEATURED_SEARCHES = [
+    ('movie', 'inception'),
+    ('tv', 'breaking bad'),
+    ('movie', 'the dark knight'),
+    ('tv', 'game of thrones'),
+    ('movie', 'interstellar'),
+    ('tv', 'stranger things'),
+    ('movie', 'the godfather'),
+    ('tv', 'the office'),
+    ('movie', 'pulp fiction'),
+    ('tv', 'friends'),
+    ('movie', 'fight club'),
+    ('tv', 'the wire'),
+]
+
+# Home screen rails as (key, title, searches)
+HOME_SECTIONS = [
+    ('top-picks', 'Top picks for you', [
+        ('movie', 'inception'),
+        ('movie', 'the dark knight'),
+        ('movie', 'interstellar'),
+        ('movie', 'fight club'),
+        ('movie', 'the matrix'),
+        ('movie', 'the godfather'),
+    ]),
+    ('continue-watching', 'Continue watching for you', [
+        ('tv', 'breaking bad'),
+        ('tv', 'game of thrones'),
+        ('tv', 'stranger things'),
+        ('tv', 'the wire'),
+    ]),
+    ('action-movies', 'Action movies', [
+        ('movie', 'the dark knight'),
+        ('movie', 'the matrix'),
+        ('movie', 'inception'),
+        ('movie', 'fight club'),
+    ]),
+    ('drama-content', 'Award-winning dramas', [
+        ('movie', 'the godfather'),
+        ('movie', 'the shawshank redemption'),
+        ('movie', 'pulp fiction'),
+        ('tv', 'the sopranos'),
+    ]),
+    ('comedy-shows', 'Comedy shows', [
+        ('tv', 'the office'),
+        ('tv', 'friends'),
+    ]),
+]
+
+# Search type -> TMDBClient method name
+FEED_SEARCHES = {
+    'movie': 'search_movie',
+    'tv': 'search_tv_show'
+}
+
+class HomeFeed:
+    """
+    Builds the home screen rails from TMDB and keeps the latest snapshot
+    pre-serialized, so serving it costs no upstream calls. The first request
+    builds it if nothing has yet; a background loop keeps it fresh.
+    """
+
+    def __init__(self, tmdb_client=None, interval=None):
+        self.tmdb_client = tmdb_client or TMDBClient()
+        self.interval = Config.HOME_FEED_REFRESH_MINUTES * 60 if interval is None else interval
+        self._items = {}  # (type, query) -> first formatted result
+        self._response = None
+        self._payload = None
+        self._lock = threading.Lock()
+        self._builds = SingleFlight()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start the background refresh loop (no-op if already running or disabled)"""
+        if self.interval <= 0 or not self.tmdb_client.enabled or (self._thread and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='home-feed', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background refresh loop"""
+        self._stop.set()
+
+    def _run(self):
+        # A snapshot built before start() (warm-up) is fresh for a full interval
+        if self.response() is not None:
+            self._stop.wait(self.interval)
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+                delay = self.interval
+            except Exception as e:
+                logging.error(f"Home feed refresh failed: {e}")
+                # Retry sooner than a full interval while there is nothing (new) to serve
+                delay = min(self.interval, 60)
+            self._stop.wait(delay)
+
+    def _search(self, search_type, query):
+        try:
+            results = getattr(self.tmdb_client, FEED_SEARCHES[search_type])(query)
+        except RateLimitExceeded as e:
+            logging.warning(f"Home feed search '{query}' throttled: {e}")
+            return None
+        formatted_results = format_tmdb_search_results(results[:1])
+        return formatted_results[0] if formatted_results else None
+
+    def refresh(self):
+        """Run every rail search once and publish a new snapshot"""
+        searches = list(dict.fromkeys(
+            FEATURED_SEARCHES + [search for _, _, searches in HOME_SECTIONS for search in searches]
+        ))
+        found = run_lookups_concurrently(
+            [(self._search, search_type, query) for search_type, query in searches]
+        )
+
+        # A failed search keeps the item from the previous snapshot
+        items = dict(self._items)
+        items.update({search: item for search, item in zip(searches, found) if item})
+        if not items:
+            raise RuntimeError('no TMDB results for any home feed search')
+
+        def pick(searches):
+            return [items[search] for search in searches if search in items]
+
+        sections = []
+        for key, title, section_searches in HOME_SECTIONS:
+            results = pick(section_searches)
+            sections.append({
+                'key': key,
+                'title': title,
+                'count': len(results),
+                'results': results
+            })
+
+        featured = pick(FEATURED_SEARCHES)
+        with self._lock:
+            previous = self._payload
+        # Unchanged rails keep the published snapshot, so its ETag still answers If-None-Match
+        # with 304 (generated_at is when the content last changed, not the latest rebuild)
+        if previous is not None and previous['featured'] == featured and previous['sections'] == sections:
+            with self._lock:
+                self._items = items
+            return previous
+
+        payload = {
+            'status': 'success',
+            'generated_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'featured': featured,
+            'sections': sections
+        }
+        response = PrecomputedResponse(payload, max_age=max(int(self.interval), 60))
+
+        with self._lock:
+            self._items = items
+            self._payload = payload
+            self._response = response
+        return payload
+
+    def response(self):
+        """Latest pre-serialized snapshot, or None until the first build finishes"""
+        with self._lock:
+            return self._response
+
+    def current(self):
+        """
+        Latest snapshot, building it in the calling thread when there is none
+        yet (before the first background refresh, or with refreshing disabled).
+        Concurrent callers share a single build; raises if the build fails.
+        """
+        response = self.response()
+        if response is None:
+            self._builds.do('home', self.refresh)
+            response = self.response()
+        return response
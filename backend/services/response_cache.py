@@ -0,0 +1,77 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlencode
+
+def make_cache_key(url, params=None):
+    """Build a stable cache key from a URL and its query parameters"""
+    if not params:
+        return url
+    return f"{url}?{urlencode(sorted(params.items()))}"
+
+class SQLiteResponseCache:
+    """Persistent response cache backed by a local SQLite file"""
+
+    def __init__(self, path, max_age=None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connect()
+        if max_age:
+            self.purge_older_than(max_age)
+
+    def _connect(self):
+        self._pid = os.getpid()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        # WAL lets several worker processes share the file without blocking readers
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL)'
+        )
+
+    @property
+    def conn(self):
+        """This process's connection - a connection inherited across fork (preloaded workers) must not be used"""
+        if self._pid != os.getpid():
+            self._connect()
+        return self._conn
+
+    def get(self, key):
+        """Return (value, stored_at) for key, or None if missing"""
+        try:
+            with self._lock:
+                row = self.conn.execute(
+                    'SELECT value, stored_at FROM responses WHERE key = ?', (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logging.error(f"Response cache read failed: {e}")
+            return None
+
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1]
+
+    def set(self, key, value):
+        """Store a JSON-serializable value under key"""
+        try:
+            with self._lock:
+                self.conn.execute(
+                    'INSERT OR REPLACE INTO responses (key, value, stored_at) VALUES (?, ?, ?)',
+                    (key, json.dumps(value), time.time())
+                )
+        except sqlite3.Error as e:
+            logging.error(f"Response cache write failed: {e}")
+
+    def purge_older_than(self, max_age):
+        """Delete entries that are too old to be served even as stale"""
+        try:
+            with self._lock:
+                self.conn.execute(
+                    'DELETE FROM responses WHERE stored_at < ?', (time.time() - max_age,)
+                )
+        except sqlite3.Error as e:
+            logging.error(f"Response cache purge failed: {e}")
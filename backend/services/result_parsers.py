@@ -0,0 +1,122 @@
+import logging
+import re
+from bs4 import BeautifulSoup
+from services.torrent_result import TorrentResult
+
+try:
+    from lxml import etree, html as lxml_html
+except ImportError:
+    etree = lxml_html = None
+
+MAGNET_TITLE = "Download this torrent using magnet"
+
+# Size sits in the row description: "Uploaded 03-14 2019, Size 1.37 GiB, ULed by ..."
+# (one line of the cell text, so a title mentioning "Size" on its own line never matches)
+SIZE_PATTERN = re.compile(r'Size ([^,\n]*),')
+
+if etree is not None:
+    # Compiled once and reused for every row
+    MAGNET_XPATH = etree.XPath(f'.//a[@href and @title="{MAGNET_TITLE}"]')
+    DETLINK_XPATH = etree.XPath('.//a[contains(concat(" ", normalize-space(@class), " "), " detLink ")]')
+
+def _clean(value):
+    """Replace non-breaking spaces scraped from &nbsp; entities"""
+    return value.replace('\xa0', ' ') if value else value
+
+def _size(cell_text):
+    """Size from a result cell's text, shared by every parser so they agree on it"""
+    size_match = SIZE_PATTERN.search(cell_text)
+    return size_match.group(1) if size_match else None
+
+def parse_results_lxml(html):
+    """Fast path: parse result rows with lxml and compiled XPath selectors"""
+    if not html or not html.strip():
+        return []
+
+    results = []
+    root = lxml_html.document_fromstring(html)
+    for row in root.iter('tr'):
+        tds = list(row.iter('td'))
+        if len(tds) <= 1:
+            continue
+
+        magnet_links = MAGNET_XPATH(tds[1])
+        if not magnet_links:
+            continue
+
+        title_links = DETLINK_XPATH(tds[1])
+        if not title_links:
+            continue
+
+        title = title_links[0].get('title', '').replace('Details for ', '')
+        magnet = magnet_links[0].get('href')
+
+        if not title or not magnet:
+            continue
+
+        # Read the size from the cell text instead of re-serializing the cell
+        size = _size(tds[1].text_content())
+
+        seeders = tds[2].text_content() if len(tds) > 2 else None
+        leechers = tds[3].text_content() if len(tds) > 3 else None
+
+        results.append(TorrentResult(
+            _clean(title),
+            _clean(magnet),
+            _clean(size),
+            TorrentResult.parse_count(_clean(seeders)),
+            TorrentResult.parse_count(_clean(leechers))
+        ))
+    return results
+
+def parse_results_html_parser(html):
+    """Fallback: parse result rows with BeautifulSoup's pure-Python html.parser"""
+    soup = BeautifulSoup(html, 'html.parser')
+    results = []
+    for trs in soup.find_all('tr'):
+        tds = trs.find_all('td')
+        if len(tds) > 1:
+            magnet_link_tag = tds[1].find('a', href=True, title=MAGNET_TITLE)
+            if not magnet_link_tag:
+                continue
+
+            title_tag = tds[1].find('a', class_='detLink')
+            if not title_tag:
+                continue
+
+            title = title_tag.get('title', '').replace('Details for ', '')
+            magnet = magnet_link_tag['href']
+
+            if not title or not magnet:
+                continue
+
+            size = _size(tds[1].get_text())
+
+            seeders = tds[2].text if len(tds) > 2 else None
+            leechers = tds[3].text if len(tds) > 3 else None
+
+            results.append(TorrentResult(
+                _clean(title),
+                _clean(magnet),
+                _clean(size),
+                TorrentResult.parse_count(_clean(seeders)),
+                TorrentResult.parse_count(_clean(leechers))
+            ))
+    return results
+
+RESULT_PARSERS = {
+    'lxml': parse_results_lxml,
+    'html.parser': parse_results_html_parser
+}
+
+def get_result_parser(name):
+    """Return the configured result parser, falling back to html.parser"""
+    if name == 'lxml' and etree is None:
+        logging.warning("lxml not installed - falling back to html.parser for torrent results")
+        return parse_results_html_parser
+
+    parser = RESULT_PARSERS.get(name)
+    if parser is None:
+        logging.warning(f"Unknown torrent result parser '{name}' - using html.parser")
+        return parse_results_html_parser
+    return parser
@@ -1,14 +1,64 @@
+import copy
 import logging
+import re
 import requests
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from config import Config
+from services.response_cache import SQLiteResponseCache, make_cache_key
+from utils.concurrency import upstream_flight
+from utils.metrics import CACHE_LOOKUPS, UpstreamCall, endpoint_template
+from utils.rate_limit import RateLimitExceeded, TokenBucket
+from utils.tracing import Span
 
-class TMDBClient:
-    """Client for The Movie Database (TMDB) API with improved error handling"""
+# Fresh lifetime (seconds) per endpoint path - first match wins, else TMDB_CACHE_DEFAULT_TTL
+CACHE_TTL_RULES = [
+    (re.compile(r'/search/'), Config.TMDB_CACHE_SEARCH_TTL),
+    (re.compile(r'/(movie|tv)/\d+'), Config.TMDB_CACHE_DETAILS_TTL),
+]
+
+# Process-wide pacing of outgoing TMDB calls, shared by every client instance
+rate_limiter = TokenBucket(
+    rate=Config.TMDB_RATE_LIMIT,
+    capacity=Config.TMDB_RATE_LIMIT_BURST
+)
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+# Background refreshes of stale cache entries
+_refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='tmdb-refresh')
+_refreshing_keys = set()
+_refreshing_lock = threading.Lock()
+
+def get_default_response_cache():
+    """Return the process-wide SQLite response cache, or None if disabled"""
+    global _default_cache
+    if not Config.TMDB_CACHE_PATH:
+        return None
     
-    def __init__(self):
+    with _default_cache_lock:
+        if _default_cache is None:
+            try:
+                _default_cache = SQLiteResponseCache(
+                    Config.TMDB_CACHE_PATH,
+                    max_age=Config.TMDB_CACHE_DETAILS_TTL + Config.TMDB_CACHE_STALE_TTL
+                )
+            except Exception as e:
+                logging.error(f"TMDB response cache unavailable: {e}")
+                return None
+        return _default_cache
+
+class TMDBClientBase:
+    """
+    Configuration and response shaping shared by TMDBClient and
+    AsyncTMDBClient. Holds no transport; each client brings its own.
+    """
+    
+    def __init__(self, response_cache=None):
         self.api_key = Config.TMDB_API_KEY
         self.base_url = Config.TMDB_BASE_URL
         self.image_base_url = Config.TMDB_IMAGE_BASE_URL
@@ -20,54 +70,186 @@ class TMDBClient:
             return
         
         self.enabled = True
+        self.response_cache = response_cache or get_default_response_cache()
         self.headers = {
             'Authorization': f'Bearer {self.api_key}',
             'accept': 'application/json',
             'User-Agent': 'TorrentSearchAPI/4.0'
         }
+    
+    def _cache_ttl(self, url):
+        """Fresh lifetime in seconds for a TMDB endpoint"""
+        path = url[len(self.base_url):]
+        for pattern, ttl in CACHE_TTL_RULES:
+            if pattern.match(path):
+                return ttl
+        return Config.TMDB_CACHE_DEFAULT_TTL
+    
+    def _endpoint(self, url):
+        """Endpoint template of a TMDB URL for metrics labels"""
+        return endpoint_template(url[len(self.base_url):])
+    
+    def _parse_retry_after(self, response):
+        """Seconds from a Retry-After header (defaults to 1 when missing or not numeric)"""
+        try:
+            return max(float(response.headers.get('Retry-After', 1)), 0.0)
+        except ValueError:
+            return 1.0
+    
+    def _details_params(self, append_to_response=None):
+        """Build details query params, appending sub-resources when requested"""
+        params = {'language': 'en-US'}
+        if append_to_response:
+            params['append_to_response'] = ','.join(append_to_response)
+        return params
+    
+    def _trim_credits(self, data):
+        """Keep the 10 most popular cast and crew members"""
+        # Sort cast by popularity (descending) and return top 10
+        cast = sorted(data.get('cast', []), key=lambda x: x.get('popularity', 0), reverse=True)[:10]
+        
+        # Sort crew by popularity (descending) and return top 10
+        crew = sorted(data.get('crew', []), key=lambda x: x.get('popularity', 0), reverse=True)[:10]
+        
+        return {
+            'id': data.get('id'),
+            'cast': cast,
+            'crew': crew
+        }
+    
+    def _with_trimmed_credits(self, details):
+        """Trim appended credits in a combined details payload"""
+        if details and details.get('credits'):
+            details['credits'] = self._trim_credits(details['credits'])
+        return details
+
+class TMDBClient(TMDBClientBase):
+    """Client for The Movie Database (TMDB) API with improved error handling"""
+    
+    def __init__(self, response_cache=None):
+        super().__init__(response_cache)
+        if not self.enabled:
+            return
         
-        # Configure session with retry strategy
+        # Configure session with retry strategy for transient server errors.
+        # 429s are not retried here - they go through the shared rate limiter instead.
         self.session = requests.Session()
         retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS"]
+            total=Config.TMDB_MAX_RETRIES,
+            backoff_factor=0.2,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=["HEAD", "GET", "OPTIONS"],
+            respect_retry_after_header=False
         )
         adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
     
-    def _make_request(self, url, params=None, timeout=15):
-        """Make a request with improved error handling"""
+    def _make_request(self, url, params=None, timeout=15, use_cache=True):
+        """Make a request, serving fresh (or stale while revalidating) cached responses"""
+        with Span('tmdb', self._endpoint(url)):
+            return self._cached_request(url, params, timeout, use_cache)
+    
+    def _cached_request(self, url, params=None, timeout=15, use_cache=True):
         if not self.enabled:
             logging.warning("TMDB client is disabled - API key not configured")
             return None
-            
+        
+        if not (use_cache and self.response_cache):
+            return self._fetch_coalesced(url, params, timeout)
+        
+        cache_key = make_cache_key(url, params)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            data, stored_at = cached
+            age = time.time() - stored_at
+            ttl = self._cache_ttl(url)
+            if age < ttl:
+                CACHE_LOOKUPS.labels('tmdb', 'hit').inc()
+                return data
+            if age < ttl + Config.TMDB_CACHE_STALE_TTL:
+                CACHE_LOOKUPS.labels('tmdb', 'stale').inc()
+                self._refresh_in_background(cache_key, url, params, timeout)
+                return data
+        
+        CACHE_LOOKUPS.labels('tmdb', 'miss').inc()
         try:
-            response = self.session.get(
-                url, 
-                headers=self.headers, 
-                params=params, 
-                timeout=timeout
-            )
-            
-            # Handle rate limiting
-            if response.status_code == 429:
-                retry_after = int(response.headers.get('Retry-After', 1))
-                logging.warning(f"TMDB rate limit hit. Waiting {retry_after} seconds...")
-                time.sleep(retry_after)
-                # Retry once after rate limit
+            return self._fetch_and_store(cache_key, url, params, timeout)
+        except RateLimitExceeded:
+            # An expired copy beats failing when TMDB is throttling us
+            if cached is not None:
+                return cached[0]
+            raise
+    
+    def _fetch_and_store(self, cache_key, url, params, timeout):
+        """Fetch from TMDB and store successful responses in the cache"""
+        data = self._fetch_coalesced(url, params, timeout)
+        if data is not None:
+            self.response_cache.set(cache_key, data)
+        return data
+    
+    def _refresh_in_background(self, cache_key, url, params, timeout):
+        """Refresh a stale cache entry without blocking the caller"""
+        with _refreshing_lock:
+            if cache_key in _refreshing_keys:
+                return
+            _refreshing_keys.add(cache_key)
+        
+        def refresh():
+            try:
+                self._fetch_and_store(cache_key, url, params, timeout)
+            except RateLimitExceeded as e:
+                logging.warning(f"TMDB cache refresh skipped: {e}")
+            finally:
+                with _refreshing_lock:
+                    _refreshing_keys.discard(cache_key)
+        
+        _refresh_executor.submit(refresh)
+    
+    def _fetch_coalesced(self, url, params=None, timeout=15):
+        """Fetch via the shared single-flight so concurrent identical requests hit TMDB once"""
+        data, shared = upstream_flight.do(make_cache_key(url, params), self._fetch, url, params, timeout)
+        # Callers may mutate the payload, so a shared result is copied per caller
+        return copy.deepcopy(data) if shared else data
+    
+    def _fetch(self, url, params=None, timeout=15):
+        """
+        Fetch a TMDB endpoint with improved error handling.
+        
+        Calls are paced by the shared token bucket. A wait for a token of up
+        to TMDB_RATE_LIMIT_MAX_WAIT seconds is slept in the calling thread
+        (a request thread or a TaskGraph task); set it to 0 to never sleep.
+        Raises RateLimitExceeded when no token is available within that wait
+        or when TMDB answers 429.
+        """
+        wait = rate_limiter.reserve(Config.TMDB_RATE_LIMIT_MAX_WAIT)
+        if wait is None:
+            raise RateLimitExceeded(rate_limiter.retry_after())
+        if wait > 0:
+            time.sleep(wait)
+        
+        try:
+            with UpstreamCall('tmdb', self._endpoint(url)) as call:
                 response = self.session.get(
                     url, 
                     headers=self.headers, 
                     params=params, 
                     timeout=timeout
                 )
+                call.status = response.status_code
+            
+            # Handle rate limiting - pause every caller rather than sleeping in this one
+            if response.status_code == 429:
+                retry_after = self._parse_retry_after(response)
+                logging.warning(f"TMDB rate limit hit. Pausing TMDB calls for {retry_after} seconds")
+                rate_limiter.pause(retry_after)
+                raise RateLimitExceeded(retry_after)
             
             response.raise_for_status()
             return response.json()
             
+        except RateLimitExceeded:
+            raise
         except requests.exceptions.ConnectionError as e:
             logging.error(f"TMDB connection error: {e}")
             return None
@@ -140,15 +322,20 @@ class TMDBClient:
             return data.get('results', [])[:5]  # Return top 5 results
         return []
     
-    def get_movie_details(self, movie_id):
-        """Get detailed movie information"""
+    def get_movie_details(self, movie_id, append_to_response=None):
+        """
+        Get detailed movie information.
+        
+        Sub-resources listed in append_to_response (e.g. 'credits', 'external_ids',
+        'videos') are fetched in the same round trip and nested under their own keys.
+        """
         if not self.enabled:
             return None
             
         url = f"{self.base_url}/movie/{movie_id}"
-        params = {'language': 'en-US'}
+        params = self._details_params(append_to_response)
         
-        return self._make_request(url, params)
+        return self._with_trimmed_credits(self._make_request(url, params))
     
     def get_movie_credits(self, movie_id):
         """Get movie credits (cast and crew)"""
@@ -160,28 +347,18 @@ class TMDBClient:
         
         data = self._make_request(url, params)
         if data:
-            # Sort cast by popularity (descending) and return top 10
-            cast = sorted(data.get('cast', []), key=lambda x: x.get('popularity', 0), reverse=True)[:10]
-            
-            # Sort crew by popularity (descending) and return top 10
-            crew = sorted(data.get('crew', []), key=lambda x: x.get('popularity', 0), reverse=True)[:10]
-            
-            return {
-                'id': data.get('id'),
-                'cast': cast,
-                'crew': crew
-            }
+            return self._trim_credits(data)
         return None
     
-    def get_tv_details(self, tv_id):
-        """Get detailed TV show information"""
+    def get_tv_details(self, tv_id, append_to_response=None):
+        """Get detailed TV show information, optionally with appended sub-resources"""
         if not self.enabled:
             return None
             
         url = f"{self.base_url}/tv/{tv_id}"
-        params = {'language': 'en-US'}
+        params = self._details_params(append_to_response)
         
-        return self._make_request(url, params)
+        return self._with_trimmed_credits(self._make_request(url, params))
     
     def get_tv_season_details(self, tv_id, season_number):
         """Get detailed TV season information"""
@@ -209,5 +386,9 @@ class TMDBClient:
             return False
             
         url = f"{self.base_url}/configuration"
-        data = self._make_request(url, timeout=5)
+        try:
+            data = self._make_request(url, timeout=5, use_cache=False)
+        except RateLimitExceeded as e:
+            logging.warning(f"TMDB connection test skipped: {e}")
+            return False
         return data is not None 
\ No newline at end of file
@@ -1,112 +1,115 @@
-import re
 import logging
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from config import Config
+from services.result_parsers import get_result_parser
+from utils.cache import TTLCache
+from utils.concurrency import upstream_flight
+from utils.formatters import clean_title_for_search
+from utils.metrics import CACHE_LOOKUPS, PARSE_LATENCY, UpstreamCall
+from utils.tracing import Span
 
-class TorrentFinder:
-    """Service for finding torrents from torrent sites"""
+# Process-wide cache of parsed scrape results keyed by (category, normalized query)
+search_cache = TTLCache(
+    max_size=Config.TORRENT_CACHE_SIZE,
+    ttl=Config.TORRENT_CACHE_TTL
+)
+
+class TorrentFinderBase:
+    """
+    Mirror settings and result parsing shared by TorrentFinder and
+    AsyncTorrentFinder. Holds no transport; each finder brings its own.
+    """
     
     def __init__(self):
         self.base_domain = Config.TORRENT_SITE_DOMAIN
+        self.scheme = Config.TORRENT_SITE_SCHEME
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        self.result_parser = get_result_parser(Config.TORRENT_PARSER)
+    
+    def _parse_results(self, html):
+        """Parse torrent results from a search results page"""
+        with PARSE_LATENCY.labels(Config.TORRENT_PARSER).time(), Span('parse'):
+            return self.result_parser(html)
+
+class TorrentFinder(TorrentFinderBase):
+    """Service for finding torrents from torrent sites"""
+    
+    def __init__(self):
+        super().__init__()
+        self.timeout = (Config.TORRENT_CONNECT_TIMEOUT, Config.TORRENT_READ_TIMEOUT)
+        
+        # Configure keep-alive session with a connection pool and retry strategy
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retry_strategy = Retry(
+            total=Config.TORRENT_MAX_RETRIES,
+            backoff_factor=0.3,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=["HEAD", "GET", "OPTIONS"]
+        )
+        adapter = HTTPAdapter(
+            pool_connections=Config.TORRENT_POOL_SIZE,
+            pool_maxsize=Config.TORRENT_POOL_SIZE,
+            max_retries=retry_strategy
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
-    def fetch_html(self, url):
-        """Fetch HTML content from URL"""
-        response = requests.get(url, headers=self.headers)
+    def fetch_html(self, url, category=None):
+        """Fetch HTML content from URL, sharing the fetch with concurrent identical requests"""
+        html, _ = upstream_flight.do(url, self._get_html, url, category)
+        return html
+
+    def _get_html(self, url, category=None):
+        """Fetch HTML content from URL over the pooled session"""
+        with UpstreamCall('torrent_site', str(category)) as call:
+            response = self.session.get(url, timeout=self.timeout)
+            call.status = response.status_code
         response.raise_for_status()
         return response.text
 
-    def search_all(self, query):
+    def search_all(self, query, use_cache=True):
         """Search all categories"""
-        try:
-            url = f'https://{self.base_domain}/search/{query}/1/99/0'
-            html = self.fetch_html(url)
-            soup = BeautifulSoup(html, 'html.parser')
-            return self._parse_results(soup)
-        except Exception as e:
-            logging.error(f'Search failed: {e}')
-            return []
+        return self._search_category(query, 0, 'Search', use_cache)
 
-    def search_hd_movies(self, query):
+    def search_hd_movies(self, query, use_cache=True):
         """Search HD movies category"""
-        try:
-            url = f'https://{self.base_domain}/search/{query}/1/99/207'
-            html = self.fetch_html(url)
-            soup = BeautifulSoup(html, 'html.parser')
-            return self._parse_results(soup)
-        except Exception as e:
-            logging.error(f'HD movie search failed: {e}')
-            return []
+        return self._search_category(query, 207, 'HD movie search', use_cache)
 
-    def search_movies(self, query):
+    def search_movies(self, query, use_cache=True):
         """Search movies category"""
-        try:
-            url = f'https://{self.base_domain}/search/{query}/1/99/201'
-            html = self.fetch_html(url)
-            soup = BeautifulSoup(html, 'html.parser')
-            return self._parse_results(soup)
-        except Exception as e:
-            logging.error(f'Movie search failed: {e}')
-            return []
+        return self._search_category(query, 201, 'Movie search', use_cache)
 
-    def search_hd_tv_shows(self, query):
+    def search_hd_tv_shows(self, query, use_cache=True):
         """Search HD TV shows category"""
-        try:
-            url = f'https://{self.base_domain}/search/{query}/1/99/208'
-            html = self.fetch_html(url)
-            soup = BeautifulSoup(html, 'html.parser')
-            return self._parse_results(soup)
-        except Exception as e:
-            logging.error(f'HD TV search failed: {e}')
-            return []
+        return self._search_category(query, 208, 'HD TV search', use_cache)
 
-    def search_tv_shows(self, query):
+    def search_tv_shows(self, query, use_cache=True):
         """Search TV shows category"""
+        return self._search_category(query, 205, 'TV search', use_cache)
+
+    def _search_category(self, query, category, label, use_cache=True):
+        """Search a single category, serving repeat lookups from the result cache"""
+        cache_key = (category, clean_title_for_search(query).lower())
+        if use_cache:
+            cached = search_cache.get(cache_key)
+            CACHE_LOOKUPS.labels('torrent_search', 'miss' if cached is None else 'hit').inc()
+            if cached is not None:
+                return list(cached)
+
         try:
-            url = f'https://{self.base_domain}/search/{query}/1/99/205'
-            html = self.fetch_html(url)
-            soup = BeautifulSoup(html, 'html.parser')
-            return self._parse_results(soup)
+            url = f'{self.scheme}://{self.base_domain}/search/{query}/1/99/{category}'
+            with Span('scrape', f'{category} {query}'):
+                html = self.fetch_html(url, category)
+            results = self._parse_results(html)
         except Exception as e:
-            logging.error(f'TV search failed: {e}')
+            logging.error(f'{label} failed: {e}')
             return []
 
-    def _parse_results(self, soup):
-        """Parse torrent results from HTML soup"""
-        results = []
-        for trs in soup.find_all('tr'):
-            tds = trs.find_all('td')
-            if len(tds) > 1:
-                magnet_link_tag = tds[1].find('a', href=True, title="Download this torrent using magnet")
-                if not magnet_link_tag:
-                    continue
-
-                title_tag = tds[1].find('a', class_='detLink')
-                if not title_tag:
-                    continue
-
-                title = title_tag.get('title', '').replace('Details for ', '')
-                magnet = magnet_link_tag['href']
-                
-                if not title or not magnet:
-                    continue
-
-                size_match = re.search(r'(?<=Size )(.*)(?=,)', str(tds[1]))
-                size = size_match.group(0) if size_match else None
-
-                seeders = tds[2].text if len(tds) > 2 else None
-                leechers = tds[3].text if len(tds) > 3 else None
-
-                result = {
-                    'title': title,
-                    'magnet': magnet,
-                    'size': size,
-                    'seeders': seeders,
-                    'leechers': leechers
-                }
-                result = {key: value.replace('\xa0', ' ') if value else value for key, value in result.items()}
-                results.append(result)
-        return results 
\ No newline at end of file
+        # Failed scrapes are not cached so the next request retries the mirror
+        search_cache.set(cache_key, results)
+        return list(results)
@@ -0,0 +1,45 @@
+from utils.magnet import parse_infohash
+
+class TorrentResult:
+    """
+    One scraped torrent search result.
+
+    Slotted so large result sets stay compact. Rows travel as these records
+    from the parser through dedupe and scoring, and only the torrents that
+    make it into a response are turned into dicts (see format_torrent_results).
+    Records may be shared through the search cache, so treat them as read-only.
+    """
+
+    __slots__ = ('title', 'magnet', 'size', 'seeders', 'leechers', 'infohash')
+
+    # Fields included in API responses
+    FIELDS = ('title', 'magnet', 'size', 'seeders', 'leechers')
+
+    def __init__(self, title, magnet, size=None, seeders=0, leechers=0, infohash=None):
+        self.title = title
+        self.magnet = magnet
+        self.size = size
+        self.seeders = seeders
+        self.leechers = leechers
+        # Parsed once here so dedupe never re-parses the magnet
+        self.infohash = infohash or parse_infohash(magnet)
+
+    @staticmethod
+    def parse_count(text):
+        """Seeder/leecher cell text as an int (0 when missing or not a number)"""
+        return int(text) if text and text.isdigit() else 0
+
+    def get(self, field, default=None):
+        """Dict-style access for code written against the old dict rows"""
+        return getattr(self, field) if field in self.__slots__ else default
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __eq__(self, other):
+        if not isinstance(other, TorrentResult):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+
+    def __repr__(self):
+        return f"TorrentResult(title={self.title!r}, seeders={self.seeders}, size={self.size!r})"
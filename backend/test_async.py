@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Tests for the async serving mode: async single-flight, the httpx-based
+torrent finder and TMDB client, and the native async details handlers
+"""
+
+import asyncio
+import os
+import time
+import httpx
+from routes import async_routes
+from routes.async_routes import match_async_route
+from services.async_tmdb_client import AsyncTMDBClient
+from services.async_torrent_finder import AsyncTorrentFinder
+from utils.concurrency import AsyncSingleFlight
+from utils.rate_limit import RateLimitExceeded
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'torrent_search')
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+def mock_client(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+def enabled_tmdb_client(handler):
+    """AsyncTMDBClient talking to a mock TMDB, without a response cache"""
+    client = AsyncTMDBClient(client=mock_client(handler))
+    client.enabled = True
+    client.headers = {}
+    client.response_cache = None
+    return client
+
+def test_async_single_flight_shares_one_call():
+    calls = []
+
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0.05)
+        return key.upper()
+
+    async def main():
+        flight = AsyncSingleFlight()
+        return await asyncio.gather(*(flight.do('a', fetch, 'a') for _ in range(5)))
+
+    results = asyncio.run(main())
+    assert calls == ['a']
+    assert [result for result, _ in results] == ['A'] * 5
+    # The leader's result is shared too, so every caller must copy before mutating
+    assert all(shared for _, shared in results)
+
+def test_async_single_flight_propagates_errors():
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError('boom')
+
+    async def main():
+        flight = AsyncSingleFlight()
+        return await asyncio.gather(flight.do('k', fail), flight.do('k', fail), return_exceptions=True)
+
+    errors = asyncio.run(main())
+    assert all(isinstance(error, ValueError) for error in errors)
+
+def test_async_single_flight_reruns_when_the_leader_is_cancelled():
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return 'page'
+
+    async def main():
+        flight = AsyncSingleFlight()
+        leader = asyncio.ensure_future(flight.do('k', fetch))
+        await asyncio.sleep(0.01)
+        follower = asyncio.ensure_future(flight.do('k', fetch))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return await follower
+
+    # The follower was not cancelled, so it runs the call itself
+    assert asyncio.run(main()) == ('page', False)
+    assert len(calls) == 2
+
+def test_many_slow_scrapes_without_threads():
+    """Hundreds of slow mirror fetches overlap on one event loop"""
+    html = load_fixture('movies_inception.html')
+
+    async def mirror(request):
+        await asyncio.sleep(0.2)
+        return httpx.Response(200, text=html)
+
+    async def main():
+        finder = AsyncTorrentFinder(client=mock_client(mirror))
+        return await asyncio.gather(*(
+            finder.search_movies(f'Inception {n}', use_cache=False) for n in range(300)
+        ))
+
+    start = time.time()
+    batches = asyncio.run(main())
+    assert time.time() - start < 2
+    assert all(batch and batch[0].magnet.startswith('magnet:') for batch in batches)
+
+def test_failed_scrape_returns_no_results():
+    async def mirror(request):
+        return httpx.Response(502)
+
+    async def main():
+        finder = AsyncTorrentFinder(client=mock_client(mirror))
+        finder.retry_backoff = 0
+        return await finder.search_hd_movies('Nothing Here', use_cache=False)
+
+    assert asyncio.run(main()) == []
+
+def test_mirror_5xx_is_retried():
+    """A mirror 502/503 is retried like the sync session does, then the page is parsed"""
+    html = load_fixture('movies_inception.html')
+    answers = [502, 503]
+
+    async def mirror(request):
+        return httpx.Response(answers.pop(0) if answers else 200, text=html)
+
+    async def main():
+        finder = AsyncTorrentFinder(client=mock_client(mirror))
+        finder.retry_backoff = 0
+        return await finder.search_movies('Inception Retry', use_cache=False)
+
+    results = asyncio.run(main())
+    assert answers == []
+    assert results and results[0].magnet.startswith('magnet:')
+
+def test_tmdb_details_and_rate_limit():
+    async def tmdb(request):
+        if request.url.path.endswith('/movie/27205'):
+            return httpx.Response(200, json={'id': 27205, 'title': 'Inception', 'credits': {'cast': [], 'crew': []}})
+        if request.url.path.endswith('/movie/1'):
+            return httpx.Response(429, headers={'Retry-After': '0'})
+        return httpx.Response(404)
+
+    async def main():
+        client = enabled_tmdb_client(tmdb)
+        details = await client.get_movie_details(27205, append_to_response=['credits'])
+        missing = await client.get_tv_details(99)
+        try:
+            await client.get_movie_details(1)
+            throttled = False
+        except RateLimitExceeded:
+            throttled = True
+        return details, missing, throttled
+
+    details, missing, throttled = asyncio.run(main())
+    assert details['title'] == 'Inception'
+    assert details['credits'] == {'id': None, 'cast': [], 'crew': []}
+    assert missing is None
+    assert throttled
+
+def test_async_routes_match_flask_paths():
+    endpoint, handler, params = match_async_route('/details/tv/1396/season/1/episode/2')
+    assert (endpoint, params) == ('search.get_episode_details_with_torrents', ('1396', '1', '2'))
+    assert match_async_route('/details/movie/27205')[2] == ('movie', '27205')
+    assert match_async_route('/details/movie/abc') is None
+    assert match_async_route('/search/inception') is None
+
+def test_details_handler_validates_content_type():
+    original = async_routes.tmdb_client
+    async_routes.tmdb_client = enabled_tmdb_client(lambda request: httpx.Response(404))
+    try:
+        _, handler, params = match_async_route('/details/book/1')
+        status, body, _ = asyncio.run(handler({}, *params))
+        assert status == 400
+        _, handler, params = match_async_route('/details/movie/1')
+        status, body, _ = asyncio.run(handler({}, *params))
+        assert (status, body['message']) == (404, 'Content not found')
+    finally:
+        async_routes.tmdb_client = original
+
+if __name__ == "__main__":
+    test_async_single_flight_shares_one_call()
+    test_async_single_flight_propagates_errors()
+    test_async_single_flight_reruns_when_the_leader_is_cancelled()
+    test_many_slow_scrapes_without_threads()
+    test_failed_scrape_returns_no_results()
+    test_mirror_5xx_is_retried()
+    test_tmdb_details_and_rate_limit()
+    test_async_routes_match_flask_paths()
+    test_details_handler_validates_content_type()
+    print("✅ All async serving tests passed!")
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for POST /batch/search request validation and de-duplication
+"""
+
+from flask import Flask
+from routes import search_routes
+
+class FakeTMDB:
+    """Stands in for TMDBClient, answering every search with a single result"""
+    enabled = True
+
+    def __init__(self):
+        self.calls = []
+
+    def _search(self, kind, query):
+        self.calls.append((kind, query))
+        return [{'id': len(query), 'title': query, 'media_type': kind}]
+
+    def search_movie(self, query):
+        return self._search('movie', query)
+
+    def search_tv_show(self, query):
+        return self._search('tv', query)
+
+    def search_multi(self, query):
+        return self._search('multi', query)
+
+app = Flask(__name__)
+app.register_blueprint(search_routes.search_bp)
+client = app.test_client()
+
+def post_batch(tmdb, **kwargs):
+    """POST /batch/search with a fake TMDB client behind the route"""
+    original = search_routes.tmdb_client
+    search_routes.tmdb_client = tmdb
+    try:
+        return client.post('/batch/search', **kwargs)
+    finally:
+        search_routes.tmdb_client = original
+
+def test_non_object_bodies_are_rejected():
+    """A JSON list, string or number body is a 400, not a 500"""
+    for body in [[{'query': 'inception'}], 'inception', 42, None]:
+        response = post_batch(FakeTMDB(), json=body)
+        assert response.status_code == 400, body
+        assert 'queries' in response.get_json()['message']
+
+    response = post_batch(FakeTMDB(), data='not json', content_type='application/json')
+    assert response.status_code == 400
+
+def test_invalid_queries_are_rejected():
+    """Missing, empty or malformed queries are validation errors"""
+    for body in [{}, {'queries': []}, {'queries': 'inception'}, {'queries': [{'type': 'book', 'query': 'x'}]}]:
+        assert post_batch(FakeTMDB(), json=body).status_code == 400, body
+
+def test_identical_searches_resolve_once():
+    """Duplicate entries share one TMDB lookup and results keep request order"""
+    tmdb = FakeTMDB()
+    response = post_batch(tmdb, json={'queries': [
+        {'type': 'movie', 'query': 'Inception'},
+        {'type': 'tv', 'query': 'Breaking Bad'},
+        {'type': 'movie', 'query': 'inception '},
+    ]})
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert [entry['query'] for entry in body['results']] == ['Inception', 'Breaking Bad', 'inception']
+    assert sorted(tmdb.calls) == [('movie', 'inception'), ('tv', 'breaking bad')]
+
+if __name__ == "__main__":
+    test_non_object_bodies_are_rejected()
+    test_invalid_queries_are_rejected()
+    test_identical_searches_resolve_once()
+    print("✅ All batch search tests passed!")
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Tests for the in-process TTL + LRU cache used in front of torrent scrapes
+"""
+
+import time
+from utils.cache import TTLCache
+
+def test_lru_eviction():
+    """Least recently used entries are evicted once the cache is full"""
+    cache = TTLCache(max_size=2, ttl=60)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')  # 'a' is now most recently used
+    cache.set('c', 3)
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+
+def test_ttl_expiry():
+    """Entries expire after their TTL"""
+    cache = TTLCache(max_size=10, ttl=60)
+    cache.set('short', 'value', ttl=0.01)
+    cache.set('long', 'value')
+    time.sleep(0.02)
+
+    assert cache.get('short') is None
+    assert cache.get('long') == 'value'
+    assert cache.stats()['size'] == 1
+
+def test_hit_miss_counters():
+    """Hits and misses are counted and reported as a ratio"""
+    cache = TTLCache(max_size=10, ttl=60)
+    cache.set('key', 'value')
+    cache.get('key')
+    cache.get('missing')
+
+    stats = cache.stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+    assert stats['hit_ratio'] == 0.5
+
+if __name__ == "__main__":
+    test_lru_eviction()
+    test_ttl_expiry()
+    test_hit_miss_counters()
+    print("✅ All cache tests passed!")
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Tests for the concurrency helpers: bounded fan-out, task graphs and single-flight
+"""
+
+import threading
+import time
+from config import Config
+from utils.concurrency import SingleFlight, TaskGraph, iter_concurrently, run_concurrently, run_lookups_concurrently
+
+def test_run_concurrently_keeps_order_and_overlaps():
+    """Results come back in call order and calls run at the same time"""
+    def slow_echo(value):
+        time.sleep(0.1)
+        return value
+
+    start = time.time()
+    results = run_concurrently([(slow_echo, i) for i in range(4)], max_concurrency=4)
+
+    assert results == [0, 1, 2, 3]
+    assert time.time() - start < 0.3
+
+def test_run_concurrently_respects_per_call_cap():
+    """No more than max_concurrency calls from one batch are in flight"""
+    lock = threading.Lock()
+    state = {'running': 0, 'peak': 0}
+
+    def tracked():
+        with lock:
+            state['running'] += 1
+            state['peak'] = max(state['peak'], state['running'])
+        time.sleep(0.02)
+        with lock:
+            state['running'] -= 1
+
+    run_concurrently([(tracked,) for _ in range(8)], max_concurrency=2)
+    assert state['peak'] <= 2
+
+def test_lookups_do_not_wait_for_scrape_slots():
+    """TMDB lookups run on their own pool while every scrape worker is busy"""
+    release = threading.Event()
+    def hold_scrape_slot():
+        release.wait(1)
+
+    scrapes = threading.Thread(
+        target=run_concurrently,
+        args=([(hold_scrape_slot,) for _ in range(Config.SCRAPE_MAX_WORKERS)],),
+        kwargs={'max_concurrency': Config.SCRAPE_MAX_WORKERS}
+    )
+    scrapes.start()
+    try:
+        time.sleep(0.05)
+        start = time.time()
+        names = run_lookups_concurrently([(lambda: threading.current_thread().name,) for _ in range(2)])
+        assert time.time() - start < 0.5
+        assert all(name.startswith('lookup') for name in names)
+    finally:
+        release.set()
+        scrapes.join()
+
+def test_iter_concurrently_yields_as_calls_finish():
+    """Fast calls are yielded before slow ones, tagged with their call index"""
+    def sleep_then_echo(delay):
+        time.sleep(delay)
+        return delay
+
+    finished = list(iter_concurrently([(sleep_then_echo, 0.2), (sleep_then_echo, 0.01)], max_concurrency=2))
+    assert finished == [(1, 0.01), (0, 0.2)]
+
+def test_task_graph_passes_dependency_results():
+    """Dependent tasks receive their dependencies' results and independent tasks overlap"""
+    def slow(value):
+        time.sleep(0.1)
+        return value
+
+    start = time.time()
+    results = (
+        TaskGraph()
+        .add('show', slow, {'name': 'Show'})
+        .add('season', slow, 'season-1')
+        .add('torrents', lambda show: [show['name']], after=['show'])
+        .run()
+    )
+
+    assert results == {'show': {'name': 'Show'}, 'season': 'season-1', 'torrents': ['Show']}
+    assert time.time() - start < 0.18
+
+def test_task_graph_cleans_up_when_a_task_fails():
+    """A failing task triggers the cleanup of finished and still-running tasks' results"""
+    cleaned = []
+    def fail():
+        time.sleep(0.05)
+        raise ValueError('not found')
+    def slow():
+        time.sleep(0.1)
+        return 'slow'
+
+    graph = (
+        TaskGraph()
+        .add('fast', lambda: 'fast', cleanup=cleaned.append)
+        .add('slow', slow, cleanup=cleaned.append)
+        .add('fail', fail)
+    )
+    try:
+        graph.run()
+        assert False, 'expected ValueError'
+    except ValueError:
+        pass
+
+    assert cleaned == ['fast']
+    time.sleep(0.1)
+    assert cleaned == ['fast', 'slow']
+
+def test_single_flight_coalesces_concurrent_calls():
+    """Concurrent callers with the same key share one execution"""
+    flight = SingleFlight()
+    calls = []
+    results = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.1)
+        return 'payload'
+
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do('url', fetch)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert [result for result, _ in results] == ['payload'] * 5
+    assert all(shared for _, shared in results)
+
+def test_single_flight_propagates_errors_and_resets():
+    """A failed call raises for its callers and the key can be retried"""
+    flight = SingleFlight()
+
+    def fail():
+        raise ValueError('upstream down')
+
+    try:
+        flight.do('url', fail)
+        assert False, 'expected ValueError'
+    except ValueError:
+        pass
+
+    assert flight.do('url', lambda: 'ok') == ('ok', False)
+
+if __name__ == "__main__":
+    test_run_concurrently_keeps_order_and_overlaps()
+    test_run_concurrently_respects_per_call_cap()
+    test_lookups_do_not_wait_for_scrape_slots()
+    test_iter_concurrently_yields_as_calls_finish()
+    test_task_graph_passes_dependency_results()
+    test_task_graph_cleans_up_when_a_task_fails()
+    test_single_flight_coalesces_concurrent_calls()
+    test_single_flight_propagates_errors_and_resets()
+    print("✅ All concurrency tests passed!")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Tests for the concurrent TMDB and torrent lookups behind the TV details endpoints
+"""
+
+import time
+from flask import Flask
+from routes import search_routes
+from services.torrent_result import TorrentResult
+
+class SlowTMDB:
+    """Show lookup answers at once, season and episode lookups take 0.2s"""
+    enabled = True
+
+    def get_tv_details(self, tv_id):
+        return {'id': tv_id, 'name': 'Breaking Bad'}
+
+    def get_tv_season_details(self, tv_id, season_number):
+        time.sleep(0.2)
+        return {'id': 3572, 'season_number': season_number, 'episodes': []}
+
+    def get_tv_episode_details(self, tv_id, season_number, episode_number):
+        time.sleep(0.2)
+        return {'id': 62085, 'season_number': season_number, 'episode_number': episode_number}
+
+class SlowTVMirror:
+    """Every TV category search takes as long as the season or episode lookup"""
+
+    def search_tv_shows(self, query, use_cache=True):
+        time.sleep(0.2)
+        return [TorrentResult(f'{query} 720p', 'magnet:?xt=urn:btih:' + 'b' * 40, '5 GiB', 5)]
+
+    def search_hd_tv_shows(self, query, use_cache=True):
+        time.sleep(0.2)
+        return [TorrentResult(f'{query} 1080p', 'magnet:?xt=urn:btih:' + 'c' * 40, '9 GiB', 9)]
+
+app = Flask(__name__)
+app.register_blueprint(search_routes.search_bp)
+client = app.test_client()
+
+def timed_get(path):
+    """GET path with the slow fakes behind the routes, returning (response, seconds)"""
+    originals = search_routes.tmdb_client, search_routes.torrent_finder
+    search_routes.tmdb_client, search_routes.torrent_finder = SlowTMDB(), SlowTVMirror()
+    try:
+        start = time.time()
+        response = client.get(path)
+        return response, time.time() - start
+    finally:
+        search_routes.tmdb_client, search_routes.torrent_finder = originals
+
+def test_season_lookup_overlaps_torrent_searches():
+    """Season details and the season torrent searches run side by side"""
+    response, elapsed = timed_get('/details/tv/1396/season/1?cache=false')
+    body = response.get_json()
+
+    assert response.status_code == 200
+    assert body['tv_show_name'] == 'Breaking Bad'
+    assert body['season_details']['season_number'] == 1
+    assert body['torrent_count'] == 2
+    # Lookup then scrape back to back would take 0.4s
+    assert elapsed < 0.35
+
+def test_episode_lookup_overlaps_torrent_searches():
+    """Episode details and the episode torrent searches run side by side"""
+    response, elapsed = timed_get('/details/tv/1396/season/1/episode/2?cache=false')
+    body = response.get_json()
+
+    assert response.status_code == 200
+    assert body['episode_details']['episode_number'] == 2
+    assert body['torrent_count'] == 2
+    assert elapsed < 0.35
+
+if __name__ == "__main__":
+    test_season_lookup_overlaps_torrent_searches()
+    test_episode_lookup_overlaps_torrent_searches()
+    print("✅ All details route tests passed!")
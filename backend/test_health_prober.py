@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Tests for the background upstream prober and the /health endpoints it answers
+"""
+
+import requests
+from flask import Flask
+from routes import health_routes
+from services.health_prober import HealthProber
+
+class FakeTMDB:
+    """Stands in for TMDBClient with a switchable connection check"""
+
+    def __init__(self, enabled=True, connected=True):
+        self.enabled = enabled
+        self.connected = connected
+
+    def test_connection(self):
+        return self.connected
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+class FakeSession:
+    """Answers HEAD with a fixed status, or raises when the mirror is unreachable"""
+
+    def __init__(self, status_code=200):
+        self.status_code = status_code
+
+    def head(self, url, timeout=None, allow_redirects=False):
+        if self.status_code is None:
+            raise requests.ConnectionError('mirror unreachable')
+        return FakeResponse(self.status_code)
+
+class FakeFinder:
+    """Stands in for TorrentFinder's mirror address and session"""
+    scheme = 'http'
+    base_domain = 'mirror.test'
+    timeout = (1, 1)
+
+    def __init__(self, status_code=200):
+        self.session = FakeSession(status_code)
+
+def make_prober(tmdb=None, finder=None, interval=30):
+    return HealthProber(tmdb or FakeTMDB(), finder or FakeFinder(), interval=interval)
+
+app = Flask(__name__)
+app.register_blueprint(health_routes.health_bp)
+client = app.test_client()
+
+def get_with_prober(prober, path):
+    """Request a health endpoint with the given prober behind it"""
+    original = health_routes.health_prober
+    health_routes.health_prober = prober
+    try:
+        return client.get(path)
+    finally:
+        health_routes.health_prober = original
+
+def test_ready_when_upstreams_up():
+    """Both upstreams up on a fresh probe makes the instance ready"""
+    prober = make_prober()
+    assert not prober.is_ready()  # nothing probed yet
+
+    results = prober.probe_once()
+    assert results['tmdb']['status'] == 'up'
+    assert results['torrent_site']['status'] == 'up'
+    assert prober.is_ready()
+
+    response = get_with_prober(prober, '/health/ready')
+    assert response.status_code == 200
+    assert response.get_json()['status'] == 'ready'
+
+def test_not_ready_when_the_mirror_is_down():
+    """A 5xx or an unreachable mirror makes the instance unready"""
+    for finder in [FakeFinder(status_code=503), FakeFinder(status_code=None)]:
+        prober = make_prober(FakeTMDB(), finder)
+        prober.probe_once()
+        assert not prober.is_ready()
+
+        response = get_with_prober(prober, '/health/ready')
+        assert response.status_code == 503
+        assert response.get_json()['status'] == 'not_ready'
+
+def test_tmdb_down_is_degraded_not_unready():
+    """A failed TMDB check is reported as degraded but keeps the instance in rotation"""
+    prober = make_prober(FakeTMDB(connected=False))
+    prober.probe_once()
+    assert prober.is_ready()
+    assert prober.degraded() == ['tmdb']
+
+    response = get_with_prober(prober, '/health/ready')
+    assert response.status_code == 200
+    assert response.get_json()['status'] == 'ready'
+    assert response.get_json()['degraded'] == ['tmdb']
+
+def test_disabled_tmdb_does_not_block_readiness():
+    """TMDB without an API key is reported as disabled, not down"""
+    prober = make_prober(FakeTMDB(enabled=False))
+    assert prober.probe_once()['tmdb']['status'] == 'disabled'
+    assert prober.is_ready()
+
+    body = get_with_prober(prober, '/health').get_json()
+    assert body['services']['tmdb_integration'] == health_routes.TMDB_PROBE_STATUS['disabled']
+    assert body['probes']['tmdb']['status'] == 'disabled'
+
+def test_stale_probe_is_not_ready():
+    """Results older than three probe intervals no longer count"""
+    prober = make_prober(interval=10)
+    prober.probe_once()
+    assert prober.is_ready()
+
+    for result in prober._results.values():
+        result['checked_at'] -= 31
+    assert not prober.is_ready()
+
+def test_probing_disabled_is_always_ready():
+    """With HEALTH_PROBE_INTERVAL=0 nothing refreshes the probes, so readiness does not expire"""
+    prober = make_prober(FakeTMDB(connected=False), interval=0)
+    prober.start()
+    assert prober._thread is None
+    assert prober.is_ready()
+
+    # A warm-up probe result ages forever without taking the instance out of rotation
+    prober.probe_once()
+    for result in prober._results.values():
+        result['checked_at'] -= 3600
+    assert get_with_prober(prober, '/health/ready').status_code == 200
+
+def test_health_and_liveness_never_call_upstreams():
+    """/health answers from the cached snapshot and /health/live always succeeds"""
+    tmdb = FakeTMDB()
+    prober = make_prober(tmdb)
+    prober.probe_once()
+    tmdb.test_connection = None  # any upstream call would now fail
+
+    response = get_with_prober(prober, '/health')
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['status'] == 'healthy'
+    assert body['timestamp'] == 'live'
+    assert body['probes']['torrent_site']['status'] == 'up'
+    assert 'age_seconds' in body['probes']['tmdb']
+
+    assert get_with_prober(prober, '/health/live').get_json() == {'status': 'alive'}
+
+if __name__ == "__main__":
+    test_ready_when_upstreams_up()
+    test_not_ready_when_the_mirror_is_down()
+    test_tmdb_down_is_degraded_not_unready()
+    test_disabled_tmdb_does_not_block_readiness()
+    test_stale_probe_is_not_ready()
+    test_probing_disabled_is_always_ready()
+    test_health_and_liveness_never_call_upstreams()
+    print("✅ All health prober tests passed!")
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Tests for the periodically rebuilt home feed snapshot
+"""
+
+import json
+import threading
+import time
+from flask import Flask
+from routes import feed_routes
+from services.home_feed import FEATURED_SEARCHES, HOME_SECTIONS, HomeFeed
+
+class FakeTMDB:
+    """Stands in for TMDBClient, answering every search with a single result"""
+    enabled = True
+
+    def __init__(self):
+        self.calls = []
+        self.failing = set()
+
+    def _search(self, kind, query):
+        self.calls.append((kind, query))
+        if query in self.failing:
+            return []
+        return [{'id': len(query), 'title': query, 'poster_path': '/poster.jpg', 'media_type': kind}]
+
+    def search_movie(self, query):
+        return self._search('movie', query)
+
+    def search_tv_show(self, query):
+        return self._search('tv', query)
+
+app = Flask(__name__)
+
+def test_each_search_runs_once_per_refresh():
+    """Searches shared between rails are only sent to TMDB once"""
+    tmdb = FakeTMDB()
+    feed = HomeFeed(tmdb, interval=0)
+    payload = feed.refresh()
+
+    assert len(tmdb.calls) == len(set(tmdb.calls))
+    assert len(payload['featured']) == len(FEATURED_SEARCHES)
+    assert [section['key'] for section in payload['sections']] == [key for key, _, _ in HOME_SECTIONS]
+    assert payload['featured'][0]['poster_path'].startswith('http')
+
+def test_failed_search_keeps_previous_item():
+    """An empty TMDB answer does not drop the item from the next snapshot"""
+    tmdb = FakeTMDB()
+    feed = HomeFeed(tmdb, interval=0)
+    first = feed.refresh()
+
+    tmdb.failing.add('inception')
+    second = feed.refresh()
+    assert second['featured'] == first['featured']
+
+def test_snapshot_served_with_etag():
+    """The snapshot is served as pre-serialized bytes that revalidate with 304"""
+    feed = HomeFeed(FakeTMDB(), interval=0)
+    assert feed.response() is None
+
+    payload = feed.refresh()
+    with app.test_request_context('/home'):
+        response = feed.response().to_response()
+        assert response.status_code == 200
+        assert json.loads(response.get_data()) == payload
+        etag = response.headers['ETag']
+
+    with app.test_request_context('/home', headers={'If-None-Match': etag}):
+        assert feed.response().to_response().status_code == 304
+
+def test_unchanged_rebuild_keeps_etag():
+    """A rebuild with identical rails republishes nothing, so clients keep revalidating with 304"""
+    tmdb = FakeTMDB()
+    feed = HomeFeed(tmdb, interval=0)
+    first = feed.refresh()
+    response = feed.response()
+
+    assert feed.refresh() is first
+    assert feed.response() is response
+
+    # Changed content publishes a new snapshot with a new ETag
+    tmdb.search_movie = lambda query: [{'id': 1, 'title': query.upper(), 'media_type': 'movie'}]
+    feed.refresh()
+    assert feed.response().etag != response.etag
+
+class SlowTMDB(FakeTMDB):
+    """Every search takes a moment, so concurrent first requests overlap the build"""
+
+    def _search(self, kind, query):
+        time.sleep(0.01)
+        return super()._search(kind, query)
+
+def get_home(feed):
+    """GET /home with the given feed (and its TMDB client) behind the route"""
+    originals = feed_routes.home_feed, feed_routes.tmdb_client
+    feed_routes.home_feed, feed_routes.tmdb_client = feed, feed.tmdb_client
+    try:
+        return app.test_client().get('/home')
+    finally:
+        feed_routes.home_feed, feed_routes.tmdb_client = originals
+
+app.register_blueprint(feed_routes.feed_bp)
+
+def test_first_request_builds_the_snapshot():
+    """With refreshing disabled /home still answers: the first request builds the feed once"""
+    tmdb = SlowTMDB()
+    feed = HomeFeed(tmdb, interval=0)
+    feed.start()
+
+    responses = []
+    threads = [threading.Thread(target=lambda: responses.append(get_home(feed))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [response.status_code for response in responses] == [200] * 4
+    assert len(tmdb.calls) == len(set(tmdb.calls))
+    assert get_home(feed).status_code == 200
+    assert len(tmdb.calls) == len(set(tmdb.calls))
+
+def test_failed_first_build_is_503_with_retry_after():
+    """If TMDB returns nothing at all the request gets 503 and a Retry-After"""
+    tmdb = FakeTMDB()
+    tmdb.failing = {query for _, query in FEATURED_SEARCHES} | {
+        query for _, _, searches in HOME_SECTIONS for _, query in searches
+    }
+    response = get_home(HomeFeed(tmdb, interval=0))
+
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '5'
+
+if __name__ == "__main__":
+    test_each_search_runs_once_per_refresh()
+    test_failed_search_keeps_previous_item()
+    test_snapshot_served_with_etag()
+    test_unchanged_rebuild_keeps_etag()
+    test_first_request_builds_the_snapshot()
+    test_failed_first_build_is_503_with_retry_after()
+    print("✅ All home feed tests passed!")
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests for the Prometheus instrumentation and the /metrics endpoint
+"""
+
+from flask import Flask, jsonify
+from prometheus_client import REGISTRY
+from routes.health_routes import health_bp
+from utils.metrics import UpstreamCall, endpoint_template, instrument_app
+
+app = Flask(__name__)
+app.register_blueprint(health_bp)
+instrument_app(app)
+
+@app.route('/boom')
+def boom():
+    raise RuntimeError('handler failed')
+
+@app.route('/ok')
+def ok():
+    return jsonify({'status': 'success'})
+
+client = app.test_client()
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+def test_endpoint_template_collapses_ids():
+    assert endpoint_template('/tv/1396/season/1/episode/2') == '/tv/{id}/season/{id}/episode/{id}'
+    assert endpoint_template('/search/movie') == '/search/movie'
+
+def test_request_latency_per_route():
+    before = sample('http_request_duration_seconds_count', method='GET', endpoint='ok', status='200')
+    client.get('/ok')
+    client.get('/ok')
+    assert sample('http_request_duration_seconds_count', method='GET', endpoint='ok', status='200') == before + 2
+    assert sample('http_requests_in_flight') == 0
+
+def test_unhandled_errors_are_recorded_as_500():
+    before = sample('http_request_duration_seconds_count', method='GET', endpoint='boom', status='500')
+    client.get('/boom')
+    assert sample('http_request_duration_seconds_count', method='GET', endpoint='boom', status='500') == before + 1
+    assert sample('http_requests_in_flight') == 0
+
+def test_upstream_call_status():
+    labels = {'upstream': 'tmdb', 'endpoint': '/movie/{id}'}
+    before_ok = sample('upstream_request_duration_seconds_count', status='200', **labels)
+    before_error = sample('upstream_request_duration_seconds_count', status='error', **labels)
+
+    with UpstreamCall('tmdb', '/movie/{id}') as call:
+        call.status = 200
+    try:
+        with UpstreamCall('tmdb', '/movie/{id}'):
+            raise ConnectionError('unreachable')
+    except ConnectionError:
+        pass
+
+    assert sample('upstream_request_duration_seconds_count', status='200', **labels) == before_ok + 1
+    assert sample('upstream_request_duration_seconds_count', status='error', **labels) == before_error + 1
+    assert sample('upstream_requests_in_flight', upstream='tmdb') == 0
+
+def test_metrics_endpoint_exposition():
+    client.get('/ok')
+    response = client.get('/metrics')
+    body = response.data.decode()
+
+    assert response.status_code == 200
+    assert response.content_type.startswith('text/plain')
+    assert 'http_request_duration_seconds_bucket{' in body
+    assert 'cache_lookups_total' in body
+
+if __name__ == "__main__":
+    test_endpoint_template_collapses_ids()
+    test_request_latency_per_route()
+    test_unhandled_errors_are_recorded_as_500()
+    test_upstream_call_status()
+    test_metrics_endpoint_exposition()
+    print("✅ All metrics tests passed!")
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-pass title classifier behind extract_quality
+"""
+
+import os
+import random
+import re
+from services.result_parsers import parse_results_lxml
+from services.torrent_result import TorrentResult
+from utils.formatters import _is_season_pack, extract_quality
+from utils.quality import classify_title
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'torrent_search')
+
+def legacy_extract_quality(title):
+    """The per-label scan extract_quality used before the compiled classifier"""
+    quality_patterns = ['4K', '2160p', '1080p', '720p', '480p', 'HDRip', 'BluRay', 'WEBRip', 'DVDRip']
+    for pattern in quality_patterns:
+        if pattern.lower() in title.lower():
+            return pattern
+    return None
+
+LEGACY_EPISODE_PATTERN = re.compile(r'S\d{2}E\d{2}', re.IGNORECASE)
+
+def legacy_is_season_pack(title):
+    """The SxxExx search the season-pack filter used before the compiled classifier"""
+    return not LEGACY_EPISODE_PATTERN.search(title)
+
+def is_season_pack(title):
+    return _is_season_pack(TorrentResult(title, 'magnet:?xt=urn:btih:' + '0' * 40))
+
+def test_quality_matches_legacy_on_fixtures():
+    for name in os.listdir(FIXTURES_DIR):
+        with open(os.path.join(FIXTURES_DIR, name), encoding='utf-8') as f:
+            for result in parse_results_lxml(f.read()):
+                assert extract_quality(result.title) == legacy_extract_quality(result.title), result.title
+
+def test_quality_matches_legacy_on_token_soup():
+    """Random mixes of labels, fragments and separators, including overlapping labels"""
+    rng = random.Random(0)
+    tokens = ['4K', '2160p', '1080P', '720p', '480p', 'HDRip', 'bluray', 'WEBRip', 'DVDRip', 'x264',
+              'HEVC', 'S01E02', 'web-dl', '4', 'k', 'p', '1080', 'rip', 'blu', 'ray', 'x2644K', 'dvdrip4k']
+    separators = ['', ' ', '.', '-', '_', '[', ']']
+
+    for _ in range(20_000):
+        title = ''.join(rng.choice(tokens) + rng.choice(separators) for _ in range(rng.randint(0, 6)))
+        assert extract_quality(title) == legacy_extract_quality(title), title
+
+def test_single_episodes_are_not_season_packs():
+    """Anything the old SxxExx filter rejected is still rejected, however the episode tag is glued on"""
+    for title in ['Show.S01E01E02.720p', 'ShowS01E01 720p', 'Show.S01E01v2', 'Show S01E01a',
+                  'Show.S01E01-E03.1080p', 'Show.2008S01E05', 'Show s1e2 720p', 'Show.S01E101.1080p']:
+        assert not is_season_pack(title), title
+
+    for title in ['Show S01 Complete 720p', 'Show Season 1 1080p', 'Show.S01.1080p.WEB-DL',
+                  'Show S01 E01-E10 Complete', 'Show.S01.E01-E08.720p', 'Show S1 E1-10 1080p']:
+        assert is_season_pack(title), title
+
+def test_season_pack_filter_never_keeps_legacy_episodes():
+    """Over fixtures and generated titles, every legacy episode match is still filtered out"""
+    titles = []
+    for name in os.listdir(FIXTURES_DIR):
+        with open(os.path.join(FIXTURES_DIR, name), encoding='utf-8') as f:
+            titles.extend(result.title for result in parse_results_lxml(f.read()))
+
+    rng = random.Random(1)
+    tokens = ['Show', 'S01', 'E02', 'S01E02', 's1', 'e', '10', 'v2', 'a', 'Season', '720p', 'x264', 'E', 'S']
+    separators = ['', ' ', '.', '-', '_']
+    for _ in range(20_000):
+        titles.append(''.join(rng.choice(tokens) + rng.choice(separators) for _ in range(rng.randint(0, 6))))
+
+    for title in titles:
+        if not legacy_is_season_pack(title):
+            assert not is_season_pack(title), title
+
+def test_structured_traits():
+    traits = classify_title('Dune Part Two 2024 2160p WEB-DL DV HDR10+ HEVC')
+    assert (traits.quality, traits.resolution, traits.source, traits.codec) == ('2160p', '2160p', 'WEB-DL', 'HEVC')
+    assert traits.hdr == ('DV', 'HDR10+')
+    assert (traits.season, traits.episode) == (None, None)
+
+    traits = classify_title('Breaking.Bad.S01E01.Pilot.720p.HDTV.x264')
+    assert (traits.resolution, traits.source, traits.codec) == ('720p', 'HDTV', 'x264')
+    assert (traits.season, traits.episode) == (1, 1)
+
+    traits = classify_title('The Office Season 3 Complete 480p DVDRip XviD')
+    assert (traits.season, traits.episode, traits.source, traits.codec) == (3, None, 'DVDRip', 'XviD')
+
+def test_resolution_prefers_highest():
+    """4K counts as 2160p, and the best resolution mentioned wins"""
+    assert classify_title('Movie 4K 1080p Dual').resolution == '2160p'
+    assert classify_title('Movie 720p-1080p').resolution == '1080p'
+
+if __name__ == "__main__":
+    test_quality_matches_legacy_on_fixtures()
+    test_quality_matches_legacy_on_token_soup()
+    test_single_episodes_are_not_season_packs()
+    test_season_pack_filter_never_keeps_legacy_episodes()
+    test_structured_traits()
+    test_resolution_prefers_highest()
+    print("✅ All quality tests passed!")
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for the token-bucket limiter that paces TMDB calls
+"""
+
+import time
+from utils.rate_limit import RateLimitExceeded, TokenBucket
+
+def test_burst_is_served_without_waiting():
+    """Up to capacity calls get a token immediately"""
+    bucket = TokenBucket(rate=10, capacity=3)
+    assert [bucket.reserve(max_wait=0) for _ in range(3)] == [0.0, 0.0, 0.0]
+
+def test_calls_beyond_burst_are_paced():
+    """Once the burst is spent callers are told how long to wait"""
+    bucket = TokenBucket(rate=10, capacity=1)
+    bucket.reserve(max_wait=0)
+
+    wait = bucket.reserve(max_wait=1)
+    assert 0.05 < wait <= 0.1
+
+def test_fail_fast_when_deadline_cannot_be_met():
+    """A caller whose deadline is too short gets no token and nothing is consumed"""
+    bucket = TokenBucket(rate=1, capacity=1)
+    bucket.reserve(max_wait=0)
+
+    assert bucket.reserve(max_wait=0.1) is None
+    assert 0.9 < bucket.retry_after() <= 1.0
+
+def test_pause_blocks_every_caller():
+    """Retry-After from upstream pauses the whole bucket"""
+    bucket = TokenBucket(rate=100, capacity=100)
+    bucket.pause(5)
+
+    assert bucket.reserve(max_wait=1) is None
+    assert bucket.retry_after() > 4
+
+def test_no_burst_builds_up_during_a_pause():
+    """Tokens do not accrue while paused; calls resume one at a time at the steady rate"""
+    bucket = TokenBucket(rate=10, capacity=100)
+    bucket.pause(0.05)
+    time.sleep(0.06)
+
+    assert bucket.reserve(max_wait=0) == 0.0
+    wait = bucket.reserve(max_wait=1)
+    assert 0.05 < wait <= 0.1
+
+def test_exception_carries_retry_after():
+    error = RateLimitExceeded(2.5)
+    assert error.retry_after == 2.5
+
+if __name__ == "__main__":
+    test_burst_is_served_without_waiting()
+    test_calls_beyond_burst_are_paced()
+    test_fail_fast_when_deadline_cannot_be_met()
+    test_pause_blocks_every_caller()
+    test_no_burst_builds_up_during_a_pause()
+    test_exception_carries_retry_after()
+    print("✅ All rate limit tests passed!")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent SQLite TMDB response cache and stale-while-revalidate logic
+"""
+
+import os
+import tempfile
+import time
+from config import BACKEND_DIR, Config, backend_path
+from services.response_cache import SQLiteResponseCache, make_cache_key
+from services.tmdb_client import TMDBClient
+
+def make_client(cache, responses):
+    """Build an enabled TMDBClient whose upstream fetch returns canned responses"""
+    original_key = Config.TMDB_API_KEY
+    Config.TMDB_API_KEY = 'test-key'
+    try:
+        client = TMDBClient(response_cache=cache)
+    finally:
+        Config.TMDB_API_KEY = original_key
+
+    client.fetch_count = 0
+    def fake_fetch(url, params=None, timeout=15):
+        client.fetch_count += 1
+        return responses.pop(0)
+    client._fetch = fake_fetch
+    return client
+
+def test_cache_key_is_param_order_independent():
+    """Keys are built from the URL plus sorted params"""
+    assert make_cache_key('u', {'b': 2, 'a': 1}) == make_cache_key('u', {'a': 1, 'b': 2})
+    assert make_cache_key('u') == 'u'
+
+def test_cache_path_resolves_against_backend_dir():
+    """A relative TMDB_CACHE_PATH does not depend on the working directory; empty still disables"""
+    assert backend_path('tmdb_cache.sqlite3') == os.path.join(BACKEND_DIR, 'tmdb_cache.sqlite3')
+    assert backend_path('/var/cache/tmdb.sqlite3') == '/var/cache/tmdb.sqlite3'
+    assert backend_path('') == ''
+    if Config.TMDB_CACHE_PATH:
+        assert os.path.isabs(Config.TMDB_CACHE_PATH)
+
+def test_sqlite_round_trip_survives_reopen():
+    """Entries persist across cache instances (warm restarts)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'cache.sqlite3')
+        SQLiteResponseCache(path).set('key', {'id': 550})
+
+        value, stored_at = SQLiteResponseCache(path).get('key')
+        assert value == {'id': 550}
+        assert stored_at <= time.time()
+
+def test_fresh_entries_skip_upstream():
+    """A fresh cached response is served without calling TMDB"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SQLiteResponseCache(os.path.join(tmp, 'cache.sqlite3'))
+        client = make_client(cache, [{'id': 550, 'title': 'Fight Club'}])
+
+        url = f"{client.base_url}/movie/550"
+        first = client._make_request(url, {'language': 'en-US'})
+        second = client._make_request(url, {'language': 'en-US'})
+
+        assert first == second == {'id': 550, 'title': 'Fight Club'}
+        assert client.fetch_count == 1
+
+def test_stale_entries_are_served_and_refreshed():
+    """A stale entry is returned immediately and refreshed in the background"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SQLiteResponseCache(os.path.join(tmp, 'cache.sqlite3'))
+        client = make_client(cache, [{'results': ['new']}])
+
+        url = f"{client.base_url}/search/movie"
+        key = make_cache_key(url, {'query': 'fight club'})
+        cache.set(key, {'results': ['old']})
+        # Age the entry past the search TTL but inside the stale window
+        cache._conn.execute(
+            'UPDATE responses SET stored_at = ?',
+            (time.time() - Config.TMDB_CACHE_SEARCH_TTL - 1,)
+        )
+
+        assert client._make_request(url, {'query': 'fight club'}) == {'results': ['old']}
+
+        deadline = time.time() + 2
+        while cache.get(key)[0] != {'results': ['new']} and time.time() < deadline:
+            time.sleep(0.01)
+        assert cache.get(key)[0] == {'results': ['new']}
+        assert client.fetch_count == 1
+
+if __name__ == "__main__":
+    test_cache_key_is_param_order_independent()
+    test_cache_path_resolves_against_backend_dir()
+    test_sqlite_round_trip_survives_reopen()
+    test_fresh_entries_skip_upstream()
+    test_stale_entries_are_served_and_refreshed()
+    print("✅ All response cache tests passed!")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Parity tests for the torrent result parser backends over saved search result pages
+"""
+
+import os
+from services.result_parsers import parse_results_html_parser, parse_results_lxml
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'torrent_search')
+
+def load_fixture(name):
+    """Read a saved search results page"""
+    with open(os.path.join(FIXTURES_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+def fixture_names():
+    return sorted(name for name in os.listdir(FIXTURES_DIR) if name.endswith('.html'))
+
+def test_lxml_matches_html_parser_on_fixtures():
+    """The lxml fast path returns exactly what the html.parser fallback returns"""
+    for name in fixture_names():
+        html = load_fixture(name)
+        expected = parse_results_html_parser(html)
+        assert expected, f"{name}: fixture produced no rows"
+        assert parse_results_lxml(html) == expected, f"{name}: parser mismatch"
+
+def test_parsed_row_fields():
+    """Rows carry clean title, magnet and size, with seeders and leechers as ints"""
+    results = parse_results_lxml(load_fixture('tv_breaking_bad_s01.html'))
+    first = results[0]
+
+    assert first.title == 'Breaking Bad S01 1080p BluRay x264-ROVERS'
+    assert first.magnet.startswith('magnet:?xt=urn:btih:')
+    assert first.size == '9.86 GiB'
+    assert first.seeders == 312
+    assert first.leechers == 40
+
+def test_rows_without_magnet_or_title_link_are_skipped():
+    """Rows missing the magnet link or detLink anchor are dropped, missing size is None"""
+    titles = {result.title: result for result in parse_results_lxml(load_fixture('tv_breaking_bad_s01.html'))}
+
+    assert 'Breaking Bad S01 no magnet' not in titles
+    assert 'Breaking Bad S01 no detlink' not in titles
+    assert titles['Breaking Bad S01 unknown size'].size is None
+
+EDGE_CASE_PAGE = """<table id="searchResult">
+<tr><td>Video</td><td>
+<div class="detName"><a href="/torrent/1" class="detLink" title="Details for Comma Uploader 720p">Comma Uploader 720p</a></div>
+<a href="magnet:?xt=urn:btih:%s" title="Download this torrent using magnet">m</a>
+<font class="detDesc">Uploaded 01-02&nbsp;2020, Size 700&nbsp;MiB, ULed by <a class="detDesc" href="/user/a,b/">a, b</a></font>
+</td><td>10</td><td>2</td></tr>
+<tr><td>Video</td><td>
+<div class="detName"><a href="/torrent/2" class="detLink" title="Details for Marked Up Size 1080p">Marked Up Size 1080p</a></div>
+<a href="magnet:?xt=urn:btih:%s" title="Download this torrent using magnet">m</a>
+<font class="detDesc">Uploaded 01-02&nbsp;2020, Size 1.4&nbsp;<b>GiB</b>, ULed by <a class="detDesc" href="/user/x/">x</a></font>
+</td><td>5</td><td>1</td></tr>
+</table>""" % ('a' * 40, 'b' * 40)
+
+def test_parsers_agree_on_sizes_in_odd_markup():
+    """Both parsers read the size up to the first comma of the cell text"""
+    expected = parse_results_html_parser(EDGE_CASE_PAGE)
+
+    assert [result.size for result in expected] == ['700 MiB', '1.4 GiB']
+    assert parse_results_lxml(EDGE_CASE_PAGE) == expected
+
+def test_empty_page():
+    """Empty pages parse to no results"""
+    assert parse_results_lxml('') == []
+    assert parse_results_html_parser('') == []
+
+if __name__ == "__main__":
+    test_lxml_matches_html_parser_on_fixtures()
+    test_parsed_row_fields()
+    test_rows_without_magnet_or_title_link_are_skipped()
+    test_parsers_agree_on_sizes_in_odd_markup()
+    test_empty_page()
+    print("✅ All result parser tests passed!")
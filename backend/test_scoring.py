@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Parity tests for vectorized torrent scoring against the scalar scoring function
+"""
+
+import random
+from utils.formatters import calculate_torrent_score, format_torrent_results
+from services.torrent_result import TorrentResult
+from utils.scoring import calculate_torrent_scores
+
+GIB = 1024**3
+
+def test_batch_scores_are_bit_identical():
+    """Every tier boundary and a random sample score exactly like the scalar function"""
+    rng = random.Random(42)
+    seeders = [0, 1, 2, 3, 4, 5, 8, 9, 10, 11, 19, 20, 25, 26, 50, 51, 125, 10_000]
+    sizes = [0, 1, 50 * 1024**2, int(0.3 * GIB), int(0.7 * GIB), GIB, int(2.5 * GIB), 6 * GIB, 9 * GIB, 40 * GIB]
+    pairs = [(size, seeder) for size in sizes for seeder in seeders]
+    pairs += [(rng.randint(0, 60 * GIB), rng.choice([rng.randint(0, 60), rng.randint(0, 50_000)])) for _ in range(20_000)]
+
+    batch = calculate_torrent_scores([size for size, _ in pairs], [seeder for _, seeder in pairs])
+    for (size, seeder), score in zip(pairs, batch.tolist()):
+        assert score == calculate_torrent_score(size, seeder), (size, seeder)
+
+def test_empty_batch():
+    assert calculate_torrent_scores([], []).tolist() == []
+
+def test_format_order_matches_scalar_sort():
+    """format_torrent_results ranks exactly as sorting by the scalar score did"""
+    rng = random.Random(7)
+    results = [
+        TorrentResult(
+            f'Movie {i} 1080p',
+            f'magnet:?xt=urn:btih:{i:040x}',
+            f'{rng.uniform(0.01, 30):.2f} GiB',
+            rng.choice([0, 1, 3, 12, 40, 900]),
+            1
+        )
+        for i in range(600)
+    ]
+
+    formatted = format_torrent_results(results)
+    expected = sorted(
+        (result for result in results if result.seeders),
+        key=lambda result: calculate_torrent_score(int(float(result.size.split()[0]) * GIB), result.seeders),
+        reverse=True
+    )
+    assert [result['magnet'] for result in formatted] == [result.magnet for result in expected]
+
+def test_limit_selects_top_k():
+    """A limit returns the same leading torrents, in the same order, as the full ranking"""
+    rng = random.Random(3)
+    results = [
+        TorrentResult(
+            f'Show S01 {i} 720p',
+            f'magnet:?xt=urn:btih:{i:040x}',
+            f'{rng.choice([0.5, 1.2, 4.0])} GiB',
+            rng.choice([1, 5, 12])
+        )
+        for i in range(80)
+    ]
+
+    ranked = format_torrent_results(results)
+    assert format_torrent_results(results, limit=7) == ranked[:7]
+    assert format_torrent_results(results, limit=500) == ranked
+
+if __name__ == "__main__":
+    test_batch_scores_are_bit_identical()
+    test_empty_batch()
+    test_format_order_matches_scalar_sort()
+    test_limit_selects_top_k()
+    print("✅ All scoring tests passed!")
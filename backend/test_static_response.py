@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Tests for pre-serialized, ETag'd responses served by / and /schema
+"""
+
+import gzip
+import json
+from flask import Flask
+from utils.static_response import PrecomputedResponse
+
+app = Flask(__name__)
+payload = {'api_name': 'Torrent Search API', 'endpoints': ['/', '/schema']}
+precomputed = PrecomputedResponse(payload, max_age=60)
+
+@app.route('/docs')
+def docs():
+    return precomputed.to_response()
+
+client = app.test_client()
+
+def test_serves_json_with_strong_etag():
+    """Identity responses carry the JSON body, a strong ETag and Cache-Control"""
+    response = client.get('/docs')
+
+    assert response.status_code == 200
+    assert json.loads(response.data) == payload
+    assert response.headers['ETag'] == f'"{precomputed.etag}"'
+    assert response.headers['Cache-Control'] == 'public, max-age=60'
+    assert response.headers['Vary'] == 'Accept-Encoding'
+
+def test_if_none_match_returns_304():
+    """A matching If-None-Match gets 304 with no body"""
+    etag = client.get('/docs').headers['ETag']
+    response = client.get('/docs', headers={'If-None-Match': etag})
+
+    assert response.status_code == 304
+    assert response.data == b''
+    assert response.headers['ETag'] == etag
+
+def test_gzip_variant():
+    """Clients accepting gzip get the pre-compressed body with its own ETag"""
+    response = client.get('/docs', headers={'Accept-Encoding': 'gzip'})
+
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert json.loads(gzip.decompress(response.data)) == payload
+    assert response.headers['ETag'] != f'"{precomputed.etag}"'
+
+if __name__ == "__main__":
+    test_serves_json_with_strong_etag()
+    test_if_none_match_returns_304()
+    test_gzip_variant()
+    print("✅ All static response tests passed!")
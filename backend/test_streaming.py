@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Tests for streamed (NDJSON / Server-Sent Events) detail responses
+"""
+
+import json
+import threading
+import time
+from flask import Flask
+from config import Config
+from routes import search_routes
+from services.torrent_result import TorrentResult
+from utils.concurrency import run_concurrently
+from utils.formatters import TorrentMerger, iter_torrent_batches
+from utils.rate_limit import RateLimitExceeded
+from utils.streaming import event_stream_response
+
+app = Flask(__name__)
+
+def events():
+    yield 'details', {'status': 'success', 'tmdb_details': {'id': 1}}
+    yield 'summary', {'status': 'success', 'torrent_count': 0, 'torrent_results': []}
+
+def failing_events():
+    yield 'details', {'status': 'success'}
+    raise RuntimeError('mirror went away')
+
+@app.route('/ndjson')
+def ndjson():
+    return event_stream_response(events(), 'ndjson')
+
+@app.route('/sse')
+def sse():
+    return event_stream_response(events(), 'sse')
+
+@app.route('/broken')
+def broken():
+    return event_stream_response(failing_events(), 'ndjson')
+
+app.register_blueprint(search_routes.search_bp)
+client = app.test_client()
+
+def test_ndjson_lines_carry_event_names():
+    response = client.get('/ndjson')
+    lines = [json.loads(line) for line in response.data.decode().splitlines()]
+
+    assert response.mimetype == 'application/x-ndjson'
+    assert [line['event'] for line in lines] == ['details', 'summary']
+    assert lines[0]['tmdb_details'] == {'id': 1}
+
+def test_sse_messages():
+    response = client.get('/sse')
+    messages = response.data.decode().strip().split('\n\n')
+
+    assert response.mimetype == 'text/event-stream'
+    assert response.headers['Cache-Control'] == 'no-cache'
+    assert messages[0].startswith('event: details\ndata: {')
+
+def test_failure_mid_stream_becomes_error_event():
+    lines = [json.loads(line) for line in client.get('/broken').data.decode().splitlines()]
+    assert [line['event'] for line in lines] == ['details', 'error']
+    assert lines[1]['message'] == 'mirror went away'
+
+class SlowMirror:
+    """Regular movie search answers at once, the HD search is slow"""
+
+    def search_movies(self, query, use_cache=True):
+        return [TorrentResult(f'{query} 720p', 'magnet:?xt=urn:btih:' + 'a' * 40, '1 GiB', 5)]
+
+    def search_hd_movies(self, query, use_cache=True):
+        time.sleep(0.2)
+        return [TorrentResult(f'{query} 1080p', 'magnet:?xt=urn:btih:' + 'A' * 40, '2 GiB', 9)]
+
+def test_batches_arrive_as_categories_finish():
+    """The fast category is yielded before the slow one finishes, and both merge by infohash"""
+    merger = TorrentMerger()
+    start = time.time()
+    batches = iter_torrent_batches(SlowMirror(), 'Inception', 'movie', merger=merger)
+
+    category, query, results = next(batches)
+    assert (category, query, len(results)) == ('movies', 'Inception', 1)
+    assert time.time() - start < 0.15
+
+    assert [category for category, _, _ in batches] == ['hd_movies']
+    merged, = merger.results()
+    assert merged.seeders == 9
+
+class SlowSeasonTMDB:
+    """Show lookup answers at once, the season lookup is slow"""
+    enabled = True
+
+    def get_tv_details(self, tv_id):
+        return {'id': tv_id, 'name': 'Breaking Bad'}
+
+    def get_tv_season_details(self, tv_id, season_number):
+        time.sleep(0.2)
+        return {'id': 3572, 'season_number': season_number, 'episodes': []}
+
+class SlowTVMirror:
+    """Every TV category search takes as long as the season lookup"""
+
+    def search_tv_shows(self, query, use_cache=True):
+        time.sleep(0.2)
+        return [TorrentResult(f'{query} 720p', 'magnet:?xt=urn:btih:' + 'b' * 40, '5 GiB', 5)]
+
+    def search_hd_tv_shows(self, query, use_cache=True):
+        time.sleep(0.2)
+        return [TorrentResult(f'{query} 1080p', 'magnet:?xt=urn:btih:' + 'c' * 40, '9 GiB', 9)]
+
+def test_streamed_season_overlaps_tmdb_and_torrents():
+    """Torrent searches start with the show name, not after the season lookup finishes"""
+    originals = search_routes.tmdb_client, search_routes.torrent_finder
+    search_routes.tmdb_client, search_routes.torrent_finder = SlowSeasonTMDB(), SlowTVMirror()
+    try:
+        start = time.time()
+        response = client.get('/details/tv/1396/season/1?stream=ndjson&cache=false')
+        lines = [json.loads(line) for line in response.data.decode().splitlines()]
+        elapsed = time.time() - start
+    finally:
+        search_routes.tmdb_client, search_routes.torrent_finder = originals
+
+    events = [line['event'] for line in lines]
+    assert events[0] == 'details' and events[-1] == 'summary'
+    assert events.count('torrents') == 4
+    assert lines[0]['season_details']['season_number'] == 1
+    assert lines[-1]['torrent_count'] == 2
+    # Sequential lookup then scrape would take 0.4s
+    assert elapsed < 0.35
+
+class MissingSeasonTMDB(SlowSeasonTMDB):
+    """The show exists but the season lookup comes back empty (or throttled)"""
+
+    def __init__(self, error=None):
+        self.error = error
+
+    def get_tv_season_details(self, tv_id, season_number):
+        if self.error is not None:
+            raise self.error
+        return None
+
+class RecordingMirror:
+    """Records every category search that actually runs"""
+
+    def __init__(self):
+        self.searches = []
+
+    def search_tv_shows(self, query, use_cache=True):
+        self.searches.append(query)
+        return []
+
+    search_hd_tv_shows = search_tv_shows
+
+def test_failed_season_lookup_cancels_queued_searches():
+    """A 404 or 503 before streaming starts leaves none of the started torrent searches to run"""
+    for tmdb, status in [(MissingSeasonTMDB(), 404), (MissingSeasonTMDB(RateLimitExceeded(2)), 503)]:
+        mirror = RecordingMirror()
+        release = threading.Event()
+        # Occupy every scrape worker so the route's searches are still queued when it answers
+        busy = threading.Thread(
+            target=run_concurrently,
+            args=([(release.wait, 1) for _ in range(Config.SCRAPE_MAX_WORKERS)],),
+            kwargs={'max_concurrency': Config.SCRAPE_MAX_WORKERS}
+        )
+        busy.start()
+        originals = search_routes.tmdb_client, search_routes.torrent_finder
+        search_routes.tmdb_client, search_routes.torrent_finder = tmdb, mirror
+        try:
+            time.sleep(0.05)
+            response = client.get('/details/tv/1396/season/1?stream=ndjson&cache=false')
+        finally:
+            search_routes.tmdb_client, search_routes.torrent_finder = originals
+            release.set()
+            busy.join()
+
+        assert response.status_code == status
+        time.sleep(0.05)
+        assert mirror.searches == []
+
+if __name__ == "__main__":
+    test_ndjson_lines_carry_event_names()
+    test_sse_messages()
+    test_failure_mid_stream_becomes_error_event()
+    test_batches_arrive_as_categories_finish()
+    test_streamed_season_overlaps_tmdb_and_torrents()
+    test_failed_season_lookup_cancels_queued_searches()
+    print("✅ All streaming tests passed!")
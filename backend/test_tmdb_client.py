@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Tests for collapsing TMDB details and credits into one append_to_response call
+"""
+
+import copy
+import json
+import os
+from config import Config
+from services.tmdb_client import TMDBClient
+from utils.formatters import format_tmdb_details
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'tmdb')
+
+def load(name):
+    with open(os.path.join(FIXTURES_DIR, name), encoding='utf-8') as f:
+        return json.load(f)
+
+def make_client(response):
+    """Build an enabled, uncached TMDBClient whose upstream fetch records its calls"""
+    original_key = Config.TMDB_API_KEY
+    Config.TMDB_API_KEY = 'test-key'
+    try:
+        client = TMDBClient()
+    finally:
+        Config.TMDB_API_KEY = original_key
+    client.response_cache = None
+
+    client.calls = []
+    def fake_fetch(url, params=None, timeout=15):
+        client.calls.append((url, params))
+        return copy.deepcopy(response)
+    client._fetch = fake_fetch
+    return client
+
+def test_movie_details_and_credits_in_one_call():
+    """Credits ride along on the details request and are trimmed to the top 10"""
+    client = make_client(load('movie_27205.json'))
+    details = client.get_movie_details(27205, append_to_response=['credits', 'external_ids'])
+
+    (url, params), = client.calls
+    assert url.endswith('/movie/27205')
+    assert params['append_to_response'] == 'credits,external_ids'
+    cast = details['credits']['cast']
+    assert len(cast) == 10
+    assert [member['popularity'] for member in cast] == sorted((member['popularity'] for member in cast), reverse=True)
+
+def test_plain_details_skip_append_to_response():
+    """Without sub-resources the request carries no append_to_response param"""
+    client = make_client({'id': 27205, 'title': 'Inception'})
+    client.get_movie_details(27205)
+
+    (_, params), = client.calls
+    assert 'append_to_response' not in params
+
+def test_formatter_reads_appended_credits_and_external_ids():
+    """format_tmdb_details uses appended credits and falls back to external_ids for imdb_id"""
+    movie = load('movie_27205.json')
+    formatted = format_tmdb_details(movie)
+    assert formatted['credits']
+    assert formatted['credits'] == format_tmdb_details(movie, movie['credits'])['credits']
+
+    show = dict(load('tv_1396.json'), external_ids={'imdb_id': 'tt0903747'})
+    assert format_tmdb_details(show)['imdb_id'] == 'tt0903747'
+
+if __name__ == "__main__":
+    test_movie_details_and_credits_in_one_call()
+    test_plain_details_skip_append_to_response()
+    test_formatter_reads_appended_credits_and_external_ids()
+    print("✅ All TMDB client tests passed!")
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for TorrentFinder's pooled keep-alive session and its result cache
+"""
+
+import os
+import requests
+from config import Config
+from services.torrent_finder import TorrentFinder, search_cache
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'torrent_search', 'movies_inception.html')
+
+class FakeResponse:
+    def __init__(self, status_code, text=''):
+        self.status_code = status_code
+        self.text = text
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f'{self.status_code} error')
+
+class FakeSession:
+    """Answers with queued responses and records every GET"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, timeout=None):
+        self.calls.append((url, timeout))
+        return self.responses.pop(0)
+
+def page():
+    with open(FIXTURE, encoding='utf-8') as f:
+        return f.read()
+
+def test_session_is_pooled_with_retries():
+    """One keep-alive session per finder, mounted with a sized pool and 5xx retries"""
+    finder = TorrentFinder()
+    adapter = finder.session.get_adapter(f'{finder.scheme}://{finder.base_domain}/')
+
+    assert isinstance(finder.session, requests.Session)
+    assert finder.session.headers['User-Agent'].startswith('Mozilla/5.0')
+    assert adapter._pool_maxsize == Config.TORRENT_POOL_SIZE
+    assert adapter.max_retries.total == Config.TORRENT_MAX_RETRIES
+    assert set(adapter.max_retries.status_forcelist) == {500, 502, 503, 504}
+    assert finder.timeout == (Config.TORRENT_CONNECT_TIMEOUT, Config.TORRENT_READ_TIMEOUT)
+
+def test_fetches_reuse_the_session_with_timeouts():
+    """Every scrape goes through the same session and carries the connect/read timeouts"""
+    finder = TorrentFinder()
+    finder.session = FakeSession([FakeResponse(200, 'one'), FakeResponse(200, 'two')])
+
+    assert finder.fetch_html('https://mirror/a') == 'one'
+    assert finder.fetch_html('https://mirror/b') == 'two'
+    assert finder.session.calls == [('https://mirror/a', finder.timeout), ('https://mirror/b', finder.timeout)]
+
+def test_results_are_cached_but_failures_are_not():
+    """A repeat search is served from the cache; a failed scrape is retried next time"""
+    search_cache.clear()
+    finder = TorrentFinder()
+    finder.session = FakeSession([FakeResponse(503), FakeResponse(200, page())])
+    try:
+        assert finder.search_movies('Inception') == []
+        results = finder.search_movies('Inception')
+        assert results
+        assert finder.search_movies('Inception') == results
+        assert len(finder.session.calls) == 2
+
+        # use_cache=False always scrapes
+        finder.session.responses.append(FakeResponse(200, page()))
+        assert finder.search_movies('Inception', use_cache=False) == results
+        assert len(finder.session.calls) == 3
+    finally:
+        search_cache.clear()
+
+if __name__ == "__main__":
+    test_session_is_pooled_with_retries()
+    test_fetches_reuse_the_session_with_timeouts()
+    test_results_are_cached_but_failures_are_not()
+    print("✅ All torrent finder tests passed!")
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Tests for infohash parsing and the streaming cross-category torrent merge
+"""
+
+import base64
+import os
+from services.result_parsers import parse_results_lxml
+from services.torrent_result import TorrentResult
+from utils.formatters import TorrentMerger, remove_duplicate_torrents
+from utils.magnet import magnet_trackers, parse_infohash
+
+HEX_HASH = 'e629ab00c66939ef43f4d93fb71bd30200f14fc2'
+FIXTURE = os.path.join(os.path.dirname(__file__), 'fixtures', 'torrent_search', 'tv_breaking_bad_s01.html')
+
+def magnet(infohash, name, *trackers):
+    return f"magnet:?xt=urn:btih:{infohash}&dn={name}" + ''.join(f"&tr={tracker}" for tracker in trackers)
+
+def test_infohash_is_normalized():
+    """Upper/lowercase hex and base32 hashes all normalize to lowercase hex"""
+    base32_hash = base64.b32encode(bytes.fromhex(HEX_HASH)).decode()
+
+    assert parse_infohash(magnet(HEX_HASH.upper(), 'a')) == HEX_HASH
+    assert parse_infohash(magnet(base32_hash, 'b')) == HEX_HASH
+    assert parse_infohash('magnet:?dn=no-hash') is None
+    assert parse_infohash(None) is None
+
+def test_duplicates_merge_counts_and_trackers():
+    """Sightings of one torrent merge into the best-seeded row with every tracker"""
+    regular = TorrentResult('Show S01 720p', magnet(HEX_HASH.upper(), 'Show', 'udp%3A%2F%2Fa'), '1 GiB', 10, 4)
+    hd = TorrentResult('Show.S01.720p', magnet(HEX_HASH, 'Show.S01', 'udp%3A%2F%2Fb'), '1 GiB', 25, 2)
+
+    merged, = remove_duplicate_torrents([regular, hd])
+    assert merged.title == 'Show.S01.720p'
+    assert (merged.seeders, merged.leechers) == (25, 4)
+    assert magnet_trackers(merged.magnet) == ['udp://b', 'udp://a']
+
+def test_merge_order_does_not_depend_on_arrival():
+    """Batches added out of order give the same results as in-order ones"""
+    rows = parse_results_lxml(open(FIXTURE, encoding='utf-8').read())
+    batches = [rows[:5], rows[5:]]
+
+    in_order, reversed_order = TorrentMerger(), TorrentMerger()
+    for source, batch in enumerate(batches):
+        in_order.add(batch, source=source)
+    for source, batch in reversed(list(enumerate(batches))):
+        reversed_order.add(batch, source=source)
+
+    assert in_order.results() == reversed_order.results()
+
+def test_fixture_duplicate_is_merged():
+    """The fixture page lists one season pack twice with different trackers"""
+    rows = parse_results_lxml(open(FIXTURE, encoding='utf-8').read())
+    unique = remove_duplicate_torrents(rows)
+
+    assert len(unique) == len(rows) - 1
+    pack, = [result for result in unique if result.infohash == HEX_HASH]
+    assert len(magnet_trackers(pack.magnet)) == 5
+
+if __name__ == "__main__":
+    test_infohash_is_normalized()
+    test_duplicates_merge_counts_and_trackers()
+    test_merge_order_does_not_depend_on_arrival()
+    test_fixture_duplicate_is_merged()
+    print("✅ All torrent merge tests passed!")
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests for the concurrent torrent category fan-out behind search_torrents_for_title
+"""
+
+import threading
+import time
+from services.torrent_result import TorrentResult
+from utils.formatters import search_torrents_for_title, torrent_search_plan
+
+class SlowCategories:
+    """Every category search takes 0.2s and records the query it was given"""
+
+    def __init__(self):
+        self.queries = []
+        self.lock = threading.Lock()
+
+    def _search(self, query, infohash, seeders):
+        with self.lock:
+            self.queries.append(query)
+        time.sleep(0.2)
+        return [TorrentResult(f'{query} {seeders}', 'magnet:?xt=urn:btih:' + infohash * 40, '2 GiB', seeders)]
+
+    def search_movies(self, query, use_cache=True):
+        return self._search(query, 'a', 5)
+
+    def search_hd_movies(self, query, use_cache=True):
+        return self._search(query, 'b', 9)
+
+    def search_tv_shows(self, query, use_cache=True):
+        return self._search(query, 'c' if 'Season' in query else 'd', 4)
+
+    def search_hd_tv_shows(self, query, use_cache=True):
+        return self._search(query, 'e' if 'Season' in query else 'f', 7)
+
+def test_movie_categories_are_searched_concurrently():
+    """Regular and HD movie searches overlap instead of running back to back"""
+    start = time.time()
+    results = search_torrents_for_title(SlowCategories(), 'Inception', 'movie', use_cache=False)
+    elapsed = time.time() - start
+
+    assert [result['seeders'] for result in results] == [9, 5]
+    # Sequential searches would take 0.4s
+    assert elapsed < 0.35
+
+def test_season_plan_keeps_pattern_order():
+    """Season searches run regular + HD per pattern, in pattern order"""
+    finder = SlowCategories()
+    calls, keep = torrent_search_plan(finder, 'Breaking Bad', 'tv', season=1)
+
+    assert [(search.__name__, query) for search, query, _ in calls] == [
+        ('search_tv_shows', 'Breaking Bad S01'),
+        ('search_hd_tv_shows', 'Breaking Bad S01'),
+        ('search_tv_shows', 'Breaking Bad Season 1'),
+        ('search_hd_tv_shows', 'Breaking Bad Season 1'),
+    ]
+    assert keep is not None
+
+def test_episode_searches_overlap():
+    """All four episode searches are in flight at once and every result is merged"""
+    finder = SlowCategories()
+    start = time.time()
+    results = search_torrents_for_title(finder, 'Breaking Bad', 'tv', season=1, episode=2, use_cache=False)
+    elapsed = time.time() - start
+
+    assert sorted(finder.queries) == sorted([
+        'Breaking Bad S01E02', 'Breaking Bad S01E02',
+        'Breaking Bad Season 1 Episode 2', 'Breaking Bad Season 1 Episode 2',
+    ])
+    assert len(results) == 4
+    # Sequential searches would take 0.8s
+    assert elapsed < 0.35
+
+if __name__ == "__main__":
+    test_movie_categories_are_searched_concurrently()
+    test_season_plan_keeps_pattern_order()
+    test_episode_searches_overlap()
+    print("✅ All torrent search tests passed!")
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests for request tracing: spans, Server-Timing headers and the slow-request log
+"""
+
+import logging
+import time
+from flask import Flask, jsonify
+from config import Config
+from utils.static_response import PrecomputedResponse
+from utils.concurrency import run_concurrently
+from utils.streaming import event_stream_response
+from utils.tracing import Span, finish_trace, start_trace, trace_requests
+
+app = Flask(__name__)
+trace_requests(app)
+
+def scrape(query):
+    with Span('scrape', query):
+        time.sleep(0.01)
+    return query
+
+@app.route('/traced')
+def traced():
+    with Span('tmdb', '/tv/{id}'):
+        pass
+    run_concurrently([(scrape, 'Show S01'), (scrape, 'Show Season 1')], max_concurrency=2)
+    return jsonify({'status': 'success'})
+
+precomputed = PrecomputedResponse({'status': 'success'}, max_age=60)
+
+@app.route('/public')
+def public():
+    return precomputed.to_response()
+
+@app.route('/streamed')
+def streamed():
+    def events():
+        with Span('scrape', 'late'):
+            pass
+        yield 'summary', {'status': 'success'}
+    return event_stream_response(events(), 'ndjson')
+
+client = app.test_client()
+
+def get_with_server_timing(path, **kwargs):
+    """GET with the Server-Timing header switched on (it is off by default)"""
+    enabled = Config.SERVER_TIMING
+    Config.SERVER_TIMING = True
+    try:
+        return client.get(path, **kwargs)
+    finally:
+        Config.SERVER_TIMING = enabled
+
+class Captured(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+def test_spans_outside_a_request_are_ignored():
+    with Span('tmdb', '/movie/{id}') as span:
+        pass
+    assert span._trace is None
+
+def test_server_timing_covers_worker_thread_spans():
+    header = get_with_server_timing('/traced').headers['Server-Timing']
+    entries = [entry.split(';')[0] for entry in header.split(', ')]
+
+    assert entries[0] == 'total'
+    assert entries.count('scrape') == 2
+    assert 'tmdb' in entries
+    assert 'desc="Show Season 1"' in header
+
+def test_descriptions_are_header_safe():
+    token = start_trace('GET', '/details/movie/1')
+    with Span('scrape', 'Amélie "2001"'):
+        pass
+    trace = finish_trace(token)
+    assert 'desc="Am?lie \'2001\'"' in trace.server_timing()
+
+def test_slow_requests_are_logged_with_breakdown():
+    captured = Captured()
+    logging.getLogger().addHandler(captured)
+    threshold, rate = Config.SLOW_REQUEST_MS, Config.SLOW_REQUEST_LOG_SAMPLE_RATE
+    Config.SLOW_REQUEST_MS, Config.SLOW_REQUEST_LOG_SAMPLE_RATE = 0, 1.0
+    try:
+        client.get('/traced')
+    finally:
+        Config.SLOW_REQUEST_MS, Config.SLOW_REQUEST_LOG_SAMPLE_RATE = threshold, rate
+        logging.getLogger().removeHandler(captured)
+
+    slow, = [message for message in captured.messages if message.startswith('Slow request')]
+    assert 'GET /traced (200)' in slow
+    assert 'scrape Show S01' in slow
+
+def test_streamed_responses_finish_their_trace():
+    response = get_with_server_timing('/streamed')
+    assert response.data
+    assert response.headers['Server-Timing'].startswith('total;dur=')
+
+def test_server_timing_is_opt_in():
+    assert 'Server-Timing' not in client.get('/traced').headers
+
+def test_cacheable_and_not_modified_responses_have_no_server_timing():
+    """Public responses may be stored by shared caches, so they never expose stage details"""
+    response = get_with_server_timing('/public')
+    assert response.status_code == 200
+    assert 'Server-Timing' not in response.headers
+
+    response = get_with_server_timing('/public', headers={'If-None-Match': response.headers['ETag']})
+    assert response.status_code == 304
+    assert 'Server-Timing' not in response.headers
+
+if __name__ == "__main__":
+    test_spans_outside_a_request_are_ignored()
+    test_server_timing_covers_worker_thread_spans()
+    test_descriptions_are_header_safe()
+    test_slow_requests_are_logged_with_breakdown()
+    test_streamed_responses_finish_their_trace()
+    test_server_timing_is_opt_in()
+    test_cacheable_and_not_modified_responses_have_no_server_timing()
+    print("✅ All tracing tests passed!")
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-worker warm-up deadline
+"""
+
+import threading
+import time
+import app as app_module
+
+def test_warm_up_stops_waiting_at_the_deadline():
+    """A hanging upstream cannot hold warm-up past its deadline; the probe still completes later"""
+    finished = threading.Event()
+    original = app_module.health_prober.probe_once
+
+    def slow_probe():
+        time.sleep(0.5)
+        finished.set()
+
+    app_module.health_prober.probe_once = slow_probe
+    try:
+        seconds = app_module.warm_up(deadline=0.1)
+        assert seconds < 0.3
+        assert not finished.is_set()
+        assert finished.wait(1)
+    finally:
+        app_module.health_prober.probe_once = original
+
+def test_warm_up_without_deadline_waits():
+    calls = []
+    original = app_module.health_prober.probe_once
+    app_module.health_prober.probe_once = lambda: calls.append('probe')
+    try:
+        app_module.warm_up()
+        assert calls == ['probe']
+    finally:
+        app_module.health_prober.probe_once = original
+
+if __name__ == "__main__":
+    test_warm_up_stops_waiting_at_the_deadline()
+    test_warm_up_without_deadline_waits()
+    print("✅ All warm-up tests passed!")
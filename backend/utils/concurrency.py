@@ -0,0 +1,274 @@
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
+from config import Config
+
+# Shared pool for upstream scrapes - its size is the global concurrency cap
+_scrape_executor = ThreadPoolExecutor(
+    max_workers=Config.SCRAPE_MAX_WORKERS,
+    thread_name_prefix='scrape'
+)
+
+# Pool for batched TMDB lookups, so they never take scrape slots (and vice versa)
+_lookup_executor = ThreadPoolExecutor(
+    max_workers=Config.LOOKUP_MAX_WORKERS,
+    thread_name_prefix='lookup'
+)
+
+# Separate pool for request-level tasks, which may themselves fan out into the scrape pool
+_task_executor = ThreadPoolExecutor(
+    max_workers=Config.TASK_MAX_WORKERS,
+    thread_name_prefix='task'
+)
+
+def run_concurrently(calls, max_concurrency=None):
+    """
+    Run (func, *args) calls on the shared scrape pool and return their results in order.
+
+    At most max_concurrency calls from this batch are in flight at once
+    (defaults to Config.SCRAPE_REQUEST_CONCURRENCY), so a single request
+    cannot monopolise the shared pool.
+    """
+    return _run_on(_scrape_executor, calls, max_concurrency or Config.SCRAPE_REQUEST_CONCURRENCY)
+
+def run_lookups_concurrently(calls, max_concurrency=None):
+    """
+    Run (func, *args) TMDB lookups like run_concurrently, but on the lookup
+    pool, so a batch of metadata lookups never waits behind (or starves)
+    torrent scrapes. max_concurrency defaults to Config.BATCH_CONCURRENCY.
+    """
+    return _run_on(_lookup_executor, calls, max_concurrency or Config.BATCH_CONCURRENCY)
+
+def _run_on(executor, calls, max_concurrency):
+    calls = list(calls)
+    if not calls:
+        return []
+
+    request_slots = threading.BoundedSemaphore(max_concurrency)
+    futures = []
+
+    for func, *args in calls:
+        request_slots.acquire()
+        # Run in a copy of the caller's context so context-local state follows the call
+        context = contextvars.copy_context()
+        future = executor.submit(context.run, func, *args)
+        future.add_done_callback(lambda _: request_slots.release())
+        futures.append(future)
+
+    return [future.result() for future in futures]
+
+def iter_concurrently(calls, max_concurrency=None):
+    """
+    Run (func, *args) calls like run_concurrently, and return an iterator of
+    (index, result) pairs in completion order so callers can consume early
+    results while slower calls are still in flight.
+
+    The first max_concurrency calls are submitted before this returns, so the
+    work overlaps whatever the caller does before it starts iterating. Call
+    close() on the iterator when its results are no longer wanted.
+    """
+    return ConcurrentCalls(calls, max_concurrency or Config.SCRAPE_REQUEST_CONCURRENCY)
+
+class ConcurrentCalls:
+    """Iterator behind iter_concurrently(), refilling freed slots from the pending calls"""
+
+    def __init__(self, calls, max_concurrency):
+        self._pending = list(enumerate(calls))
+        self._pending.reverse()
+        self._running = {}  # future -> call index
+
+        while self._pending and len(self._running) < max_concurrency:
+            self._submit_next()
+
+    def _submit_next(self):
+        index, (func, *args) = self._pending.pop()
+        # Run in a copy of the caller's context so context-local state follows the call
+        context = contextvars.copy_context()
+        self._running[_scrape_executor.submit(context.run, func, *args)] = index
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if not self._running:
+            raise StopIteration
+        done, _ = wait(self._running, return_when=FIRST_COMPLETED)
+        future = next(iter(done))
+        index = self._running.pop(future)
+        # Refill the freed slot before handing the result to the caller
+        if self._pending:
+            self._submit_next()
+        return index, future.result()
+
+    def close(self):
+        """Drop calls not yet submitted and cancel queued ones; calls already running finish unobserved"""
+        self._pending.clear()
+        for future in self._running:
+            future.cancel()
+        self._running.clear()
+
+class TaskGraph:
+    """
+    Small dependency graph of named tasks for a single request.
+
+    Each task starts as soon as the tasks it depends on have finished, so
+    independent upstream calls overlap and total latency is the longest
+    dependency chain rather than the sum of all calls.
+    """
+
+    def __init__(self):
+        self._tasks = {}  # name -> (func, args, after)
+        self._cleanups = {}  # name -> cleanup(result)
+
+    def add(self, name, func, *args, after=(), cleanup=None):
+        """
+        Add a task; results of the tasks named in after are appended to args.
+
+        cleanup(result) is called for the task's result if run() fails, so a
+        task that starts background work (e.g. a scrape fan-out) can stop it.
+        """
+        self._tasks[name] = (func, args, tuple(after))
+        if cleanup is not None:
+            self._cleanups[name] = cleanup
+        return self
+
+    def run(self):
+        """Run all tasks and return a dict of results by task name"""
+        context = contextvars.copy_context()
+        pending = dict(self._tasks)
+        running = {}
+        results = {}
+
+        def submit_ready():
+            for name, (func, args, after) in list(pending.items()):
+                if all(dependency in results for dependency in after):
+                    del pending[name]
+                    dependency_results = [results[dependency] for dependency in after]
+                    future = _task_executor.submit(context.copy().run, func, *args, *dependency_results)
+                    running[future] = name
+
+        # The calling thread only waits, so pool threads never block on each other
+        try:
+            submit_ready()
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future)] = future.result()
+                submit_ready()
+        except BaseException:
+            self._clean_up(results, running)
+            raise
+
+        if pending:
+            raise ValueError(f"Unresolvable task dependencies: {', '.join(pending)}")
+        return results
+
+    def _clean_up(self, results, running):
+        """Run cleanups for finished tasks now and for still-running ones when they finish"""
+        for name, result in results.items():
+            if name in self._cleanups:
+                self._cleanups[name](result)
+
+        for future, name in running.items():
+            if name in self._cleanups:
+                future.add_done_callback(partial(_clean_up_when_done, self._cleanups[name]))
+
+def _clean_up_when_done(cleanup, future):
+    if not future.cancelled() and future.exception() is None:
+        cleanup(future.result())
+
+class _Flight:
+    """An in-progress call shared by SingleFlight callers"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.followers = 0
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into a single execution.
+
+    The first caller runs the function; callers arriving while it is in
+    flight wait for it and receive the same result (or exception).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+
+    def do(self, key, func, *args):
+        """Run func(*args) once per key in flight; returns (result, shared)"""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                leader = True
+            else:
+                flight.followers += 1
+                leader = False
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, True
+
+        try:
+            flight.result = func(*args)
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+        # No followers can join once the flight is removed, so this count is final
+        return flight.result, flight.followers > 0
+
+# Shared by the TMDB client and torrent finder so identical upstream URLs are fetched once
+upstream_flight = SingleFlight()
+
+class AsyncSingleFlight:
+    """SingleFlight for coroutines running on one event loop"""
+
+    def __init__(self):
+        self._flights = {}  # key -> (future, _Flight for the follower count)
+
+    async def do(self, key, func, *args):
+        """Await func(*args) once per key in flight; returns (result, shared)"""
+        while key in self._flights:
+            future, flight = self._flights[key]
+            flight.followers += 1
+            try:
+                # Shielded so a cancelled follower does not cancel the shared call
+                return await asyncio.shield(future), True
+            except asyncio.CancelledError:
+                # Only the leader was cancelled, not this caller: run the call again
+                if not future.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        flight = _Flight()
+        self._flights[key] = (future, flight)
+        try:
+            result = await func(*args)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Nobody else will retrieve the exception when there are no followers
+            if not flight.followers:
+                future.exception()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            del self._flights[key]
+
+        return result, flight.followers > 0
@@ -1,13 +1,31 @@
+import asyncio
+import heapq
 import re
 from config import Config
+from services.torrent_result import TorrentResult
+from utils.concurrency import iter_concurrently
+from utils.magnet import add_trackers, magnet_trackers
+from utils.quality import classify_title
+from utils.scoring import calculate_torrent_scores
+from utils.tracing import Span
 
 def extract_quality(title):
     """Extract quality from torrent title"""
-    quality_patterns = ['4K', '2160p', '1080p', '720p', '480p', 'HDRip', 'BluRay', 'WEBRip', 'DVDRip']
-    for pattern in quality_patterns:
-        if pattern.lower() in title.lower():
-            return pattern
-    return None
+    return classify_title(title).quality
+
+SIZE_PATTERN = re.compile(r'([\d.]+)\s*([KMGT]?I?B)')
+
+SIZE_MULTIPLIERS = {
+    'B': 1,
+    'KB': 1024,
+    'MB': 1024**2,
+    'GB': 1024**3,
+    'TB': 1024**4,
+    'KIB': 1024,
+    'MIB': 1024**2,
+    'GIB': 1024**3,
+    'TIB': 1024**4
+}
 
 def parse_size_to_bytes(size_str):
     """Convert size string to bytes for sorting"""
@@ -18,7 +36,7 @@ def parse_size_to_bytes(size_str):
     size_str = size_str.strip().upper()
     
     # Extract number and unit
-    size_match = re.match(r'([\d.]+)\s*([KMGT]?I?B)', size_str)
+    size_match = SIZE_PATTERN.match(size_str)
     if not size_match:
         return 0
     
@@ -26,19 +44,7 @@ def parse_size_to_bytes(size_str):
     unit = size_match.group(2)
     
     # Convert to bytes
-    multipliers = {
-        'B': 1,
-        'KB': 1024,
-        'MB': 1024**2,
-        'GB': 1024**3,
-        'TB': 1024**4,
-        'KIB': 1024,
-        'MIB': 1024**2,
-        'GIB': 1024**3,
-        'TIB': 1024**4
-    }
-    
-    return int(number * multipliers.get(unit, 1))
+    return int(number * SIZE_MULTIPLIERS.get(unit, 1))
 
 import math
 
@@ -168,10 +174,18 @@ def format_tmdb_search_results(results):
     return formatted_results
 
 def format_tmdb_details(details, credits=None):
-    """Format TMDB details with full image URLs and clean unnecessary fields"""
+    """
+    Format TMDB details with full image URLs and clean unnecessary fields.
+    
+    Accepts a combined append_to_response payload: appended 'credits' are used
+    when no separate credits are passed, and 'external_ids' fill in a missing imdb_id.
+    """
     if not details:
         return None
     
+    if credits is None:
+        credits = details.get('credits')
+    
     # Start with a clean copy
     formatted_details = {}
     
@@ -201,6 +215,10 @@ def format_tmdb_details(details, credits=None):
         if field in details:
             formatted_details[field] = details[field]
     
+    # Fall back to appended external IDs (TV shows have no top-level imdb_id)
+    if not formatted_details.get('imdb_id') and details.get('external_ids', {}).get('imdb_id'):
+        formatted_details['imdb_id'] = details['external_ids']['imdb_id']
+    
     # Add image URLs
     if details.get('poster_path'):
         formatted_details['poster_path'] = f"{Config.TMDB_IMAGE_BASE_URL}{details['poster_path']}"
@@ -297,134 +315,249 @@ def format_tmdb_details(details, credits=None):
     
     return formatted_details
 
-def format_torrent_results(results):
-    """Format torrent results, filter out 0-seeders, and sort by balanced score"""
-    formatted_results = []
+# Crossover measured with benchmarks/bench_scoring.py (its 256-row case): below this many
+# results the scalar scorer beats the vectorized one, whose fixed NumPy overhead dominates
+BATCH_SCORING_MIN_ROWS = 256
+
+def format_torrent_results(results, limit=None):
+    """
+    Format scraped TorrentResult rows, filter out 0-seeders, and sort by balanced score.
     
-    for result in results:
-        if not result.get('title') or not result.get('magnet'):
-            continue
-            
-        seeders = int(result['seeders']) if result.get('seeders') and result['seeders'].isdigit() else 0
-        
-        # Filter out torrents with 0 seeders
-        if seeders == 0:
-            continue
-            
-        formatted_result = {
-            'title': result['title'],
-            'magnet': result['magnet'],
-            'size': result.get('size', 'Unknown'),
-            'seeders': seeders,
-            'leechers': int(result['leechers']) if result.get('leechers') and result['leechers'].isdigit() else 0
-        }
-        
-        # Add quality if available
-        quality = extract_quality(result['title'])
-        if quality:
-            formatted_result['quality'] = quality
-            
-        formatted_results.append(formatted_result)
+    With a limit only the top `limit` torrents are selected (a heap selection,
+    not a full sort) and only those are built into response dicts.
+    """
+    with Span('format', f'{len(results)} rows'):
+        return _format_torrent_results(results, limit)
+
+def _format_torrent_results(results, limit):
+    candidates = [
+        result for result in results
+        # Filter out incomplete rows and torrents with 0 seeders
+        if result.title and result.magnet and result.seeders > 0
+    ]
+    
+    # Score by balance of size and availability (higher score = better torrent)
+    sizes = [parse_size_to_bytes(result.size) for result in candidates]
+    seeders = [result.seeders for result in candidates]
+    if len(candidates) >= BATCH_SCORING_MIN_ROWS:
+        # One NumPy pass; identical scores, but only faster once per-call overhead is amortised
+        scores = calculate_torrent_scores(sizes, seeders).tolist()
+    else:
+        scores = [calculate_torrent_score(size, count) for size, count in zip(sizes, seeders)]
     
-    # Sort by balanced score (higher score = better torrent)
-    for result in formatted_results:
-        size_bytes = parse_size_to_bytes(result['size'])
-        result['_score'] = calculate_torrent_score(size_bytes, result['seeders'])
+    # Highest score first; ties keep their scraped order either way
+    if limit is not None and limit < len(candidates):
+        order = heapq.nlargest(limit, range(len(candidates)), key=scores.__getitem__)
+    else:
+        order = sorted(range(len(candidates)), key=scores.__getitem__, reverse=True)
     
-    # Sort by score (highest first)
-    formatted_results.sort(key=lambda x: x['_score'], reverse=True)
+    return [_format_torrent(candidates[i]) for i in order]
+
+def _format_torrent(result):
+    """Build the response dict for one scraped torrent"""
+    formatted_result = result.to_dict()
     
-    # Remove the internal score field
-    for result in formatted_results:
-        result.pop('_score', None)
+    # Add quality if available
+    quality = extract_quality(result.title)
+    if quality:
+        formatted_result['quality'] = quality
     
-    return formatted_results
+    return formatted_result
 
-def search_torrents_for_title(torrent_finder, title, content_type='movie', season=None, episode=None):
+def search_torrents_for_title(torrent_finder, title, content_type='movie', season=None, episode=None, use_cache=True, limit=None):
     """Search for torrents based on title and content type with improved season/episode logic"""
+    merger = TorrentMerger()
+    for _ in iter_torrent_batches(torrent_finder, title, content_type, season, episode, use_cache, merger):
+        pass
+    
+    return format_torrent_results(merger.results(), limit)
+
+# TorrentFinder search method -> category name reported with streamed batches
+TORRENT_CATEGORIES = {
+    'search_all': 'all',
+    'search_movies': 'movies',
+    'search_hd_movies': 'hd_movies',
+    'search_tv_shows': 'tv_shows',
+    'search_hd_tv_shows': 'hd_tv_shows'
+}
+
+def torrent_search_plan(torrent_finder, title, content_type='movie', season=None, episode=None, use_cache=True):
+    """
+    Category searches to run for a title as (search, query, use_cache) calls,
+    plus an optional filter for their results.
+    
+    Works with TorrentFinder and AsyncTorrentFinder alike, since both expose
+    the same search_* methods.
+    """
     # Clean the title for better torrent search
     search_title = clean_title_for_search(title)
+    keep = None
     
     if content_type == 'movie':
         # Search both regular and HD movies
-        regular_results = torrent_finder.search_movies(search_title)
-        hd_results = torrent_finder.search_hd_movies(search_title)
-        results = regular_results + hd_results
+        calls = [
+            (torrent_finder.search_movies, search_title, use_cache),
+            (torrent_finder.search_hd_movies, search_title, use_cache)
+        ]
     elif content_type == 'tv':
         if episode is not None and season is not None:
             # Search for specific episode
-            results = search_specific_episode(torrent_finder, search_title, season, episode)
+            calls = _tv_search_calls(torrent_finder, _episode_patterns(search_title, season, episode), use_cache)
         elif season is not None:
-            # Search for specific season
-            results = search_specific_season(torrent_finder, search_title, season)
+            # Search for specific season packs
+            calls = _tv_search_calls(torrent_finder, _season_patterns(search_title, season), use_cache)
+            keep = _is_season_pack
         else:
             # General TV show search
-            regular_results = torrent_finder.search_tv_shows(search_title)
-            hd_results = torrent_finder.search_hd_tv_shows(search_title)
-            results = regular_results + hd_results
+            calls = [
+                (torrent_finder.search_tv_shows, search_title, use_cache),
+                (torrent_finder.search_hd_tv_shows, search_title, use_cache)
+            ]
     else:
         # General search
-        results = torrent_finder.search_all(search_title)
-    
-    # Remove duplicates based on magnet link
-    unique_results = remove_duplicate_torrents(results)
+        calls = [(torrent_finder.search_all, search_title, use_cache)]
     
-    return format_torrent_results(unique_results)
+    return calls, keep
 
-def search_specific_season(torrent_finder, show_name, season_num):
-    """Search for specific season using multiple search patterns"""
-    search_patterns = [
-        f"{show_name} S{season_num:02d}",
-        f"{show_name} Season {season_num}"
-    ]
+def torrent_category(search):
+    """Category name for a TorrentFinder search method"""
+    return TORRENT_CATEGORIES.get(search.__name__, search.__name__)
+
+def iter_torrent_batches(torrent_finder, title, content_type='movie', season=None, episode=None, use_cache=True, merger=None):
+    """
+    Start the category searches for a title and return an iterator of
+    (category, query, results) as each one finishes. The searches are running
+    by the time this returns. Results are merged into merger (if given) on
+    arrival, so duplicates across categories are resolved without buffering
+    every batch.
+    """
+    calls, keep = torrent_search_plan(torrent_finder, title, content_type, season, episode, use_cache)
+    return TorrentBatches(calls, keep, merger)
+
+class TorrentBatches:
+    """
+    Iterator behind iter_torrent_batches(). close() stops the searches that
+    have not started yet, for when the batches will never be sent.
+    """
     
-    all_results = []
-    for pattern in search_patterns:
-        # Search both regular and HD TV shows
-        regular_results = torrent_finder.search_tv_shows(pattern)
-        hd_results = torrent_finder.search_hd_tv_shows(pattern)
-        all_results.extend(regular_results + hd_results)
+    def __init__(self, calls=(), keep=None, merger=None):
+        self._calls = list(calls)
+        self._keep = keep
+        self._merger = merger
+        self._finished = iter_concurrently(self._calls)
+    
+    def __iter__(self):
+        return self
+    
+    def __next__(self):
+        index, results = next(self._finished)
+        if self._keep is not None:
+            results = [result for result in results if self._keep(result)]
+        if self._merger is not None:
+            self._merger.add(results, source=index)
+        
+        search, query, _ = self._calls[index]
+        return torrent_category(search), query, results
+    
+    def close(self):
+        self._finished.close()
+
+async def search_torrents_for_title_async(torrent_finder, title, content_type='movie', season=None, episode=None, use_cache=True, limit=None):
+    """search_torrents_for_title for an AsyncTorrentFinder, merging each category as it completes"""
+    calls, keep = torrent_search_plan(torrent_finder, title, content_type, season, episode, use_cache)
     
-    # Filter out individual episodes (those with SxxExx pattern)
-    season_results = []
-    episode_pattern = re.compile(r'S\d{2}E\d{2}', re.IGNORECASE)
+    async def run(index, search, *args):
+        return index, await search(*args)
     
-    for result in all_results:
-        title = result.get('title', '')
-        # Exclude results that contain episode patterns
-        if not episode_pattern.search(title):
-            season_results.append(result)
+    merger = TorrentMerger()
+    for finished in asyncio.as_completed([run(index, *call) for index, call in enumerate(calls)]):
+        index, results = await finished
+        if keep is not None:
+            results = [result for result in results if keep(result)]
+        merger.add(results, source=index)
     
-    return season_results
+    return format_torrent_results(merger.results(), limit)
+
+def _season_patterns(show_name, season_num):
+    return [
+        f"{show_name} S{season_num:02d}",
+        f"{show_name} Season {season_num}"
+    ]
 
-def search_specific_episode(torrent_finder, show_name, season_num, episode_num):
-    """Search for specific episode using multiple search patterns"""
-    search_patterns = [
+def _episode_patterns(show_name, season_num, episode_num):
+    return [
         f"{show_name} S{season_num:02d}E{episode_num:02d}",
         f"{show_name} Season {season_num} Episode {episode_num}"
     ]
-    
-    all_results = []
+
+def _is_season_pack(result):
+    """Whether a result is not an individual episode (no SxxExx in the title)"""
+    return classify_title(result.title or '').episode is None
+
+def _tv_search_calls(torrent_finder, search_patterns, use_cache=True):
+    """Build regular + HD TV search calls for each pattern, in pattern order"""
+    calls = []
     for pattern in search_patterns:
-        # Search both regular and HD TV shows
-        regular_results = torrent_finder.search_tv_shows(pattern)
-        hd_results = torrent_finder.search_hd_tv_shows(pattern)
-        all_results.extend(regular_results + hd_results)
-    
-    return all_results
+        calls.append((torrent_finder.search_tv_shows, pattern, use_cache))
+        calls.append((torrent_finder.search_hd_tv_shows, pattern, use_cache))
+    return calls
 
-def remove_duplicate_torrents(results):
-    """Remove duplicate torrents based on magnet link"""
-    seen_magnets = set()
-    unique_results = []
+class TorrentMerger:
+    """
+    Incrementally deduplicates torrents by infohash as result batches arrive.
     
-    for result in results:
-        magnet = result.get('magnet', '')
-        if magnet and magnet not in seen_magnets:
-            seen_magnets.add(magnet)
-            unique_results.append(result)
+    The same torrent often shows up in several categories with a different
+    tracker list or dn= name. Duplicates are merged into one result that keeps
+    the best-seeded row's details, the highest seeder/leecher counts and the
+    union of all trackers. Results come back in source order (then row order),
+    regardless of the order the batches were added in.
+    """
     
-    return unique_results
+    def __init__(self):
+        # infohash (or magnet) -> [first seen at, best row seen at, merged TorrentResult]
+        self._merged = {}
+    
+    def add(self, results, source=0):
+        """Merge one batch of results; source orders batches in the output"""
+        for row, result in enumerate(results):
+            key = result.infohash or result.magnet
+            if not key:
+                continue
+            
+            seen_at = (source, row)
+            entry = self._merged.get(key)
+            if entry is None:
+                self._merged[key] = [seen_at, seen_at, result]
+                continue
+            
+            first_seen_at, best_seen_at, merged = entry
+            # Most seeders wins; ties go to the earlier row so arrival order never matters
+            if (result.seeders, best_seen_at) > (merged.seeders, seen_at):
+                entry[1:] = [seen_at, _merge_torrents(result, merged)]
+            else:
+                entry[2] = _merge_torrents(merged, result)
+            entry[0] = min(first_seen_at, seen_at)
+    
+    def results(self):
+        """Merged results in first-seen order"""
+        return [entry[2] for entry in sorted(self._merged.values(), key=lambda entry: entry[0])]
+
+def _merge_torrents(best, other):
+    """New record for a torrent seen twice, keeping the details of the best-seeded sighting"""
+    return TorrentResult(
+        best.title,
+        add_trackers(best.magnet, magnet_trackers(other.magnet)),
+        best.size,
+        best.seeders,
+        max(best.leechers, other.leechers),
+        best.infohash
+    )
+
+def remove_duplicate_torrents(results):
+    """Remove duplicate torrents (same infohash), merging their trackers and counts"""
+    merger = TorrentMerger()
+    merger.add(results)
+    return merger.results()
 
 def clean_title_for_search(title):
     """Clean title for better torrent search results"""
@@ -0,0 +1,31 @@
+import base64
+import re
+from urllib.parse import parse_qsl, quote
+
+# btih exact topic: 40 hex characters or 32 base32 characters
+BTIH_PATTERN = re.compile(r'xt=urn:btih:([0-9a-fA-F]{40}|[A-Za-z2-7]{32})(?![0-9A-Za-z])')
+
+def parse_infohash(magnet):
+    """Normalized (lowercase hex) BitTorrent v1 infohash of a magnet link, or None"""
+    if not magnet:
+        return None
+
+    match = BTIH_PATTERN.search(magnet)
+    if not match:
+        return None
+
+    infohash = match.group(1)
+    if len(infohash) == 32:
+        infohash = base64.b32decode(infohash.upper()).hex()
+    return infohash.lower()
+
+def magnet_trackers(magnet):
+    """Decoded tracker URLs (tr= parameters) of a magnet link, in order"""
+    _, _, query = magnet.partition('?')
+    return [value for key, value in parse_qsl(query) if key == 'tr']
+
+def add_trackers(magnet, trackers):
+    """Append the trackers the magnet does not already announce to"""
+    known = set(magnet_trackers(magnet))
+    missing = [tracker for tracker in dict.fromkeys(trackers) if tracker not in known]
+    return magnet + ''.join(f"&tr={quote(tracker, safe='')}" for tracker in missing)
@@ -0,0 +1,111 @@
+import os
+import re
+import time
+from flask import Response, g, request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+)
+
+# Seconds - from cached answers up to scrapes that run into the read timeout
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0)
+PARSE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5)
+
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds', 'Time to handle a request, by route',
+    ['method', 'endpoint', 'status'], buckets=LATENCY_BUCKETS
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    'http_requests_in_flight', 'Requests currently being handled',
+    multiprocess_mode='livesum'
+)
+UPSTREAM_LATENCY = Histogram(
+    'upstream_request_duration_seconds', 'Upstream HTTP call latency, by endpoint template or category',
+    ['upstream', 'endpoint', 'status'], buckets=LATENCY_BUCKETS
+)
+UPSTREAM_IN_FLIGHT = Gauge(
+    'upstream_requests_in_flight', 'Upstream HTTP calls currently waiting for a response',
+    ['upstream'], multiprocess_mode='livesum'
+)
+PARSE_LATENCY = Histogram(
+    'torrent_parse_duration_seconds', 'Time to parse one search results page',
+    ['parser'], buckets=PARSE_BUCKETS
+)
+CACHE_LOOKUPS = Counter(
+    'cache_lookups_total', 'Cache lookups by outcome (hit, stale or miss)',
+    ['cache', 'result']
+)
+
+NUMERIC_SEGMENT = re.compile(r'/\d+')
+
+def endpoint_template(path):
+    """Collapse ids in an upstream path (/tv/1396/season/1 -> /tv/{id}/season/{id}) to bound label values"""
+    return NUMERIC_SEGMENT.sub('/{id}', path)
+
+class UpstreamCall:
+    """
+    Time one upstream HTTP call and count it as in flight meanwhile.
+
+    Set .status once the response arrives; calls that raise are recorded
+    with status 'error'.
+    """
+
+    __slots__ = ('upstream', 'endpoint', 'status', '_started')
+
+    def __init__(self, upstream, endpoint):
+        self.upstream = upstream
+        self.endpoint = endpoint
+        self.status = 'error'
+
+    def __enter__(self):
+        UPSTREAM_IN_FLIGHT.labels(self.upstream).inc()
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self._started
+        UPSTREAM_IN_FLIGHT.labels(self.upstream).dec()
+        UPSTREAM_LATENCY.labels(self.upstream, self.endpoint, str(self.status)).observe(elapsed)
+
+def observe_request(method, endpoint, status, elapsed):
+    REQUEST_LATENCY.labels(method, endpoint, str(status)).observe(elapsed)
+
+def instrument_app(app):
+    """Record latency and in-flight count for every request the Flask app handles"""
+
+    @app.before_request
+    def start_request_timer():
+        g.request_started = time.perf_counter()
+        REQUESTS_IN_FLIGHT.inc()
+
+    @app.after_request
+    def remember_status(response):
+        g.response_status = response.status_code
+        return response
+
+    # Teardown also runs after unhandled errors, and after the last chunk of a streamed response
+    @app.teardown_request
+    def observe_request_latency(error=None):
+        started = g.pop('request_started', None)
+        if started is None:
+            return
+        REQUESTS_IN_FLIGHT.dec()
+        observe_request(
+            request.method,
+            request.endpoint or 'unmatched',
+            g.pop('response_status', 500),
+            time.perf_counter() - started
+        )
+
+def metrics_response():
+    """
+    Current metrics in the Prometheus text format.
+
+    Under a multi-worker server set PROMETHEUS_MULTIPROC_DIR (before start)
+    so every worker's samples are aggregated, whichever worker is scraped.
+    """
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return Response(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,95 @@
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+
+# Legacy quality labels in priority order; any case-insensitive substring counts
+QUALITY_LABELS = ['4K', '2160p', '1080p', '720p', '480p', 'HDRip', 'BluRay', 'WEBRip', 'DVDRip']
+QUALITY_PRIORITY = {label.lower(): index for index, label in enumerate(QUALITY_LABELS)}
+
+RESOLUTIONS = {'4k': '2160p', '2160p': '2160p', '1080p': '1080p', '720p': '720p', '480p': '480p'}
+RESOLUTION_RANK = {'2160p': 4, '1080p': 3, '720p': 2, '480p': 1}
+
+SOURCES = {
+    'bluray': 'BluRay', 'blu-ray': 'BluRay', 'bdrip': 'BluRay', 'brrip': 'BluRay', 'remux': 'BluRay',
+    'web-dl': 'WEB-DL', 'webdl': 'WEB-DL', 'web': 'WEB-DL', 'webrip': 'WEBRip',
+    'hdrip': 'HDRip', 'hdtv': 'HDTV', 'dvdrip': 'DVDRip', 'dvd': 'DVDRip'
+}
+
+CODECS = {
+    'x264': 'x264', 'x.264': 'x264', 'h264': 'x264', 'h.264': 'x264', 'avc': 'x264',
+    'x265': 'x265', 'x.265': 'x265', 'h265': 'x265', 'h.265': 'x265', 'hevc': 'HEVC',
+    'xvid': 'XviD'
+}
+
+HDR_FLAGS = {
+    'hdr': 'HDR', 'hdr10': 'HDR10', 'hdr10+': 'HDR10+',
+    'dv': 'DV', 'dolby vision': 'DV', 'dolby.vision': 'DV', 'dolbyvision': 'DV'
+}
+
+# One scan over the lowercased title. Legacy labels are matched zero-width so
+# overlapping substrings are all seen, exactly like the old per-label `in` checks.
+# The two-digit SxxEyy shape the old episode filter searched for is matched
+# anywhere (and zero-width, so a glued-on label is still seen): ShowS01E01,
+# S01E01E02 and S01E01v2 are all single episodes. Shorter s1e2 tags count only
+# standing alone, and a separated "S01 E01" never does, since season packs are
+# often named "S01 E01-E10". The other structured tokens must stand alone
+# between separators.
+TITLE_TOKENS = re.compile(r'''
+    (?=(?P<label>4k|2160p|1080p|720p|480p|hdrip|bluray|webrip|dvdrip))
+  | (?=s(?P<season>\d{2})e(?P<episode>\d{2}(?:\d(?!\d))?))
+  | (?<![a-z0-9])
+    (?:
+        s(?P<short_season>\d{1,2})e(?P<short_episode>\d{1,3})
+      | s(?P<season_pack>\d{1,2})
+      | season[ ._]?(?P<season_word>\d{1,2})
+      | (?P<source>web-?dl|web|hdtv|bdrip|brrip|blu-ray|remux|dvd)
+      | (?P<codec>[xh]\.?26[45]|hevc|avc|xvid)
+      | (?P<hdr>hdr10\+|hdr10|hdr|dv|dolby[ .]?vision)
+    )
+    (?![a-z0-9])
+''', re.VERBOSE)
+
+class TitleTraits(NamedTuple):
+    """Structured quality traits parsed from a torrent title"""
+    quality: Optional[str]  # legacy label, same as extract_quality() always returned
+    resolution: Optional[str]
+    source: Optional[str]
+    codec: Optional[str]
+    hdr: Tuple[str, ...]
+    season: Optional[int]
+    episode: Optional[int]
+
+@lru_cache(maxsize=8192)
+def classify_title(title):
+    """Parse quality, source, codec, HDR and season/episode traits from a title in one scan"""
+    quality = resolution = source = codec = season = episode = None
+    hdr = []
+
+    for match in TITLE_TOKENS.finditer(title.lower()):
+        label = match.group('label')
+        if label is not None:
+            if quality is None or QUALITY_PRIORITY[label] < QUALITY_PRIORITY[quality.lower()]:
+                quality = QUALITY_LABELS[QUALITY_PRIORITY[label]]
+            if label in RESOLUTIONS:
+                candidate = RESOLUTIONS[label]
+                if resolution is None or RESOLUTION_RANK[candidate] > RESOLUTION_RANK[resolution]:
+                    resolution = candidate
+            elif source is None:
+                source = SOURCES[label]
+        elif match.group('episode') is not None or match.group('short_episode') is not None:
+            if episode is None:
+                season = int(match.group('season') or match.group('short_season'))
+                episode = int(match.group('episode') or match.group('short_episode'))
+        elif match.group('season_pack') is not None or match.group('season_word') is not None:
+            if season is None:
+                season = int(match.group('season_pack') or match.group('season_word'))
+        elif match.group('source') is not None:
+            source = source or SOURCES[match.group('source')]
+        elif match.group('codec') is not None:
+            codec = codec or CODECS[match.group('codec')]
+        elif match.group('hdr') is not None:
+            flag = HDR_FLAGS[match.group('hdr')]
+            if flag not in hdr:
+                hdr.append(flag)
+
+    return TitleTraits(quality, resolution, source, codec, tuple(hdr), season, episode)
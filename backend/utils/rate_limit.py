@@ -0,0 +1,71 @@
+import threading
+import time
+
+class RateLimitExceeded(Exception):
+    """Raised when an upstream call cannot be made within the caller's deadline"""
+
+    def __init__(self, retry_after):
+        self.retry_after = retry_after
+        super().__init__(f"Rate limit reached - retry in {retry_after:.1f}s")
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that paces outgoing calls.
+
+    Callers reserve a token up front and learn how long they must wait for
+    it. If that wait exceeds their deadline they get nothing and can fail
+    fast instead of parking a worker thread. pause() blocks the whole
+    bucket, e.g. when the upstream answers with Retry-After.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        # _updated sits in the future while paused, so nothing accrues until the pause ends
+        if now > self._updated:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def _wait(self, now):
+        """Seconds from now until the next token is free"""
+        ready = self._updated + max(1 - self._tokens, 0) / self.rate
+        return max(ready - now, 0.0)
+
+    def reserve(self, max_wait):
+        """Reserve a token; return seconds to wait before using it, or None if over max_wait"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            wait = self._wait(now)
+            if wait > max_wait:
+                return None
+
+            # Tokens may go negative: later callers queue behind this reservation
+            self._tokens -= 1
+            return wait
+
+    def retry_after(self):
+        """Seconds until a token is next available"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return self._wait(now)
+
+    def pause(self, seconds):
+        """
+        Stop handing out tokens for the given number of seconds.
+
+        The bucket is drained and refills only from the end of the pause, so
+        callers resume at the steady rate instead of as one full burst.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = min(self._tokens, 1)
+            self._updated = max(self._updated, now + seconds)
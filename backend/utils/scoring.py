@@ -0,0 +1,128 @@
+import math
+import numpy as np
+
+def _libm(func, values):
+    """
+    Apply a math-module function elementwise.
+
+    NumPy's SIMD exp/log10/sin can differ from libm in the last bit, so the
+    few transcendental terms go through math on the distinct values only.
+    """
+    unique, inverse = np.unique(values, return_inverse=True)
+    return np.fromiter(map(func, unique.tolist()), dtype=np.float64, count=len(unique))[inverse]
+
+# math.log10(n) for the seeder counts nearly every result falls into
+_LOG10_TABLE = np.array([math.log10(n) for n in range(1, 4097)])
+
+def _log10(counts):
+    """math.log10 of whole numbers >= 1, by table lookup where possible"""
+    result = np.empty_like(counts)
+    small = counts <= len(_LOG10_TABLE)
+    result[small] = _LOG10_TABLE[counts[small].astype(np.intp) - 1]
+    if not small.all():
+        result[~small] = _libm(math.log10, counts[~small])
+    return result
+
+def _tiers(conditions, choices, default):
+    """np.select semantics (first true condition wins) built from nested np.where, which is cheaper"""
+    result = default
+    for condition, choice in zip(reversed(conditions), reversed(choices)):
+        result = np.where(condition, choice, result)
+    return result
+
+def calculate_torrent_scores(sizes_bytes, seeders):
+    """
+    Score many torrents in one vectorized pass.
+
+    Mirrors calculate_torrent_score() in utils.formatters step for step
+    (same operations in the same order), so every score is bit-identical to
+    the scalar function. Seeders are whole counts. Returns a float64 array
+    aligned with the inputs.
+    """
+    seeders = np.asarray(seeders, dtype=np.float64)
+    size_gb = np.asarray(sizes_bytes, dtype=np.float64) / (1024**3)
+
+    # Every tier is evaluated for every row, including ones that do not apply
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # === SEEDER AVAILABILITY SCORE ===
+        high_seeders = seeders > 50
+        seeder_log = np.zeros_like(seeders)
+        seeder_log[high_seeders] = _log10(seeders[high_seeders] - 49)
+        seeder_base = _tiers(
+            [seeders <= 2, seeders <= 10, seeders <= 50],
+            [seeders * 25, 50 + (seeders - 2) * 15, 170 + (seeders - 10) * 8],
+            490 + seeder_log * 25
+        )
+
+        # === DYNAMIC SIZE SCORING ===
+        seeder_size_tolerance = np.minimum(2.0, _log10(np.maximum(seeders, 0) + 1) * 0.8)
+
+        tiny_threshold = 0.05
+        small_threshold = 0.3 + seeder_size_tolerance * 0.2
+        optimal_min = 0.7 + seeder_size_tolerance * 0.3
+        optimal_max = 2.5 + seeder_size_tolerance * 1.5
+        large_threshold = 6.0 + seeder_size_tolerance * 2.0
+
+        very_large = size_gb > large_threshold
+        size_decay = np.zeros_like(size_gb)
+        if very_large.any():
+            size_decay[very_large] = _libm(math.exp, -(size_gb[very_large] - large_threshold[very_large]) / 10)
+
+        optimal = (size_gb > optimal_min) & (size_gb <= optimal_max)
+        size_wave = np.zeros_like(size_gb)
+        if optimal.any():
+            size_wave[optimal] = _libm(
+                math.sin,
+                (size_gb[optimal] - optimal_min[optimal]) / (optimal_max[optimal] - optimal_min[optimal]) * math.pi
+            )
+
+        size_score = _tiers(
+            [
+                size_gb < tiny_threshold,
+                size_gb < small_threshold,
+                size_gb <= optimal_min,
+                size_gb <= optimal_max,
+                size_gb <= large_threshold
+            ],
+            [
+                0.15,
+                0.4 + (size_gb / small_threshold) * 0.3,
+                0.7 + (size_gb - small_threshold) / (optimal_min - small_threshold) * 0.25,
+                0.95 + 0.05 * size_wave,
+                0.95 * (1 - (size_gb - optimal_max) / (large_threshold - optimal_max) * 0.25)
+            ],
+            0.7 * size_decay
+        )
+
+        # === SWARM HEALTH INDICATORS ===
+        health_multiplier = _tiers(
+            [seeders == 1, seeders <= 3, seeders <= 8, seeders <= 25],
+            [0.8, 0.9, 1.0, 1.1],
+            1.1 + np.minimum(0.3, (seeders - 25) / 100)
+        )
+
+        # === POPULARITY MOMENTUM ===
+        momentum_bonus = _tiers(
+            [seeders >= 20, seeders >= 10, seeders >= 5],
+            [1.15, 1.08, 1.03],
+            1.0
+        )
+
+        # === SIZE-SEEDER SYNERGY ===
+        expected_seeders_for_size = np.maximum(1, size_gb * 2)
+        synergy_ratio = np.minimum(seeders / expected_seeders_for_size, expected_seeders_for_size / seeders)
+        synergy_bonus = 0.9 + synergy_ratio * 0.2
+
+        # === RARITY ADJUSTMENT ===
+        rarity_bonus = np.where((seeders >= 1) & (seeders <= 3) & (size_gb >= 0.5), 1.1, 1.0)
+
+        # === FINAL SCORE CALCULATION ===
+        base_score = seeder_base * size_score
+        final_score = (base_score *
+                       health_multiplier *
+                       momentum_bonus *
+                       synergy_bonus *
+                       rarity_bonus)
+
+    # No seeders = unusable
+    return np.where(seeders == 0, 0.0, np.maximum(0.1, final_score))
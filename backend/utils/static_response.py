@@ -0,0 +1,57 @@
+import gzip
+import hashlib
+import json
+from flask import Response, request
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+class PrecomputedResponse:
+    """
+    JSON payload serialized once (and pre-compressed) and served as bytes.
+
+    Each encoding gets its own strong ETag; If-None-Match is answered with
+    304 Not Modified and no body.
+    """
+
+    def __init__(self, payload, max_age=300):
+        body = json.dumps(payload, sort_keys=True, separators=(',', ':')).encode('utf-8')
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        self.max_age = max_age
+
+        # encoding -> (etag, body); identity is always available
+        self.variants = {'identity': (digest, body)}
+        self.variants['gzip'] = (f"{digest}-gzip", gzip.compress(body, compresslevel=9))
+        if brotli is not None:
+            self.variants['br'] = (f"{digest}-br", brotli.compress(body, quality=11))
+
+    @property
+    def etag(self):
+        """ETag of the uncompressed representation"""
+        return self.variants['identity'][0]
+
+    def _choose_encoding(self):
+        accepted = request.accept_encodings
+        for encoding in ('br', 'gzip'):
+            if encoding in self.variants and accepted[encoding]:
+                return encoding
+        return 'identity'
+
+    def to_response(self):
+        """Build the response for the current request"""
+        encoding = self._choose_encoding()
+        etag, body = self.variants[encoding]
+
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+        else:
+            response = Response(body, mimetype='application/json')
+            if encoding != 'identity':
+                response.headers['Content-Encoding'] = encoding
+
+        response.set_etag(etag)
+        response.headers['Vary'] = 'Accept-Encoding'
+        response.headers['Cache-Control'] = f"public, max-age={self.max_age}"
+        return response
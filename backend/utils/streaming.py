@@ -0,0 +1,36 @@
+import json
+import logging
+from flask import Response, stream_with_context
+
+# ?stream= value -> response mimetype
+STREAM_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'sse': 'text/event-stream'
+}
+
+def encode_event(name, payload, stream_format):
+    """Serialize one event as an NDJSON line or a Server-Sent Events message"""
+    if stream_format == 'sse':
+        return f"event: {name}\ndata: {json.dumps(payload, separators=(',', ':'))}\n\n"
+    return json.dumps(dict(payload, event=name), separators=(',', ':')) + '\n'
+
+def event_stream_response(events, stream_format):
+    """
+    Stream (name, payload) events as they are produced.
+
+    A failure part-way through is reported as a final 'error' event, since
+    the status line has already been sent by then.
+    """
+    def generate():
+        try:
+            for name, payload in events:
+                yield encode_event(name, payload, stream_format)
+        except Exception as e:
+            logging.error(f'Event stream failed: {e}')
+            yield encode_event('error', {'status': 'error', 'message': str(e)}, stream_format)
+
+    response = Response(stream_with_context(generate()), mimetype=STREAM_FORMATS[stream_format])
+    response.headers['Cache-Control'] = 'no-cache'
+    # Ask reverse proxies (nginx) not to buffer the stream
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
@@ -0,0 +1,171 @@
+import logging
+import random
+import time
+from contextvars import ContextVar
+from flask import g, request
+from config import Config
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:
+    otel_trace = None
+
+# Longest spans kept in one Server-Timing header (browsers and proxies cap header size)
+MAX_SERVER_TIMING_SPANS = 40
+
+# The trace of the request being handled. Context-local, so it follows work handed to
+# run_concurrently / TaskGraph / asyncio tasks, which all run in a copy of the caller's context.
+_current_trace = ContextVar('current_trace', default=None)
+
+# OpenTelemetry tracer, set by configure_opentelemetry() when an OTLP endpoint is configured
+_tracer = None
+
+class Trace:
+    """Stage timings collected while handling one request"""
+
+    __slots__ = ('method', 'path', 'started', 'spans')
+
+    def __init__(self, method, path):
+        self.method = method
+        self.path = path
+        self.started = time.perf_counter()
+        self.spans = []  # (name, description, start offset, duration), all in seconds
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    def server_timing(self):
+        """Server-Timing header value: the total, then each stage in start order"""
+        spans = self.spans
+        if len(spans) > MAX_SERVER_TIMING_SPANS:
+            kept = set(sorted(range(len(spans)), key=lambda i: spans[i][3], reverse=True)[:MAX_SERVER_TIMING_SPANS])
+            spans = [span for i, span in enumerate(spans) if i in kept]
+
+        entries = [f'total;dur={self.elapsed() * 1000:.1f}']
+        for name, description, _, duration in spans:
+            entry = f'{name};dur={duration * 1000:.1f}'
+            if description:
+                entry += f';desc="{_header_safe(description)}"'
+            entries.append(entry)
+        return ', '.join(entries)
+
+    def breakdown(self):
+        """One-line stage breakdown for logs"""
+        return ', '.join(
+            f"{name}{f' {description}' if description else ''} +{offset * 1000:.0f}ms {duration * 1000:.1f}ms"
+            for name, description, offset, duration in self.spans
+        )
+
+def _header_safe(text):
+    """Quoted-string safe ASCII for a header parameter"""
+    return str(text).encode('ascii', 'replace').decode().replace('\\', '/').replace('"', "'")
+
+class Span:
+    """
+    Time one stage of the current request, e.g. `with Span('tmdb', '/movie/{id}'):`.
+
+    Costs a context lookup when no request is being traced. Spans are
+    recorded for Server-Timing and the slow-request log, and exported to
+    OpenTelemetry when that is configured.
+    """
+
+    __slots__ = ('name', 'description', '_trace', '_started', '_otel')
+
+    def __init__(self, name, description=None):
+        self.name = name
+        self.description = description
+        self._otel = None
+
+    def __enter__(self):
+        self._trace = _current_trace.get()
+        if self._trace is not None:
+            if _tracer is not None:
+                self._otel = _tracer.start_as_current_span(self.name, attributes={'description': str(self.description or '')})
+                self._otel.__enter__()
+            self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._trace is None:
+            return
+        finished = time.perf_counter()
+        # list.append is atomic, so spans from concurrent worker threads can share the trace
+        self._trace.spans.append((self.name, self.description, self._started - self._trace.started, finished - self._started))
+        if self._otel is not None:
+            self._otel.__exit__(*exc_info)
+
+def start_trace(method, path):
+    """Begin tracing a request in the current context; returns a token for finish_trace()"""
+    trace = Trace(method, path)
+    otel_span = None
+    if _tracer is not None:
+        otel_span = _tracer.start_as_current_span(f'{method} {path}')
+        otel_span.__enter__()
+    return trace, otel_span, _current_trace.set(trace)
+
+def current_trace():
+    return _current_trace.get()
+
+def finish_trace(token, status=None):
+    """Stop tracing the request and log it if it was slow (sampled)"""
+    trace, otel_span, context_token = token
+    _current_trace.reset(context_token)
+    if otel_span is not None:
+        otel_span.__exit__(None, None, None)
+
+    elapsed_ms = trace.elapsed() * 1000
+    if elapsed_ms >= Config.SLOW_REQUEST_MS and random.random() < Config.SLOW_REQUEST_LOG_SAMPLE_RATE:
+        logging.warning(
+            f'Slow request {trace.method} {trace.path} ({status}) took {elapsed_ms:.0f}ms: {trace.breakdown()}'
+        )
+    return trace
+
+def configure_opentelemetry():
+    """Export spans over OTLP/HTTP when OTEL_EXPORTER_OTLP_ENDPOINT is set and the SDK is installed"""
+    global _tracer
+    if not Config.OTEL_EXPORTER_OTLP_ENDPOINT or _tracer is not None:
+        return
+    if otel_trace is None:
+        logging.warning('OTEL_EXPORTER_OTLP_ENDPOINT is set but opentelemetry is not installed - spans are not exported')
+        return
+
+    try:
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    except ImportError as e:
+        logging.warning(f'OpenTelemetry SDK or OTLP exporter missing - spans are not exported: {e}')
+        return
+
+    provider = TracerProvider(resource=Resource.create({'service.name': Config.OTEL_SERVICE_NAME}))
+    # The exporter reads OTEL_EXPORTER_OTLP_ENDPOINT itself and appends /v1/traces
+    provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+    otel_trace.set_tracer_provider(provider)
+    _tracer = otel_trace.get_tracer(__name__)
+
+def trace_requests(app):
+    """Trace every request the Flask app handles and report its stages in Server-Timing"""
+    configure_opentelemetry()
+
+    @app.before_request
+    def begin_request_trace():
+        g.trace_token = start_trace(request.method, request.path)
+
+    @app.after_request
+    def add_server_timing(response):
+        trace = current_trace()
+        # Streamed responses only report the stages finished before the first chunk. Shared
+        # caches would store the header with public responses (/, /schema, /home), and a 304
+        # must not change the cached copy's headers, so neither gets one.
+        if (trace is not None and Config.SERVER_TIMING
+                and response.status_code != 304 and not response.cache_control.public):
+            response.headers['Server-Timing'] = trace.server_timing()
+        g.trace_status = response.status_code
+        return response
+
+    @app.teardown_request
+    def end_request_trace(error=None):
+        token = g.pop('trace_token', None)
+        if token is not None:
+            finish_trace(token, g.pop('trace_status', 500))
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+WSGI entry point for production serving.
+
+    gunicorn -c gunicorn.conf.py
+
+The app is built without its background threads: gunicorn.conf.py preloads
+it in the master and each worker warms up and starts them after the fork.
+"""
+
+from app import create_app
+
+application = create_app(start_services=False)
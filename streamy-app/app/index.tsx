@@ -81,98 +81,16 @@ export default function HomeScreen() {
     try {
       setLoading(true);
 
-      // Load featured content - get multiple items for carousel
-      const featured = await api.getFeaturedContent();
-      setFeaturedContent(featured);
-
-      // Load all sections with diverse content - taking first result from different searches
-      const [
-        inceptionResponse,
-        darkKnightResponse,
-        interstellarResponse,
-        fightClubResponse,
-        matrixResponse,
-        breakingBadResponse,
-        gameOfThronesResponse,
-        strangerthingsResponse,
-        theOfficeResponse,
-        friendsResponse,
-        godfatherResponse,
-        pulpFictionResponse,
-        shawshankResponse,
-        wireResponse,
-        sopranosResponse,
-      ] = await Promise.all([
-        api.searchMovies("inception"),
-        api.searchMovies("the dark knight"),
-        api.searchMovies("interstellar"),
-        api.searchMovies("fight club"),
-        api.searchMovies("the matrix"),
-        api.searchTvShows("breaking bad"),
-        api.searchTvShows("game of thrones"),
-        api.searchTvShows("stranger things"),
-        api.searchTvShows("the office"),
-        api.searchTvShows("friends"),
-        api.searchMovies("the godfather"),
-        api.searchMovies("pulp fiction"),
-        api.searchMovies("the shawshank redemption"),
-        api.searchTvShows("the wire"),
-        api.searchTvShows("the sopranos"),
-      ]);
-
-      // Create diverse sections by taking first result from each search
-      const sectionsData: SectionData[] = [
-        {
-          key: "top-picks",
-          title: "Top picks for you",
-          data: [
-            inceptionResponse.results[0],
-            darkKnightResponse.results[0],
-            interstellarResponse.results[0],
-            fightClubResponse.results[0],
-            matrixResponse.results[0],
-            godfatherResponse.results[0],
-          ].filter(Boolean), // Remove any undefined results
-        },
-        {
-          key: "continue-watching",
-          title: "Continue watching for you",
-          data: [
-            breakingBadResponse.results[0],
-            gameOfThronesResponse.results[0],
-            strangerthingsResponse.results[0],
-            wireResponse.results[0],
-          ].filter(Boolean),
-        },
-        {
-          key: "action-movies",
-          title: "Action movies",
-          data: [
-            darkKnightResponse.results[0],
-            matrixResponse.results[0],
-            inceptionResponse.results[0],
-            fightClubResponse.results[0],
-          ].filter(Boolean),
-        },
-        {
-          key: "drama-content",
-          title: "Award-winning dramas",
-          data: [
-            godfatherResponse.results[0],
-            shawshankResponse.results[0],
-            pulpFictionResponse.results[0],
-            sopranosResponse.results[0],
-          ].filter(Boolean),
-        },
-        {
-          key: "comedy-shows",
-          title: "Comedy shows",
-          data: [
-            theOfficeResponse.results[0],
-            friendsResponse.results[0],
-          ].filter(Boolean),
-        },
-      ];
+      // Featured carousel and every section come from the server's home feed snapshot
+      // (retried while the server is still building it)
+      const feed = await api.getHomeFeed();
+      setFeaturedContent(feed.featured);
+
+      const sectionsData: SectionData[] = feed.sections.map((section) => ({
+        key: section.key,
+        title: section.title,
+        data: section.results,
+      }));
 
       setSections(sectionsData);
     } catch (error) {
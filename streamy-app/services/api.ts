@@ -104,6 +104,38 @@ export interface MovieDetailsResponse {
   torrent_results: TorrentResult[];
 }
 
+export type SearchType = "movie" | "tv" | "multi";
+
+export interface BatchSearchQuery {
+  type: SearchType;
+  query: string;
+}
+
+export interface BatchSearchEntry extends SearchResponse {
+  type: SearchType;
+  retry_after?: number;
+}
+
+export interface BatchSearchResponse {
+  status: string;
+  count: number;
+  results: BatchSearchEntry[];
+}
+
+export interface HomeFeedSection {
+  key: string;
+  title: string;
+  count: number;
+  results: SearchResult[];
+}
+
+export interface HomeFeedResponse {
+  status: string;
+  generated_at: string;
+  featured: SearchResult[];
+  sections: HomeFeedSection[];
+}
+
 export interface TvDetailsResponse {
   status: string;
   tmdb_details: TvDetails;
@@ -111,6 +143,15 @@ export interface TvDetailsResponse {
   torrent_results: TorrentResult[];
 }
 
+// Non-2xx answer from the API; retryAfter is the Retry-After header in seconds, if sent
+export class ApiError extends Error {
+  constructor(public status: number, public retryAfter: number | null) {
+    super(`HTTP error! status: ${status}`);
+  }
+}
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
+
 class StreamyAPI {
   private baseURL: string;
 
@@ -118,12 +159,16 @@ class StreamyAPI {
     this.baseURL = baseURL;
   }
 
-  private async request<T>(endpoint: string): Promise<T> {
+  private async request<T>(endpoint: string, init?: RequestInit): Promise<T> {
     try {
-      const response = await fetch(`${this.baseURL}${endpoint}`);
+      const response = await fetch(`${this.baseURL}${endpoint}`, init);
 
       if (!response.ok) {
-        throw new Error(`HTTP error! status: ${response.status}`);
+        const retryAfter = Number(response.headers.get("Retry-After"));
+        throw new ApiError(
+          response.status,
+          retryAfter > 0 ? retryAfter : null
+        );
       }
 
       const data = await response.json();
@@ -149,6 +194,34 @@ class StreamyAPI {
     );
   }
 
+  // Many searches resolved server-side in a single round trip
+  async batchSearch(queries: BatchSearchQuery[]): Promise<BatchSearchResponse> {
+    return this.request<BatchSearchResponse>("/batch/search", {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ queries }),
+    });
+  }
+
+  // Home screen carousel and rails, served from a server-side snapshot.
+  // A 503 with Retry-After (snapshot not built yet) is retried after the given delay.
+  async getHomeFeed(maxRetries: number = 3): Promise<HomeFeedResponse> {
+    for (let attempt = 0; ; attempt++) {
+      try {
+        return await this.request<HomeFeedResponse>("/home");
+      } catch (error) {
+        const retryAfter =
+          error instanceof ApiError && error.status === 503
+            ? error.retryAfter
+            : null;
+        if (retryAfter === null || attempt >= maxRetries) {
+          throw error;
+        }
+        await sleep(retryAfter * 1000);
+      }
+    }
+  }
+
   // Detail endpoints
   async getMovieDetails(tmdbId: number): Promise<MovieDetailsResponse> {
     return this.request<MovieDetailsResponse>(`/details/movie/${tmdbId}`);
@@ -181,124 +254,42 @@ class StreamyAPI {
     return this.request("/");
   }
 
-  // Helper methods for trending/popular content
+  // Helper methods for trending/popular content.
+  // Each rail is one batch request; the first result of each search is used for variety.
+  private async firstResults(
+    queries: BatchSearchQuery[]
+  ): Promise<SearchResult[]> {
+    const response = await this.batchSearch(queries);
+    return response.results.map((entry) => entry.results[0]).filter(Boolean);
+  }
+
   async getTrendingContent(): Promise<SearchResult[]> {
     try {
       // Search for different popular movies and shows, take first result from each
-      const [
-        inceptionResponse,
-        breakingBadResponse,
-        darkKnightResponse,
-        gameOfThronesResponse,
-        interstellarResponse,
-        strangerthingsResponse,
-      ] = await Promise.all([
-        this.searchMovies("inception"),
-        this.searchTvShows("breaking bad"),
-        this.searchMovies("the dark knight"),
-        this.searchTvShows("game of thrones"),
-        this.searchMovies("interstellar"),
-        this.searchTvShows("stranger things"),
+      return await this.firstResults([
+        { type: "movie", query: "inception" },
+        { type: "tv", query: "breaking bad" },
+        { type: "movie", query: "the dark knight" },
+        { type: "tv", query: "game of thrones" },
+        { type: "movie", query: "interstellar" },
+        { type: "tv", query: "stranger things" },
       ]);
-
-      // Take first result from each search for diversity
-      const results = [
-        inceptionResponse.results[0],
-        breakingBadResponse.results[0],
-        darkKnightResponse.results[0],
-        gameOfThronesResponse.results[0],
-        interstellarResponse.results[0],
-        strangerthingsResponse.results[0],
-      ].filter(Boolean);
-
-      return results;
     } catch (error) {
       console.error("Failed to get trending content:", error);
       return [];
     }
   }
 
-  async getFeaturedContent(): Promise<SearchResult[]> {
-    try {
-      // Get diverse featured content by searching specific popular movie/show titles
-      const [
-        inceptionResponse,
-        breakingBadResponse,
-        darkKnightResponse,
-        gameOfThronesResponse,
-        interstellarResponse,
-        strangerthingsResponse,
-        godfatherResponse,
-        theOfficeResponse,
-        pulpFictionResponse,
-        friendsResponse,
-        fightClubResponse,
-        theWireResponse,
-      ] = await Promise.all([
-        this.searchMovies("inception"),
-        this.searchTvShows("breaking bad"),
-        this.searchMovies("the dark knight"),
-        this.searchTvShows("game of thrones"),
-        this.searchMovies("interstellar"),
-        this.searchTvShows("stranger things"),
-        this.searchMovies("the godfather"),
-        this.searchTvShows("the office"),
-        this.searchMovies("pulp fiction"),
-        this.searchTvShows("friends"),
-        this.searchMovies("fight club"),
-        this.searchTvShows("the wire"),
-      ]);
-
-      // Take first result from each search for a diverse hero carousel
-      const results = [
-        inceptionResponse.results[0],
-        breakingBadResponse.results[0],
-        darkKnightResponse.results[0],
-        gameOfThronesResponse.results[0],
-        interstellarResponse.results[0],
-        strangerthingsResponse.results[0],
-        godfatherResponse.results[0],
-        theOfficeResponse.results[0],
-        pulpFictionResponse.results[0],
-        friendsResponse.results[0],
-        fightClubResponse.results[0],
-        theWireResponse.results[0],
-      ].filter(Boolean);
-
-      return results;
-    } catch (error) {
-      console.error("Failed to get featured content:", error);
-      return [];
-    }
-  }
-
   // Additional helper methods for specific content categories
   async getActionContent(): Promise<SearchResult[]> {
     try {
-      const [
-        johnWickResponse,
-        madMaxResponse,
-        dieHardResponse,
-        terminatorResponse,
-        matrixResponse,
-      ] = await Promise.all([
-        this.searchMovies("john wick"),
-        this.searchMovies("mad max fury road"),
-        this.searchMovies("die hard"),
-        this.searchMovies("terminator 2"),
-        this.searchMovies("the matrix"),
+      return await this.firstResults([
+        { type: "movie", query: "john wick" },
+        { type: "movie", query: "mad max fury road" },
+        { type: "movie", query: "die hard" },
+        { type: "movie", query: "terminator 2" },
+        { type: "movie", query: "the matrix" },
       ]);
-
-      // Take first result from each search for variety
-      const results = [
-        johnWickResponse.results[0],
-        madMaxResponse.results[0],
-        dieHardResponse.results[0],
-        terminatorResponse.results[0],
-        matrixResponse.results[0],
-      ].filter(Boolean);
-
-      return results;
     } catch (error) {
       console.error("Failed to get action content:", error);
       return [];
@@ -307,30 +298,13 @@ class StreamyAPI {
 
   async getComedyContent(): Promise<SearchResult[]> {
     try {
-      const [
-        officeResponse,
-        friendsResponse,
-        brooklynResponse,
-        parksResponse,
-        seinfeldResponse,
-      ] = await Promise.all([
-        this.searchTvShows("the office"),
-        this.searchTvShows("friends"),
-        this.searchTvShows("brooklyn nine nine"),
-        this.searchTvShows("parks and recreation"),
-        this.searchTvShows("seinfeld"),
+      return await this.firstResults([
+        { type: "tv", query: "the office" },
+        { type: "tv", query: "friends" },
+        { type: "tv", query: "brooklyn nine nine" },
+        { type: "tv", query: "parks and recreation" },
+        { type: "tv", query: "seinfeld" },
       ]);
-
-      // Take first result from each search for variety
-      const results = [
-        officeResponse.results[0],
-        friendsResponse.results[0],
-        brooklynResponse.results[0],
-        parksResponse.results[0],
-        seinfeldResponse.results[0],
-      ].filter(Boolean);
-
-      return results;
     } catch (error) {
       console.error("Failed to get comedy content:", error);
       return [];
@@ -339,30 +313,13 @@ class StreamyAPI {
 
   async getSciFiContent(): Promise<SearchResult[]> {
     try {
-      const [
-        bladeRunnerResponse,
-        interstellarResponse,
-        matrixResponse,
-        alienResponse,
-        starWarsResponse,
-      ] = await Promise.all([
-        this.searchMovies("blade runner 2049"),
-        this.searchMovies("interstellar"),
-        this.searchMovies("the matrix"),
-        this.searchMovies("alien"),
-        this.searchMovies("star wars"),
+      return await this.firstResults([
+        { type: "movie", query: "blade runner 2049" },
+        { type: "movie", query: "interstellar" },
+        { type: "movie", query: "the matrix" },
+        { type: "movie", query: "alien" },
+        { type: "movie", query: "star wars" },
       ]);
-
-      // Take first result from each search for variety
-      const results = [
-        bladeRunnerResponse.results[0],
-        interstellarResponse.results[0],
-        matrixResponse.results[0],
-        alienResponse.results[0],
-        starWarsResponse.results[0],
-      ].filter(Boolean);
-
-      return results;
     } catch (error) {
       console.error("Failed to get sci-fi content:", error);
       return [];
@@ -371,30 +328,13 @@ class StreamyAPI {
 
   async getDramaContent(): Promise<SearchResult[]> {
     try {
-      const [
-        godfatherResponse,
-        shawshankResponse,
-        breakingBadResponse,
-        sopranosResponse,
-        goodfellasResponse,
-      ] = await Promise.all([
-        this.searchMovies("the godfather"),
-        this.searchMovies("the shawshank redemption"),
-        this.searchTvShows("breaking bad"),
-        this.searchTvShows("the sopranos"),
-        this.searchMovies("goodfellas"),
+      return await this.firstResults([
+        { type: "movie", query: "the godfather" },
+        { type: "movie", query: "the shawshank redemption" },
+        { type: "tv", query: "breaking bad" },
+        { type: "tv", query: "the sopranos" },
+        { type: "movie", query: "goodfellas" },
       ]);
-
-      // Take first result from each search for variety
-      const results = [
-        godfatherResponse.results[0],
-        shawshankResponse.results[0],
-        breakingBadResponse.results[0],
-        sopranosResponse.results[0],
-        goodfellasResponse.results[0],
-      ].filter(Boolean);
-
-      return results;
     } catch (error) {
       console.error("Failed to get drama content:", error);
       return [];